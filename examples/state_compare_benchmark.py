@@ -0,0 +1,26 @@
+from openhab.helper import Item, _StateComparator
+from datetime import datetime
+
+from org.openhab.core.library.types import DecimalType, QuantityType, StringType, OnOffType, DateTimeType
+
+import time
+
+# Compares the typed change detection of postUpdateIfDifferent / sendCommandIfDifferent with the string based comparison
+
+def benchmark(func, current_state, new_state, loops = 10000):
+    start_time = time.perf_counter()
+    for i in range(loops):
+        func(current_state, new_state)
+    return ( time.perf_counter() - start_time ) * 1000
+
+now = datetime.now().astimezone().replace(microsecond=0)
+for current_state, new_state in [
+    (DecimalType(1.5), 1.5),
+    (QuantityType("21.5 °C"), 21.5),
+    (StringType("test"), "test"),
+    (OnOffType.ON, "ON"),
+    (DateTimeType(now), now)
+]:
+    typed = benchmark(Item._checkIfDifferent, current_state, new_state)
+    fallback = benchmark(_StateComparator.compareFallback, current_state, new_state)
+    print("{:<14} typed {:7.1f} ms, string based {:7.1f} ms, speedup {:4.1f}x".format(current_state.getClass().getSimpleName(), typed, fallback, fallback / typed))
@@ -0,0 +1,26 @@
+from openhab.triggers import when, _ParseCache
+
+import time
+
+# Compares cached and uncached parsing of @when DSL strings
+
+targets = [
+    "Item Test_String_1 changed from 'old test string' to 'new test string'",
+    "Member of gTest_Contact_Sensors changed from ON to OFF",
+    "Item Test_Switch_2 received command OFF",
+    "Thing hue:device:default:lamp1 changed from ONLINE to OFFLINE",
+    "Time cron 55 55 5 * * ?",
+    "Item updated"
+]
+
+def benchmark(clear, loops = 500):
+    start_time = time.perf_counter()
+    for i in range(loops):
+        if clear:
+            _ParseCache.clear()
+        when.compile(targets)
+    return ( time.perf_counter() - start_time ) * 1000
+
+uncached = benchmark(True)
+cached = benchmark(False)
+print("uncached {:7.1f} ms, cached {:7.1f} ms, speedup {:4.1f}x, {}".format(uncached, cached, uncached / cached, _ParseCache.getStats()))
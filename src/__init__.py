@@ -1,3 +1,3 @@
 __version__ = "1.0.20" # version string is for backward compatibility with openhab 5.0.0
 
-from openhab.helper import rule, logger, Registry
+from openhab.helper import rule, logger, Registry, Metadata, Persistence, RuleExecutor, RuleMetrics, RuleProfiler, RuleWatchdog, CircuitBreaker
@@ -7,6 +7,8 @@ def __import_wrapper__():
     import types
     import sys
     import traceback
+    import time
+    import threading
 
     # **************** CATCH and PREPARE GRAAL EXCEPTIONS *********************
     def formatTraceback(excvalue):
@@ -21,7 +23,7 @@ def __import_wrapper__():
 
         _tb_r = []
         for _tb in traceback.extract_tb(excvalue.__traceback__):
-            if _tb.name == "importWrapper": # hide wrapped import logic to keep focus on original import statement
+            if _tb.name in ("importTimer", "importWrapper"): # hide wrapped import logic to keep focus on original import statement
                 break
             _tb_r.append(_tb)
 
@@ -60,6 +62,31 @@ def __import_wrapper__():
 
     importOrg = builtins.__import__
     importProxy = getImportProxy()
+
+    # time spent in top level imports while the script is loaded, used by the script load report
+    builtins.__import_duration__ = 0.0
+    # only imports of the loading thread are measured, so the depth counter is not shared with other threads
+    importThread = threading.get_ident()
+    importDepth = [0]
+
+    def importTimer(name, globals=None, locals=None, fromlist=(), level=0):
+        if threading.get_ident() != importThread:
+            return importWrapper(name, globals, locals, fromlist, level)
+        importDepth[0] += 1
+        startTime = time.perf_counter() if importDepth[0] == 1 else None
+        try:
+            return importWrapper(name, globals, locals, fromlist, level)
+        finally:
+            importDepth[0] -= 1
+            if startTime is not None:
+                builtins.__import_duration__ += time.perf_counter() - startTime
+
+    def stopImportTimer():
+        # later imports, e.g. inside of rules, are not measured anymore
+        if builtins.__import__ is importTimer:
+            builtins.__import__ = importWrapper
+    builtins.__stopImportTimer__ = stopImportTimer
+
     def importWrapper(name, globals=None, locals=None, fromlist=(), level=0):
         modules = None
         if name.startswith("org.openhab"):
@@ -79,6 +106,6 @@ def __import_wrapper__():
             raise ModuleNotFoundError("No module named '{}{}'".format(name, '.' + '|'.join(fromlist) if fromlist else ""))
 
         return importOrg(name, globals, locals, fromlist, level)
-    builtins.__import__ = importWrapper
+    builtins.__import__ = importTimer
     # **************************************************************************
 __import_wrapper__()
@@ -1,40 +1,56 @@
 import builtins
-from typing import TYPE_CHECKING, Callable, Union, Any
+from typing import TYPE_CHECKING, Callable, Union, Any, Iterator
 
 from polyglot import ForeignNone, interop_type
 
 import java
 import hashlib
+import uuid
 import re
 import os
 import time
+import math
+import threading
+import random
+import sys
 import profile, pstats, io
+import struct
+import traceback
+from array import array
+from collections import deque, OrderedDict
+from queue import Queue, Full as QueueFull
 from inspect import isfunction, isclass
 from datetime import datetime, timezone, timedelta
 
 from openhab.jsr223 import TopCallStackFrame
 from openhab.services import getService
-from openhab.triggers import BaseTrigger, BaseCondition
+from openhab.triggers import BaseTrigger, BaseCondition, PythonCondition, when, onlyif
 
+from org.openhab.core import OpenHAB
 from org.openhab.core.config.core import Configuration
+from org.openhab.core.events import EventSubscriber as Java_EventSubscriber
+from org.openhab.core.common.registry import RegistryChangeListener as Java_RegistryChangeListener
 
 from org.openhab.core.thing import ChannelUID as Java_ChannelUID, ThingUID as Java_ThingUID, Channel as Java_Channel, Thing as Java_Thing
 from org.openhab.core.thing.link import ItemChannelLink as Java_ItemChannelLink
 from org.openhab.core.automation.module.script.rulesupport.shared.simple import SimpleRule as Java_SimpleRule
+from org.openhab.core.automation.util import TriggerBuilder as Java_TriggerBuilder, ConditionBuilder as Java_ConditionBuilder
 from org.openhab.core.persistence.extensions import PersistenceExtensions as Java_PersistenceExtensions
+from org.openhab.core.persistence import FilterCriteria as Java_FilterCriteria, QueryablePersistenceService as Java_QueryablePersistenceService
 from org.openhab.core.model.script.actions import Semantics as Java_Semantics
 
 from org.openhab.core.items import Item as Java_Item, MetadataKey as Java_MetadataKey, Metadata as Java_Metadata, ItemNotFoundException as Java_ItemNotFoundException
 from org.openhab.core.types import PrimitiveType as Java_PrimitiveType, UnDefType as Java_UnDefType, State as Java_State
-from org.openhab.core.library.types import DecimalType as Java_DecimalType, UpDownType as Java_UpDownType, PercentType as Java_PercentType, DateTimeType as Java_DateTimeType
+from org.openhab.core.library.types import DecimalType as Java_DecimalType, UpDownType as Java_UpDownType, PercentType as Java_PercentType, DateTimeType as Java_DateTimeType, QuantityType as Java_QuantityType, OnOffType as Java_OnOffType
 
 from java.time import ZonedDateTime as Java_ZonedDateTime, Instant as Java_Instant
-from java.lang import Object as Java_Object
-from java.util import UUID
+from java.lang import Object as Java_Object, Thread as Java_Thread, Throwable as Java_Throwable
+from java.util import HashSet as Java_HashSet, HashMap as Java_HashMap
 
 from org.openhab.core.items import MetadataRegistry
 from org.openhab.core.items import ItemBuilderFactory
 from org.openhab.core.thing.link import ItemChannelLinkRegistry
+from org.openhab.core.persistence import PersistenceServiceRegistry
 
 from scope import RuleSupport, osgi
 import scope
@@ -43,18 +59,193 @@ import scope
 METADATA_REGISTRY = getService(MetadataRegistry)
 ITEM_BUILDER_FACTORY = getService(ItemBuilderFactory)
 ITEM_CHANNEL_LINK_REGISTRY = getService(ItemChannelLinkRegistry)
+PERSISTENCE_SERVICE_REGISTRY = getService(PersistenceServiceRegistry)
 
 def versiontuple(v: str) -> tuple[int, ...]:
     return tuple(map(lambda part: int(part) if part.isdigit() else 0, v.split(".")))
 BUNDLE_VERSION = versiontuple(".".join(osgi.bundleContext.getBundle().getVersion().toString().split(".")[:3]))
 
 # **** LOGGING ****
-class CustomLogger:
+class _LoggerFacade():
+    # enabled state of each level is cached and refreshed after 'refresh_interval' seconds
+    refresh_interval = 10.0
+
+    # '%' conversions without space flag, to not misinterpret text like "50% done"
+    PERCENT_PATTERN = re.compile(r"%[#0+\-]*\d*(?:\.\d+)?[hlL]?([diouxXeEfFgGcrsa%])")
+
+    _async_queue = None
+    _async_thread = None
+    _dispose_hook_registered = False
+
+    def __init__(self, logger):
+        self.logger = logger
+        self._levels = None
+        self._refresh_time = 0.0
+
+    def __getattr__(self, name: str):
+        return getattr(self.logger, name)
+
+    def isEnabled(self, level: str) -> bool:
+        now = time.monotonic()
+        if self._levels is None or now >= self._refresh_time:
+            logger = self.logger
+            self._levels = {
+                "trace": logger.isTraceEnabled(),
+                "debug": logger.isDebugEnabled(),
+                "info": logger.isInfoEnabled(),
+                "warn": logger.isWarnEnabled(),
+                "error": logger.isErrorEnabled()
+            }
+            self._refresh_time = now + _LoggerFacade.refresh_interval
+        return self._levels[level]
+
+    def trace(self, msg: Union[str, Callable], *args):
+        if self.isEnabled("trace"):
+            self._log("trace", msg, args)
+
+    def debug(self, msg: Union[str, Callable], *args):
+        if self.isEnabled("debug"):
+            self._log("debug", msg, args)
+
+    def info(self, msg: Union[str, Callable], *args):
+        if self.isEnabled("info"):
+            self._log("info", msg, args)
+
+    def warn(self, msg: Union[str, Callable], *args):
+        if self.isEnabled("warn"):
+            self._log("warn", msg, args)
+
+    warning = warn
+
+    def error(self, msg: Union[str, Callable], *args):
+        if self.isEnabled("error"):
+            self._log("error", msg, args)
+
+    def _log(self, level: str, msg: Union[str, Callable], args: tuple):
+        message, throwable = _LoggerFacade._format(msg, args)
+        queue = _LoggerFacade._async_queue
+        if queue is not None:
+            try:
+                queue.put_nowait((self.logger, level, message, throwable))
+                return
+            except QueueFull:
+                # fallback to a synchronous call, instead of dropping the message
+                pass
+        _LoggerFacade._write(self.logger, level, message, throwable)
+
+    @staticmethod
+    def _write(logger, level: str, message: str, throwable):
+        if throwable is None:
+            getattr(logger, level)(message)
+        else:
+            getattr(logger, level)(message, throwable)
+
+    @staticmethod
+    def _format(msg: Union[str, Callable], args: tuple) -> tuple[str, Any]:
+        # messages and arguments are only evaluated, if the level is enabled
+        if _LoggerFacade._isLazy(msg):
+            msg = msg()
+        msg = str(msg)
+        if not args:
+            return msg, None
+        args = tuple(arg() if _LoggerFacade._isLazy(arg) else arg for arg in args)
+
+        # '%' style is only used, if there is no '{}' and the number of conversions matches the arguments
+        conversions = 0
+        if "{}" not in msg and "%" in msg:
+            conversions = sum(1 for match in _LoggerFacade.PERCENT_PATTERN.finditer(msg) if match.group(1) != "%")
+        placeholders = msg.count("{}") if conversions == 0 else conversions
+
+        # like slf4j, a trailing exception without placeholder is logged with its stacktrace
+        exception = None
+        if _LoggerFacade._isException(args[-1]) and placeholders < len(args):
+            exception = args[-1]
+            args = args[:-1]
+
+        if conversions > 0 and conversions == len(args):
+            try:
+                msg = msg % args
+                args = ()
+            except (TypeError, ValueError):
+                pass
+
+        # slf4j style placeholders
+        parts = msg.split("{}")
+        message = parts[0]
+        for i, part in enumerate(parts[1:]):
+            message += ( str(args[i]) if i < len(args) else "{}" ) + part
+
+        if exception is None:
+            return message, None
+        if isinstance(exception, BaseException) and not java.instanceof(exception, Java_Throwable):
+            # python exceptions are not known by slf4j
+            return message + "\n" + builtins.__formatTraceback__(exception), None
+        return message, exception
+
+    @staticmethod
+    def _isLazy(value: Any) -> bool:
+        # python callables, like functions, bound methods or partials. Classes and java objects are logged as they are
+        if not callable(value) or isclass(value):
+            return False
+        try:
+            return not java.is_object(value) and not java.is_function(value)
+        except Exception:
+            return True
+
+    @staticmethod
+    def _isException(value: Any) -> bool:
+        if isinstance(value, BaseException):
+            return True
+        try:
+            return java.instanceof(value, Java_Throwable)
+        except Exception:
+            return False
+
+    @staticmethod
+    def setRefreshInterval(seconds: float):
+        _LoggerFacade.refresh_interval = seconds
+
+    @staticmethod
+    def enableAsync(max_queue_size: int = 10000):
+        if _LoggerFacade._async_queue is not None:
+            return
+        _LoggerFacade._async_queue = Queue(max_queue_size)
+        _LoggerFacade._async_thread = threading.Thread(target=_LoggerFacade._writeRecords, args=(_LoggerFacade._async_queue,), name="pythonscripting-logger", daemon=True)
+        _LoggerFacade._async_thread.start()
+        if not _LoggerFacade._dispose_hook_registered:
+            _LoggerFacade._dispose_hook_registered = True
+            scope.lifecycleTracker.addDisposeHook(_LoggerFacade.disableAsync)
+
+    @staticmethod
+    def disableAsync():
+        queue = _LoggerFacade._async_queue
+        if queue is None:
+            return
+        _LoggerFacade._async_queue = None
+        # remaining records are written before the thread ends
+        queue.put((None, None, None, None))
+        _LoggerFacade._async_thread.join()
+        _LoggerFacade._async_thread = None
+
+    @staticmethod
+    def _writeRecords(queue: Queue):
+        while True:
+            logger, level, message, throwable = queue.get()
+            if logger is None:
+                break
+            try:
+                _LoggerFacade._write(logger, level, message, throwable)
+            except Exception:
+                pass
+
+class CustomLogger(_LoggerFacade):
     Java_LogFactory = java.type("org.slf4j.LoggerFactory")
 
     def __init__(self):
         self.initialized = False
         self.log_prefix = "org.openhab.automation.pythonscripting"
+        self._levels = None
+        self._refresh_time = 0.0
 
     def __getattr__(self, name: str):
         if not self.initialized:
@@ -88,17 +279,1064 @@ class CustomLogger:
     def _buildRuleLogger(self, name):
         if not self.initialized:
             self._detect()
-        return CustomLogger.Java_LogFactory.getLogger( "{}.{}".format(self.log_prefix, name) )
+        return _LoggerFacade(CustomLogger.Java_LogFactory.getLogger( "{}.{}".format(self.log_prefix, name) ))
 logger = CustomLogger()
 # *****************************************************************
 
-__all__ = ["rule", "logger", "Registry"]
+__all__ = ["rule", "logger", "Registry", "Metadata", "Persistence", "RuleExecutor", "RuleMetrics", "RuleProfiler", "RuleWatchdog", "CircuitBreaker"]
+
+try:
+    import cProfile as _profile_module
+except ImportError:
+    _profile_module = profile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
 
 class NotFoundException(Exception):
     pass
 
+class _EventDispatcher():
+    _lock = threading.Lock()
+    _callbacks: dict[str, list[Callable]] = {}
+    _registration = None
+
+    @staticmethod
+    def subscribe(event_type: str, callback: Callable):
+        with _EventDispatcher._lock:
+            callbacks = _EventDispatcher._callbacks.get(event_type)
+            if callbacks is None:
+                _EventDispatcher._callbacks[event_type] = [callback]
+                # subscribed event types are only requested once by openHAB, so the subscriber must be registered again
+                _EventDispatcher._register()
+            elif callback not in callbacks:
+                callbacks.append(callback)
+
+    @staticmethod
+    def _register():
+        if _EventDispatcher._registration is None:
+            scope.lifecycleTracker.addDisposeHook(_EventDispatcher._unregister)
+        else:
+            _EventDispatcher._registration.unregister()
+
+        event_types = Java_HashSet()
+        for event_type in _EventDispatcher._callbacks.keys():
+            event_types.add(event_type)
+
+        class EventSubscriber(Java_EventSubscriber):
+            def getSubscribedEventTypes(self):
+                return event_types
+
+            def getEventFilter(self):
+                return None
+
+            def receive(self, event):
+                _EventDispatcher._dispatch(event)
+
+        _EventDispatcher._registration = osgi.bundleContext.registerService("org.openhab.core.events.EventSubscriber", EventSubscriber(), None)
+
+    @staticmethod
+    def _unregister():
+        with _EventDispatcher._lock:
+            if _EventDispatcher._registration is not None:
+                _EventDispatcher._registration.unregister()
+                _EventDispatcher._registration = None
+
+    @staticmethod
+    def _dispatch(event):
+        for callback in _EventDispatcher._callbacks.get(event.getType(), []):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error("Event callback failed: " + builtins.__formatTraceback__(e))
+
+class RuleExecutor():
+    _default: 'RuleExecutor | None' = None
+    # marks worker threads, which are owned by an executor
+    _thread_local = threading.local()
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 1000):
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+
+        self._condition = threading.Condition()
+        self._ready_keys = deque()
+        self._pending = {}
+        self._queue_size = 0
+        self._workers = []
+        self._idle_workers = 0
+        self._active_workers = 0
+        self._is_shutdown = False
+
+        self._submitted = 0
+        self._executed = 0
+        self._max_queue_size_seen = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @staticmethod
+    def getDefault() -> 'RuleExecutor':
+        # one pool per script, it is stopped together with the script
+        if RuleExecutor._default is None:
+            RuleExecutor._default = RuleExecutor()
+            scope.lifecycleTracker.addDisposeHook(RuleExecutor._default.shutdown)
+        return RuleExecutor._default
+
+    def submit(self, key: Any, func: Callable, *args):
+        with self._condition:
+            while self._queue_size >= self.max_queue_size and not self._is_shutdown:
+                self._condition.wait()
+            if self._is_shutdown:
+                raise RuntimeError("Executor is already shut down")
+
+            # a key is part of '_pending' as long as a worker is responsible for it. Tasks of the same key are executed one after another.
+            tasks = self._pending.get(key)
+            if tasks is None:
+                self._pending[key] = deque([(time.perf_counter(), func, args)])
+                self._ready_keys.append(key)
+            else:
+                tasks.append((time.perf_counter(), func, args))
+
+            self._queue_size += 1
+            self._submitted += 1
+            if self._queue_size > self._max_queue_size_seen:
+                self._max_queue_size_seen = self._queue_size
+
+            if self._idle_workers == 0 and len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name="RuleExecutor-{}".format(len(self._workers)), daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._condition.notify_all()
+
+    @staticmethod
+    def _isWorkerThread() -> bool:
+        return getattr(RuleExecutor._thread_local, "is_worker", False)
+
+    def _work(self):
+        RuleExecutor._thread_local.is_worker = True
+        while True:
+            with self._condition:
+                self._idle_workers += 1
+                while len(self._ready_keys) == 0 and not self._is_shutdown:
+                    self._condition.wait()
+                self._idle_workers -= 1
+                if self._is_shutdown:
+                    return
+
+                key = self._ready_keys.popleft()
+                enqueue_time, func, args = self._pending[key].popleft()
+                self._queue_size -= 1
+                self._active_workers += 1
+
+                wait_time = time.perf_counter() - enqueue_time
+                self._total_wait_time += wait_time
+                if wait_time > self._max_wait_time:
+                    self._max_wait_time = wait_time
+                self._condition.notify_all()
+
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("Rule executor task failed: " + builtins.__formatTraceback__(e))
+
+            with self._condition:
+                self._active_workers -= 1
+                self._executed += 1
+                # after a shutdown, '_pending' is already cleared
+                tasks = self._pending.get(key)
+                if tasks is None:
+                    continue
+                if len(tasks) > 0:
+                    self._ready_keys.append(key)
+                    self._condition.notify_all()
+                else:
+                    del self._pending[key]
+
+    def getStats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "workers": len(self._workers),
+                "active_workers": self._active_workers,
+                "queue_size": self._queue_size,
+                "max_queue_size_seen": self._max_queue_size_seen,
+                "submitted": self._submitted,
+                "executed": self._executed,
+                "avg_wait_time": ( self._total_wait_time / self._executed * 1000 ) if self._executed > 0 else 0.0,
+                "max_wait_time": self._max_wait_time * 1000
+            }
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shutdown = True
+            self._ready_keys.clear()
+            self._pending.clear()
+            self._queue_size = 0
+            self._condition.notify_all()
+
+class _RuleMetricsEntry():
+    def __init__(self, window_size: int):
+        self.count = 0
+        self.errors = 0
+        self.rejected = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.durations = deque(maxlen=window_size)
+
+    def add(self, duration: float, failed: bool):
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        self.durations.append(duration)
+
+    def getStats(self) -> dict[str, Any]:
+        durations = sorted(self.durations)
+        def percentile(p):
+            if len(durations) == 0:
+                return 0.0
+            return durations[min(len(durations) - 1, int(round(p * (len(durations) - 1))))] * 1000
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count > 0 else 0.0,
+            "rejected": self.rejected,
+            "avg": self.total_duration / self.count * 1000 if self.count > 0 else 0.0,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": self.max_duration * 1000
+        }
+
+class RuleMetrics():
+    window_size = 1000
+    # per event statistics are limited, e.g. for 'Member of' rules of large groups
+    max_events = 100
+    event_window_size = 100
+
+    _lock = threading.Lock()
+    _rules: dict[str, _RuleMetricsEntry] = {}
+    _events: dict[str, dict[str, _RuleMetricsEntry]] = {}
+
+    _export_lock = threading.Lock()
+    _export_timer: threading.Timer | None = None
+    _export_generation = 0
+    _export_dispose_hook = False
+
+    @staticmethod
+    def _getEntries(rule_name: str, event_info: tuple[str, str] | None) -> tuple[_RuleMetricsEntry, _RuleMetricsEntry | None]:
+        entry = RuleMetrics._rules.get(rule_name)
+        if entry is None:
+            entry = RuleMetrics._rules[rule_name] = _RuleMetricsEntry(RuleMetrics.window_size)
+            RuleMetrics._events[rule_name] = {}
+        if event_info is None:
+            return entry, None
+
+        event_key = "{}: {}".format(*event_info)
+        events = RuleMetrics._events[rule_name]
+        event_entry = events.get(event_key)
+        if event_entry is None:
+            if len(events) >= RuleMetrics.max_events:
+                return entry, None
+            event_entry = events[event_key] = _RuleMetricsEntry(RuleMetrics.event_window_size)
+        return entry, event_entry
+
+    @staticmethod
+    def record(rule_name: str, event_info: tuple[str, str] | None, duration: float, failed: bool = False):
+        with RuleMetrics._lock:
+            entry, event_entry = RuleMetrics._getEntries(rule_name, event_info)
+            entry.add(duration, failed)
+            if event_entry is not None:
+                event_entry.add(duration, failed)
+
+    @staticmethod
+    def recordRejected(rule_name: str, event_info: tuple[str, str] | None):
+        with RuleMetrics._lock:
+            entry, event_entry = RuleMetrics._getEntries(rule_name, event_info)
+            entry.rejected += 1
+            if event_entry is not None:
+                event_entry.rejected += 1
+
+    @staticmethod
+    def getStats(rule_name: str | None = None) -> dict[str, dict[str, Any]]:
+        with RuleMetrics._lock:
+            return {name: entry.getStats() for name, entry in RuleMetrics._rules.items() if rule_name is None or name == rule_name}
+
+    @staticmethod
+    def getEventStats(rule_name: str) -> dict[str, dict[str, Any]]:
+        with RuleMetrics._lock:
+            return {event_key: entry.getStats() for event_key, entry in RuleMetrics._events.get(rule_name, {}).items()}
+
+    @staticmethod
+    def reset():
+        with RuleMetrics._lock:
+            RuleMetrics._rules = {}
+            RuleMetrics._events = {}
+
+    @staticmethod
+    def startExport(interval: float = 60, item_prefix: str | None = None, log: bool = True):
+        with RuleMetrics._export_lock:
+            RuleMetrics._cancelExport()
+            if not RuleMetrics._export_dispose_hook:
+                scope.lifecycleTracker.addDisposeHook(RuleMetrics.stopExport)
+                RuleMetrics._export_dispose_hook = True
+            RuleMetrics._scheduleExport(RuleMetrics._export_generation, interval, item_prefix, log)
+
+    @staticmethod
+    def stopExport():
+        with RuleMetrics._export_lock:
+            RuleMetrics._cancelExport()
+
+    @staticmethod
+    def _cancelExport():
+        # a running export, which belongs to a previous generation, is not scheduled again
+        RuleMetrics._export_generation += 1
+        if RuleMetrics._export_timer is not None:
+            RuleMetrics._export_timer.cancel()
+            RuleMetrics._export_timer = None
+
+    @staticmethod
+    def _scheduleExport(generation: int, interval: float, item_prefix: str | None, log: bool):
+        def export():
+            try:
+                RuleMetrics._export(item_prefix, log)
+            except Exception as e:
+                logger.error("Rule metrics export failed: " + builtins.__formatTraceback__(e))
+            with RuleMetrics._export_lock:
+                if generation == RuleMetrics._export_generation:
+                    RuleMetrics._scheduleExport(generation, interval, item_prefix, log)
+        RuleMetrics._export_timer = threading.Timer(interval, export)
+        RuleMetrics._export_timer.daemon = True
+        RuleMetrics._export_timer.start()
+
+    @staticmethod
+    def _export(item_prefix: str | None, log: bool):
+        for rule_name, stats in RuleMetrics.getStats().items():
+            if log:
+                logger.info("Rule metrics '{}': count={}, errors={}, avg={:.1f} ms, p50={:.1f} ms, p95={:.1f} ms, p99={:.1f} ms, max={:.1f} ms".format(
+                    rule_name, stats['count'], stats['errors'], stats['avg'], stats['p50'], stats['p95'], stats['p99'], stats['max']
+                ))
+            if item_prefix is not None:
+                safe_name = Item.buildSafeName(rule_name)
+                for field in ["count", "errors", "p50", "p95", "p99"]:
+                    item = scope.itemRegistry.get("{}{}_{}".format(item_prefix, safe_name, field))
+                    if item is not None:
+                        item.postUpdateIfDifferent(stats[field])
+
+class CircuitBreaker():
+    def __init__(self, failures: int = 5, backoff: float = 60, max_backoff: float = 3600):
+        if failures < 1:
+            raise ValueError("failures must be greater than 0")
+        self.failures = failures
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._states = {}
+
+    def _getState(self, rule_name: str) -> dict[str, Any]:
+        state = self._states.get(rule_name)
+        if state is None:
+            state = self._states[rule_name] = {"state": "closed", "consecutive_failures": 0, "backoff": self.backoff, "open_until": 0.0, "trial_running": False, "tripped": False, "opened": 0, "skipped": 0}
+        return state
+
+    def allow(self, rule_name: str) -> bool:
+        with self._lock:
+            state = self._getState(rule_name)
+            if state["state"] == "closed":
+                return True
+            if state["state"] == "open" and time.monotonic() >= state["open_until"]:
+                state["state"] = "half_open"
+            # after the back-off period, one trial execution decides if the circuit is closed again
+            if state["state"] == "half_open" and not state["trial_running"]:
+                state["trial_running"] = True
+                return True
+            state["skipped"] += 1
+            return False
+
+    def record(self, rule_name: str, success: bool):
+        with self._lock:
+            state = self._getState(rule_name)
+            previous_state = state["state"]
+            # the circuit was already opened by trip(), while this execution was running
+            tripped = state["tripped"]
+            state["tripped"] = False
+            if success:
+                state.update(state="closed", consecutive_failures=0, backoff=self.backoff, trial_running=False)
+            else:
+                state["consecutive_failures"] += 1
+                if tripped:
+                    pass
+                elif previous_state == "half_open" or state["consecutive_failures"] >= self.failures:
+                    if previous_state == "half_open":
+                        state["backoff"] = min(state["backoff"] * 2, self.max_backoff)
+                    state.update(state="open", open_until=time.monotonic() + state["backoff"], trial_running=False)
+                    if previous_state != "open":
+                        state["opened"] += 1
+            new_state = state["state"]
+            backoff = state["backoff"]
+
+        if new_state == "open" and previous_state != "open":
+            logger.warn("Rule '{}' is skipped for {:.1f} s, because of repeated failures or time budget violations".format(rule_name, backoff))
+        elif new_state == "closed" and previous_state != "closed":
+            logger.info("Rule '{}' is executed again".format(rule_name))
+
+    def trip(self, rule_name: str):
+        # opens the circuit while the violating execution is still running
+        with self._lock:
+            state = self._getState(rule_name)
+            if state["state"] == "open":
+                return
+            # like a failed trial, a violation during the half open state doubles the back-off time
+            if state["state"] == "half_open":
+                state["backoff"] = min(state["backoff"] * 2, self.max_backoff)
+            state.update(state="open", open_until=time.monotonic() + state["backoff"], trial_running=False, tripped=True)
+            state["opened"] += 1
+            backoff = state["backoff"]
+        logger.warn("Rule '{}' is skipped for {:.1f} s, because it exceeds its hard time budget".format(rule_name, backoff))
+
+    def release(self, rule_name: str):
+        # an allowed execution, which was not started, e.g. because the executor is already shut down
+        with self._lock:
+            state = self._getState(rule_name)
+            state["trial_running"] = False
+
+    def getState(self, rule_name: str) -> dict[str, Any]:
+        with self._lock:
+            state = dict(self._getState(rule_name))
+        open_until = state.pop("open_until")
+        state["remaining_backoff"] = max(0.0, open_until - time.monotonic()) if state["state"] == "open" else 0.0
+        del state["trial_running"]
+        del state["tripped"]
+        return state
+
+    def reset(self, rule_name: str | None = None):
+        with self._lock:
+            if rule_name is None:
+                self._states = {}
+            else:
+                self._states.pop(rule_name, None)
+
+class _WatchedExecution():
+    def __init__(self, rule_name: str, soft_timeout: float | None, hard_timeout: float | None):
+        self.rule_name = rule_name
+        self.soft_timeout = soft_timeout
+        self.hard_timeout = hard_timeout
+        self.start_time = time.monotonic()
+        self.thread_id = threading.get_ident()
+        self.java_thread = Java_Thread.currentThread()
+        # only executor threads can be interrupted, rule engine threads are shared with other jobs
+        self.interruptible = RuleExecutor._isWorkerThread()
+        self.overrun = False
+        self.timed_out = False
+        self.interrupted = False
+
+class RuleWatchdog():
+    check_interval = 0.1
+
+    _lock = threading.Lock()
+    _running: dict[int, _WatchedExecution] = {}
+    _thread: threading.Thread | None = None
+    _dispose_hook = False
+    _stats: dict[str, dict[str, Any]] = {}
+    _breakers: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def _start(rule_name: str, soft_timeout: float | None, hard_timeout: float | None) -> _WatchedExecution:
+        execution = _WatchedExecution(rule_name, soft_timeout, hard_timeout)
+        with RuleWatchdog._lock:
+            RuleWatchdog._running[id(execution)] = execution
+            if not RuleWatchdog._dispose_hook:
+                scope.lifecycleTracker.addDisposeHook(RuleWatchdog._dispose)
+                RuleWatchdog._dispose_hook = True
+            # the watchdog thread ends, if there is nothing to watch
+            if RuleWatchdog._thread is None:
+                RuleWatchdog._thread = threading.Thread(target=RuleWatchdog._monitor, name="pythonscripting-watchdog", daemon=True)
+                RuleWatchdog._thread.start()
+        return execution
+
+    @staticmethod
+    def _stop(execution: _WatchedExecution) -> bool:
+        with RuleWatchdog._lock:
+            RuleWatchdog._running.pop(id(execution), None)
+        if execution.interrupted:
+            # clear the interrupt flag, to not affect the next job of this thread
+            Java_Thread.interrupted()
+
+        # a budget violation between two checks of the watchdog
+        if execution.soft_timeout is not None and not execution.overrun and time.monotonic() - execution.start_time > execution.soft_timeout:
+            execution.overrun = True
+            RuleWatchdog._count(execution.rule_name, "overruns")
+        return execution.overrun or execution.timed_out
+
+    @staticmethod
+    def _dispose():
+        # executions, which are still running on script unload, are not watched anymore
+        with RuleWatchdog._lock:
+            RuleWatchdog._running.clear()
+            thread = RuleWatchdog._thread
+        if thread is not None:
+            thread.join(RuleWatchdog.check_interval * 10)
+
+    @staticmethod
+    def _count(rule_name: str, field: str, stack: str | None = None):
+        with RuleWatchdog._lock:
+            stats = RuleWatchdog._stats.get(rule_name)
+            if stats is None:
+                stats = RuleWatchdog._stats[rule_name] = {"overruns": 0, "timeouts": 0, "last_stack": None}
+            stats[field] += 1
+            if stack is not None:
+                stats["last_stack"] = stack
+
+    @staticmethod
+    def _captureStack(execution: _WatchedExecution) -> str:
+        try:
+            frame = sys._current_frames().get(execution.thread_id)
+            if frame is not None:
+                return "".join(traceback.format_stack(frame))
+        except Exception:
+            pass
+        return "\n".join(str(element) for element in execution.java_thread.getStackTrace())
+
+    @staticmethod
+    def _monitor():
+        while True:
+            time.sleep(RuleWatchdog.check_interval)
+            with RuleWatchdog._lock:
+                if len(RuleWatchdog._running) == 0:
+                    RuleWatchdog._thread = None
+                    return
+                executions = list(RuleWatchdog._running.values())
+
+            now = time.monotonic()
+            for execution in executions:
+                elapsed = now - execution.start_time
+                if execution.soft_timeout is not None and not execution.overrun and elapsed > execution.soft_timeout:
+                    execution.overrun = True
+                    stack = RuleWatchdog._captureStack(execution)
+                    RuleWatchdog._count(execution.rule_name, "overruns", stack)
+                    logger.warn("Rule '{}' exceeds its time budget of {:.1f} s. Current stack:\n{}".format(execution.rule_name, execution.soft_timeout, stack))
+
+                if execution.hard_timeout is not None and not execution.timed_out and elapsed > execution.hard_timeout:
+                    stack = RuleWatchdog._captureStack(execution)
+                    with RuleWatchdog._lock:
+                        if id(execution) not in RuleWatchdog._running:
+                            continue
+                        execution.timed_out = True
+                        if execution.interruptible:
+                            execution.interrupted = True
+                            execution.java_thread.interrupt()
+                        breaker = RuleWatchdog._breakers.get(execution.rule_name)
+                    RuleWatchdog._count(execution.rule_name, "timeouts", stack)
+                    if execution.interrupted:
+                        logger.error("Rule '{}' exceeds its hard time budget of {:.1f} s and is interrupted. Current stack:\n{}".format(execution.rule_name, execution.hard_timeout, stack))
+                    else:
+                        logger.error("Rule '{}' exceeds its hard time budget of {:.1f} s. Current stack:\n{}".format(execution.rule_name, execution.hard_timeout, stack))
+                    if breaker is not None:
+                        breaker.trip(execution.rule_name)
+
+    @staticmethod
+    def getState(rule_name: str | None = None) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        with RuleWatchdog._lock:
+            rule_names = set(RuleWatchdog._stats.keys()) | set(RuleWatchdog._breakers.keys()) | set(execution.rule_name for execution in RuleWatchdog._running.values())
+            result = {}
+            for name in rule_names:
+                if rule_name is not None and name != rule_name:
+                    continue
+                stats = RuleWatchdog._stats.get(name, {"overruns": 0, "timeouts": 0, "last_stack": None})
+                result[name] = dict(stats)
+                result[name]["running"] = [now - execution.start_time for execution in RuleWatchdog._running.values() if execution.rule_name == name]
+            breakers = {name: breaker for name, breaker in RuleWatchdog._breakers.items() if name in result}
+        for name, breaker in breakers.items():
+            result[name]["circuit"] = breaker.getState(name)
+        return result
+
+    @staticmethod
+    def reset(rule_name: str | None = None):
+        with RuleWatchdog._lock:
+            if rule_name is None:
+                RuleWatchdog._stats = {}
+            else:
+                RuleWatchdog._stats.pop(rule_name, None)
+            breakers = [(name, breaker) for name, breaker in RuleWatchdog._breakers.items() if rule_name is None or name == rule_name]
+        for name, breaker in breakers:
+            breaker.reset(name)
+
+class _StackCollector():
+    def __init__(self):
+        self.stacks = {}
+
+    def run(self, func: Callable, *args):
+        stack = []
+        stacks = self.stacks
+        perf_counter = time.perf_counter
+
+        def tracer(frame, event, arg):
+            if event == 'call':
+                code = frame.f_code
+                stack.append(["{}:{}".format(os.path.basename(code.co_filename), code.co_name), perf_counter(), 0.0])
+            elif event == 'c_call':
+                stack.append([getattr(arg, '__qualname__', getattr(arg, '__name__', str(arg))), perf_counter(), 0.0])
+            elif len(stack) > 0: # return, c_return, c_exception
+                path = ";".join(entry[0] for entry in stack)
+                _, start, child_time = stack.pop()
+                elapsed = perf_counter() - start
+                stacks[path] = stacks.get(path, 0.0) + elapsed - child_time
+                if len(stack) > 0:
+                    stack[-1][2] += elapsed
+
+        sys.setprofile(tracer)
+        try:
+            return func(*args)
+        finally:
+            sys.setprofile(None)
+
+    def merge(self, other: '_StackCollector'):
+        for path, duration in other.stacks.items():
+            self.stacks[path] = self.stacks.get(path, 0.0) + duration
+
+class RuleProfiler():
+    def __init__(self, sample_rate: float = 0.1, format: str = "pstats", output_dir: str | None = None, interval: float | None = None):
+        if sample_rate <= 0 or sample_rate > 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if format not in ["pstats", "collapsed"]:
+            raise ValueError("Unsupported profiler format '{}'".format(format))
+
+        self.sample_rate = sample_rate
+        self.format = format
+        self.output_dir = os.path.join(OpenHAB.getUserDataFolder(), "profiles") if output_dir is None else output_dir
+
+        self._lock = threading.Lock()
+        self._results = {}
+        self._samples = {}
+
+        self._dump_lock = threading.Lock()
+        self._dump_timer = None
+        self._dump_interval = interval
+        if interval is not None:
+            scope.lifecycleTracker.addDisposeHook(self.stop)
+            self._scheduleDump()
+
+    def run(self, rule_name: str, func: Callable, *args):
+        if random.random() >= self.sample_rate:
+            return func(*args)
+
+        if self.format == "pstats":
+            collector = _profile_module.Profile()
+            try:
+                return collector.runcall(func, *args)
+            finally:
+                with self._lock:
+                    if rule_name in self._results:
+                        self._results[rule_name].add(collector)
+                    else:
+                        self._results[rule_name] = pstats.Stats(collector)
+                    self._samples[rule_name] = self._samples.get(rule_name, 0) + 1
+        else:
+            collector = _StackCollector()
+            try:
+                return collector.run(func, *args)
+            finally:
+                with self._lock:
+                    if rule_name in self._results:
+                        self._results[rule_name].merge(collector)
+                    else:
+                        self._results[rule_name] = collector
+                    self._samples[rule_name] = self._samples.get(rule_name, 0) + 1
+
+    def getSamples(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._samples)
+
+    def getReport(self, rule_name: str, limit: int = 30) -> str:
+        with self._lock:
+            result = self._results.get(rule_name)
+            if result is None:
+                raise NotFoundException("No profile for rule {} available".format(rule_name))
+            s = io.StringIO()
+            if self.format == "pstats":
+                result.stream = s
+                result.sort_stats('cumulative').print_stats(limit)
+            else:
+                for path, duration in sorted(result.stacks.items(), key=lambda entry: entry[1], reverse=True)[:limit]:
+                    s.write("{} {}\n".format(path, int(duration * 1000000)))
+            return s.getvalue()
+
+    def dump(self, output_dir: str | None = None) -> list[str]:
+        output_dir = self.output_dir if output_dir is None else output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        files = []
+        with self._lock:
+            for rule_name, result in self._results.items():
+                path = os.path.join(output_dir, "{}.{}".format(Item.buildSafeName(rule_name), self.format))
+                if self.format == "pstats":
+                    result.dump_stats(path)
+                else:
+                    # collapsed stack format, self time in microseconds, usable by flamegraph tools
+                    with open(path, "w") as f:
+                        for stack_path, duration in result.stacks.items():
+                            f.write("{} {}\n".format(stack_path, int(duration * 1000000)))
+                files.append(path)
+        return files
+
+    def reset(self):
+        with self._lock:
+            self._results = {}
+            self._samples = {}
+
+    def stop(self):
+        with self._dump_lock:
+            self._dump_interval = None
+            if self._dump_timer is not None:
+                self._dump_timer.cancel()
+                self._dump_timer = None
+
+    def _scheduleDump(self):
+        def dump():
+            try:
+                self.dump()
+            except Exception as e:
+                logger.error("Profiler dump failed: " + builtins.__formatTraceback__(e))
+            self._scheduleDump()
+        with self._dump_lock:
+            # a dump, which is running during stop(), is not scheduled again
+            if self._dump_interval is None:
+                return
+            self._dump_timer = threading.Timer(self._dump_interval, dump)
+            self._dump_timer.daemon = True
+            self._dump_timer.start()
+
+class _ScriptContext():
+    # values, which are the same for all rules of a script, are calculated only once
+    UID_PATTERN = re.compile(r"\W")
+
+    _script_hash = None
+
+    @staticmethod
+    def getFilename() -> str | None:
+        return logger._getFilename()
+
+    @staticmethod
+    def getNamePrefix() -> str:
+        return logger._getNamePrefix()
+
+    @staticmethod
+    def getScriptHash() -> str:
+        # based on the filename or, for UI and console scripts, on the rule uid and a random salt.
+        # Without a file, a script can run again while its previous rules are still registered, which would otherwise lead to duplicate uids
+        if _ScriptContext._script_hash is None:
+            source = _ScriptContext.getFilename() if _ScriptContext.getFilename() else "{}:{}".format(_ScriptContext.getNamePrefix(), uuid.uuid4().hex)
+            _ScriptContext._script_hash = hashlib.md5(source.encode('utf-8')).hexdigest()
+        return _ScriptContext._script_hash
+
+class _ModuleIds():
+    # trigger and condition ids, which are derived from their content, stay the same after a script reload
+    @staticmethod
+    def assign(modules: list[tuple[Any, bool]], builder, used_ids: set) -> list:
+        # 'modules' contains (module, generated_id) pairs. 'used_ids' is shared by all triggers and conditions of a rule
+        result = []
+        for module, generated_id in modules:
+            module_id = module.getId()
+            if generated_id:
+                module_id = "{}_{}".format(module.getTypeUID().split(".")[-1], _ModuleIds.hash(module)[:12])
+            unique_id = module_id
+            index = 1
+            while unique_id in used_ids:
+                index += 1
+                unique_id = "{}_{}".format(module_id, index)
+            used_ids.add(unique_id)
+            result.append(module if unique_id == module.getId() else builder.create(module).withId(unique_id).build())
+        return result
+
+    @staticmethod
+    def describe(module) -> str:
+        configuration = module.getConfiguration()
+        properties = ",".join("{}={}".format(key, configuration.get(key)) for key in sorted(str(key) for key in configuration.keySet()))
+        return "{}[{}]".format(module.getTypeUID(), properties)
+
+    @staticmethod
+    def hash(module) -> str:
+        return hashlib.md5(_ModuleIds.describe(module).encode('utf-8')).hexdigest()
+
+# dummy helper to avoid "org.graalvm.polyglot.PolyglotException: java.lang.IllegalStateException: unknown type com.oracle.truffle.host.HostObject"
+# one shared subclass for all rules, the uid and handler are set per instance
+class _SimpleRule(Java_SimpleRule):
+    _rule_uid = None
+    _handler = None
+
+    def getUID(self):
+        return self._rule_uid
+
+    def execute(self, module, input):
+        self._handler(module, input)
+
+class _RuleRegistration():
+    # fallback, if the end of the script's top level code is not detected
+    load_timeout = 5.0
+
+    _lock = threading.RLock()
+    _batch_depth = 0
+    # start index in '_pending' of each open batch
+    _batch_starts: list[int] = []
+    _pending = []
+    # registrations of the script's top level code are collected until it is finished
+    _loading = False
+    _load_checked = False
+    _load_timer: threading.Timer | None = None
+
+    # rules, which are registered by this script, and the decorated class or function of each uid
+    _rules: dict[str, Java_SimpleRule] = {}
+    _sources: dict[str, Callable | object] = {}
+    # uids of each synchronised group and of the currently open synchronised batches
+    _sync_groups: dict[str, set] = {}
+    _sync_stack: list[tuple[str, set]] = []
+
+    added = 0
+    updated = 0
+    unchanged = 0
+    removed = 0
+
+    trigger_duration = 0.0
+    preparation_duration = 0.0
+    registration_duration = 0.0
+    registered = 0
+
+    @staticmethod
+    def fingerprint(base_rule_obj: Java_SimpleRule) -> str:
+        # python side options, like 'debounce', are part of the execution handler and not of the fingerprint
+        parts = [str(base_rule_obj.getName()), str(base_rule_obj.getDescription()), ",".join(sorted(str(tag) for tag in base_rule_obj.getTags()))]
+        for module in list(base_rule_obj.getTriggers()) + list(base_rule_obj.getConditions()):
+            parts.append("{}:{}".format(module.getId(), _ModuleIds.describe(module)))
+        return "|".join(parts)
+
+    @staticmethod
+    def register(base_rule_obj: Java_SimpleRule, name: str, rule_logger: '_LoggerFacade', source: Callable | object):
+        # the top level imports are done, as soon as the first rule is registered
+        if hasattr(builtins, "__stopImportTimer__"):
+            builtins.__stopImportTimer__()
+
+        if not _RuleRegistration._load_checked:
+            _RuleRegistration._beginLoad()
+
+        uid = base_rule_obj.getUID()
+        with _RuleRegistration._lock:
+            _RuleRegistration._checkDuplicate(uid, source)
+            _RuleRegistration._sources[uid] = source
+            for _, uids in _RuleRegistration._sync_stack:
+                uids.add(uid)
+            if _RuleRegistration._batch_depth > 0 or _RuleRegistration._loading:
+                _RuleRegistration._pending.append((base_rule_obj, name, rule_logger))
+                return
+        start_time = time.perf_counter()
+        status = _RuleRegistration._apply(base_rule_obj)
+        _RuleRegistration.registration_duration += time.perf_counter() - start_time
+        if status != "unchanged":
+            rule_logger.info("Rule '{}' initialised".format(name))
+
+    @staticmethod
+    def _beginLoad():
+        # called by the first registration. If it is part of the script's top level code, an implicit batch is open until this code is finished
+        _RuleRegistration._load_checked = True
+        top_frame = None
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code.co_name == "<module>" and '__context__' in frame.f_globals:
+                top_frame = frame
+            frame = frame.f_back
+        if top_frame is None:
+            return
+
+        def profiler(frame, event, arg):
+            if not _RuleRegistration._loading:
+                sys.setprofile(None)
+            elif event == 'return' and frame is top_frame:
+                sys.setprofile(None)
+                _RuleRegistration._endLoad()
+
+        _RuleRegistration._loading = True
+        sys.setprofile(profiler)
+        _RuleRegistration._load_timer = threading.Timer(_RuleRegistration.load_timeout, _RuleRegistration._endLoad)
+        _RuleRegistration._load_timer.daemon = True
+        _RuleRegistration._load_timer.start()
+
+    @staticmethod
+    def _endLoad():
+        with _RuleRegistration._lock:
+            if not _RuleRegistration._loading:
+                return
+            _RuleRegistration._loading = False
+            _RuleRegistration._load_timer.cancel()
+            flush = _RuleRegistration._batch_depth == 0
+        if flush:
+            _RuleRegistration.flush()
+
+    @staticmethod
+    def _checkDuplicate(uid: str, source: Callable | object):
+        # a uid can only be registered again by the same decorated class or function, or as part of its synchronised group
+        for _, uids in _RuleRegistration._sync_stack:
+            if uid in uids:
+                raise ValueError("Rule with uid '{}' is already registered".format(uid))
+        known_source = _RuleRegistration._sources.get(uid)
+        if known_source is None or known_source is source:
+            return
+        for sync, _ in _RuleRegistration._sync_stack:
+            if uid in _RuleRegistration._sync_groups.get(sync, ()):
+                return
+        raise ValueError("Rule with uid '{}' is already registered".format(uid))
+
+    @staticmethod
+    def _apply(base_rule_obj: Java_SimpleRule) -> str:
+        # an unchanged rule is not registered again, only its execution handler is replaced.
+        # Fingerprints are only calculated, if a uid is registered again
+        uid = base_rule_obj.getUID()
+        previous = _RuleRegistration._rules.get(uid)
+        if previous is not None:
+            if _RuleRegistration.fingerprint(previous) == _RuleRegistration.fingerprint(base_rule_obj):
+                previous._handler = base_rule_obj._handler
+                _RuleRegistration.unchanged += 1
+                return "unchanged"
+            RuleSupport.automationManager.removeRule(uid)
+
+        _RuleRegistration._addRule(base_rule_obj)
+        _RuleRegistration._rules[uid] = base_rule_obj
+        _RuleRegistration.registered += 1
+        if previous is None:
+            _RuleRegistration.added += 1
+            return "added"
+        _RuleRegistration.updated += 1
+        return "updated"
+
+    @staticmethod
+    def _remove(uid: str):
+        RuleSupport.automationManager.removeRule(uid)
+        _RuleRegistration._rules.pop(uid, None)
+        _RuleRegistration._sources.pop(uid, None)
+        _RuleRegistration.removed += 1
+
+    @staticmethod
+    def _addRule(base_rule_obj: Java_SimpleRule):
+        rule = RuleSupport.automationManager.addRule(base_rule_obj)
+
+        if BUNDLE_VERSION < versiontuple("5.0.0"):
+            actionConfiguration = rule.getActions().get(0).getConfiguration()
+            actionConfiguration.put('type', 'application/x-python3')
+            if _ScriptContext.getFilename():
+                actionConfiguration.put('script', f"# text based rule in file: {_ScriptContext.getFilename()}")
+        else:
+            rule.getConfiguration().put('sourceType', 'application/x-python3')
+            if _ScriptContext.getFilename():
+                rule.getConfiguration().put('source', f"# text based rule in file: {_ScriptContext.getFilename()}")
+
+    @staticmethod
+    def beginBatch(sync: str | None = None):
+        with _RuleRegistration._lock:
+            _RuleRegistration._batch_depth += 1
+            _RuleRegistration._batch_starts.append(len(_RuleRegistration._pending))
+            if sync is not None:
+                _RuleRegistration._sync_stack.append((sync, set()))
+
+    @staticmethod
+    def endBatch(sync: str | None = None, failed: bool = False):
+        obsolete_uids = []
+        with _RuleRegistration._lock:
+            _RuleRegistration._batch_depth = max(0, _RuleRegistration._batch_depth - 1)
+            start = _RuleRegistration._batch_starts.pop() if _RuleRegistration._batch_starts else len(_RuleRegistration._pending)
+            if failed:
+                # a failed block registers none of its rules, instead of a partial set
+                for base_rule_obj, _, _ in _RuleRegistration._pending[start:]:
+                    if base_rule_obj.getUID() not in _RuleRegistration._rules:
+                        _RuleRegistration._sources.pop(base_rule_obj.getUID(), None)
+                del _RuleRegistration._pending[start:]
+            if sync is not None:
+                _, uids = _RuleRegistration._sync_stack.pop()
+                # after a failure, the group is kept as it is, to not remove rules by accident
+                if not failed:
+                    obsolete_uids = [uid for uid in _RuleRegistration._sync_groups.get(sync, set()) if uid not in uids]
+                    _RuleRegistration._sync_groups[sync] = uids
+            flush = _RuleRegistration._batch_depth == 0
+
+        # rules of the group, which were not registered again, are removed
+        for uid in obsolete_uids:
+            try:
+                _RuleRegistration._remove(uid)
+            except Exception as e:
+                logger.error("Rule '{}' removal failed: {}", uid, builtins.__formatTraceback__(e))
+
+        if flush:
+            _RuleRegistration.flush()
+
+    @staticmethod
+    def flush():
+        with _RuleRegistration._lock:
+            pending = _RuleRegistration._pending
+            _RuleRegistration._pending = []
+        if len(pending) == 0:
+            return
+
+        start_time = time.perf_counter()
+        changes = {"added": 0, "updated": 0, "unchanged": 0}
+        for base_rule_obj, name, rule_logger in pending:
+            try:
+                status = _RuleRegistration._apply(base_rule_obj)
+                changes[status] += 1
+                rule_logger.debug("Rule '{}' {}", name, "initialised" if status != "unchanged" else "unchanged")
+            except Exception as e:
+                rule_logger.error("Rule '{}' registration failed: {}", name, builtins.__formatTraceback__(e))
+        _RuleRegistration.registration_duration += time.perf_counter() - start_time
+
+        report = _RuleRegistration.getReport()
+        logger.info("{} rules initialised ({} added, {} updated, {} unchanged). imports={:.1f} ms, triggers={:.1f} ms, preparation={:.1f} ms, registration={:.1f} ms".format(
+            len(pending), changes['added'], changes['updated'], changes['unchanged'], report['imports'], report['triggers'], report['preparation'], report['registration']
+        ))
+
+    @staticmethod
+    def getReport() -> dict[str, Any]:
+        # @when and @onlyif are parsed before the rule itself is created
+        trigger_duration = _RuleRegistration.trigger_duration + when.build_duration + onlyif.build_duration
+        return {
+            "imports": getattr(builtins, "__import_duration__", 0.0) * 1000,
+            "triggers": trigger_duration * 1000,
+            "preparation": _RuleRegistration.preparation_duration * 1000,
+            "registration": _RuleRegistration.registration_duration * 1000,
+            "rules": _RuleRegistration.registered,
+            "pending": len(_RuleRegistration._pending),
+            "added": _RuleRegistration.added,
+            "updated": _RuleRegistration.updated,
+            "unchanged": _RuleRegistration.unchanged,
+            "removed": _RuleRegistration.removed
+        }
+
+class _RuleBatch():
+    def __init__(self, sync: Union[bool, str] = False):
+        # 'sync=True' is the default group of the script
+        self.sync = ( "" if sync is True else sync ) if sync else None
+
+    def __enter__(self):
+        _RuleRegistration.beginBatch(self.sync)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _RuleRegistration.endBatch(self.sync, exc_type is not None)
+        return False
+
 class rule():
-    def __init__(self, name: str | None = None, description: str | None = None, tags: list[str] | None = None, triggers: list[BaseTrigger] | None = None, conditions: list[BaseCondition] | None = None, uid: str | None = None, runtime_measurement: bool = True, profile_code: bool = False):
+    def __init__(self, name: str | None = None, description: str | None = None, tags: list[str] | None = None, triggers: list[BaseTrigger] | None = None, conditions: list[BaseCondition] | None = None, uid: str | None = None, runtime_measurement: Union[bool, str] = True, profile_code: Union[bool, RuleProfiler] = False, executor: Union[RuleExecutor, bool, None] = None, debounce: float | None = None, coalesce: str = "last", timeout: float | None = None, hard_timeout: float | None = None, circuit_breaker: Union[CircuitBreaker, bool, None] = None):
         self.name = name
         self.description = description
         self.tags = tags
@@ -107,9 +1345,27 @@ class rule():
 
         self.uid = uid
 
+        if runtime_measurement not in [True, False, "metrics"]:
+            raise ValueError("Unsupported runtime_measurement mode '{}'".format(runtime_measurement))
         self.runtime_measurement = runtime_measurement
         self.profile_code = profile_code
 
+        self.executor = RuleExecutor.getDefault() if executor is True else ( executor if executor else None )
+
+        if coalesce not in ["last", "all"]:
+            raise ValueError("Unsupported coalesce mode '{}'".format(coalesce))
+        self.debounce = debounce
+        self.coalesce = coalesce
+        self._debounce_lock = threading.Lock()
+        self._debounce_windows = {}
+        self._debounce_timers = {}
+        self._python_conditions = []
+        self._trigger_filters = []
+
+        self.timeout = timeout
+        self.hard_timeout = hard_timeout
+        self.circuit_breaker = CircuitBreaker() if circuit_breaker is True else ( circuit_breaker if circuit_breaker else None )
+
         # @rule is used as decorator without parameter. ("@rule" instead of "@rule()")
         if isfunction(name) or isclass(name):
             self.name = None
@@ -118,11 +1374,15 @@ class rule():
     def __call__(self, clazz_or_function: Callable | object):
         proxy = self
 
+        start_time = time.perf_counter()
+
         rule_isfunction = isfunction(clazz_or_function)
         rule_obj = clazz_or_function if rule_isfunction else clazz_or_function()
 
         clazz_or_function.logger = logger._buildRuleLogger(clazz_or_function.__name__)
 
+        trigger_start_time = time.perf_counter()
+
         triggers = []
         if proxy.triggers is not None:
             triggers = proxy.triggers
@@ -131,9 +1391,14 @@ class rule():
         elif hasattr(rule_obj, "buildTriggers") and callable(rule_obj.buildTriggers):
             triggers = rule_obj.buildTriggers()
 
+        # trigger and condition ids must be unique within the rule
+        module_ids = set()
         raw_triggers = []
         for trigger in triggers:
-            raw_triggers.append(trigger.raw_trigger)
+            raw_triggers.append((trigger.raw_trigger, getattr(trigger, "generated_id", False)))
+        raw_triggers = _ModuleIds.assign(raw_triggers, Java_TriggerBuilder, module_ids)
+        # the event of a trigger is passed as '<trigger id>.event'
+        proxy._trigger_filters = [("{}.event".format(raw_trigger.getId()), trigger.filter) for trigger, raw_trigger in zip(triggers, raw_triggers) if getattr(trigger, "filter", None) is not None]
 
         conditions = []
         if proxy.conditions is not None:
@@ -144,29 +1409,33 @@ class rule():
             conditions = rule_obj.buildConditions()
 
         raw_conditions = []
+        python_conditions = []
         for condition in conditions:
-            raw_conditions.append(condition.raw_condition)
-
-        #register_interop_type(Java_SimpleRule, clazz)
-        #subclass = type(clazz.__name__, (clazz, BaseSimpleRule,))
-
-        name = "{}.{}".format(logger._getNamePrefix(), clazz_or_function.__name__) if proxy.name is None else proxy.name
-        if logger._getFilename():
-            hash=hashlib.md5(logger._getFilename().encode('utf-8')).hexdigest()
-            uid = "{} {}".format(name, hash) if proxy.uid is None else proxy.uid
-            uid = re.sub(r"\W", "-", uid)
-        else:
-            uid = UUID.randomUUID().toString()
-
-        # dummy helper to avoid "org.graalvm.polyglot.PolyglotException: java.lang.IllegalStateException: unknown type com.oracle.truffle.host.HostObject"
-        class BaseSimpleRule(Java_SimpleRule):
-            def getUID(self):
-                return uid
+            if isinstance(condition, PythonCondition):
+                python_conditions.append(condition)
+            else:
+                raw_conditions.append((condition.raw_condition, getattr(condition, "generated_id", False)))
+        proxy._python_conditions = python_conditions
+        raw_conditions = _ModuleIds.assign(raw_conditions, Java_ConditionBuilder, module_ids)
 
-            def execute(self, module, input):
-                proxy.executeWrapper(rule_obj, rule_isfunction, module, input)
+        trigger_duration = time.perf_counter() - trigger_start_time
+        _RuleRegistration.trigger_duration += trigger_duration
 
-        base_rule_obj = BaseSimpleRule()
+        #register_interop_type(Java_SimpleRule, clazz)
+        #subclass = type(clazz.__name__, (clazz, _SimpleRule,))
+
+        name = "{}.{}".format(_ScriptContext.getNamePrefix(), clazz_or_function.__name__) if proxy.name is None else proxy.name
+        proxy._rule_name = name
+        if proxy.circuit_breaker is not None:
+            RuleWatchdog._breakers[name] = proxy.circuit_breaker
+        if proxy.debounce is not None:
+            scope.lifecycleTracker.addDisposeHook(proxy._cancelDebounceWindows)
+        uid = "{} {}".format(name, _ScriptContext.getScriptHash()) if proxy.uid is None else proxy.uid
+        uid = _ScriptContext.UID_PATTERN.sub("-", uid)
+
+        base_rule_obj = _SimpleRule()
+        base_rule_obj._rule_uid = uid
+        base_rule_obj._handler = lambda module, input: proxy._dispatch(uid, rule_obj, rule_isfunction, module, input)
         base_rule_obj.setName(name)
 
         if proxy.description is not None:
@@ -181,27 +1450,135 @@ class rule():
         if len(raw_conditions) > 0:
             base_rule_obj.setConditions(raw_conditions)
 
-        rule = RuleSupport.automationManager.addRule(base_rule_obj)
+        _RuleRegistration.preparation_duration += time.perf_counter() - start_time - trigger_duration
 
-        if BUNDLE_VERSION < versiontuple("5.0.0"):
-            actionConfiguration = rule.getActions().get(0).getConfiguration()
-            actionConfiguration.put('type', 'application/x-python3')
-            if logger._getFilename():
-                actionConfiguration.put('script', f"# text based rule in file: {logger._getFilename()}")
+        _RuleRegistration.register(base_rule_obj, name, clazz_or_function.logger, clazz_or_function)
+
+        return rule_obj
+
+    @staticmethod
+    def batch(sync: Union[bool, str] = False) -> '_RuleBatch':
+        return _RuleBatch(sync)
+
+    @staticmethod
+    def flush():
+        _RuleRegistration.flush()
+
+    @staticmethod
+    def getLoadReport() -> dict[str, Any]:
+        return _RuleRegistration.getReport()
+
+    def _dispatch(self, uid: str, rule_obj: Callable | object, rule_isfunction: bool, module: dict[str, Any], input: dict[str, Any]):
+        # events of the same item are processed in order per rule, others in parallel.
+        # This runs on the engine thread, so failures are logged like in executeWrapper instead of being raised
+        try:
+            event_info = self._getEventInfo(input)
+        except Exception as e:
+            rule_obj.logger.error("Event evaluation failed: " + builtins.__formatTraceback__(e))
+            return
+        key = uid if event_info is None or event_info[0] == "Other" else (uid, event_info)
+
+        for event_key, trigger_filter in self._trigger_filters:
+            try:
+                event = input[event_key]
+            except KeyError:
+                continue
+            if event is None:
+                continue
+            try:
+                accepted = trigger_filter(event)
+            except Exception as e:
+                accepted = False
+                rule_obj.logger.error("Trigger filter failed: " + builtins.__formatTraceback__(e))
+            if not accepted:
+                RuleMetrics.recordRejected(self._rule_name, event_info)
+                return
+            break
+
+        for condition in self._python_conditions:
+            try:
+                accepted = condition.check(input)
+            except Exception as e:
+                accepted = False
+                rule_obj.logger.error("Condition evaluation failed: " + builtins.__formatTraceback__(e))
+            if not accepted:
+                RuleMetrics.recordRejected(self._rule_name, event_info)
+                return
+
+        # openHAB reuses and refills one input map per rule, so a deferred execution needs its own copy
+        if self.executor is not None or self.debounce is not None:
+            try:
+                input = self._copyInput(input)
+            except Exception as e:
+                rule_obj.logger.error("Event evaluation failed: " + builtins.__formatTraceback__(e))
+                return
+
+        if self.debounce is None:
+            self._submit(key, rule_obj, rule_isfunction, module, input)
+            return
+
+        # the first event of a burst opens a window, all events until the window ends are collapsed into one execution
+        with self._debounce_lock:
+            window = self._debounce_windows.get(key)
+            if window is not None:
+                window.append(input)
+                return
+            self._debounce_windows[key] = [input]
+
+            timer = threading.Timer(self.debounce, self._flushDebounceWindow, [key, rule_obj, rule_isfunction, module])
+            timer.daemon = True
+            self._debounce_timers[key] = timer
+            timer.start()
+
+    def _flushDebounceWindow(self, key: Any, rule_obj: Callable | object, rule_isfunction: bool, module: dict[str, Any]):
+        with self._debounce_lock:
+            self._debounce_timers.pop(key, None)
+            inputs = self._debounce_windows.pop(key, None)
+        # the window was already cancelled by a script unload
+        if inputs is None:
+            return
+
+        if self.coalesce == "last":
+            input = inputs[-1]
         else:
-            rule.getConfiguration().put('sourceType', 'application/x-python3')
-            if logger._getFilename():
-                rule.getConfiguration().put('source', f"# text based rule in file: {logger._getFilename()}")
+            input = dict(inputs[-1])
+            input['events'] = []
+            for _input in inputs:
+                try:
+                    input['events'].append(_input['event'])
+                except KeyError:
+                    pass
+        self._submit(key, rule_obj, rule_isfunction, module, input)
 
-        clazz_or_function.logger.info("Rule '{}' initialised".format(name))
+    def _cancelDebounceWindows(self):
+        with self._debounce_lock:
+            for timer in self._debounce_timers.values():
+                timer.cancel()
+            self._debounce_timers = {}
+            self._debounce_windows = {}
 
-        return rule_obj
+    def _submit(self, key: Any, rule_obj: Callable | object, rule_isfunction: bool, module: dict[str, Any], input: dict[str, Any]):
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(self._rule_name):
+            return
+
+        if self.executor is None:
+            self.executeWrapper(rule_obj, rule_isfunction, module, input)
+            return
 
-    def executeWrapper(self, rule_obj: Callable | object, rule_isfunction: bool, module: dict[str, Any], input: dict[str, Any]):
         try:
-            start_time = time.perf_counter()
+            self.executor.submit(key, self.executeWrapper, rule_obj, rule_isfunction, module, input)
+        except Exception:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(self._rule_name)
+            raise
 
-            if self.profile_code:
+    def executeWrapper(self, rule_obj: Callable | object, rule_isfunction: bool, module: dict[str, Any], input: dict[str, Any]):
+        start_time = time.perf_counter()
+        execution = None if self.timeout is None and self.hard_timeout is None else RuleWatchdog._start(self._rule_name, self.timeout, self.hard_timeout)
+        try:
+            if isinstance(self.profile_code, RuleProfiler):
+                self.profile_code.run(self._rule_name, rule_obj if rule_isfunction else rule_obj.execute, module, input)
+            elif self.profile_code:
                 pr = profile.Profile()
                 pr.runctx('func(module, input)', {'module': module, 'input': input, 'func': rule_obj if rule_isfunction else rule_obj.execute }, {})
                 s = io.StringIO()
@@ -211,50 +1588,101 @@ class rule():
             else:
                 rule_obj(module, input) if rule_isfunction else rule_obj.execute(module, input)
 
-            if self.runtime_measurement:
-                try:
-                    if input['event'].getType().startswith("Item"):
-                        msg_details = " [Item: {}]".format(input['event'].getItemName())
-                    elif input['event'].getType().startswith("Group"):
-                        msg_details = " [Group: {}]".format(input['event'].getItemName())
-                    elif input['event'].getType().startswith("Thing"):
-                        msg_details = " [Thing: {}]".format(input['event'].getThingUID())
-                    else:
-                        msg_details = " [Other: {}]".format(input['event'].getType())
-                except KeyError:
-                    msg_details = ""
-                rule_obj.logger.info("Rule executed in " + "{:6.1f}".format(round( ( time.perf_counter() - start_time ) * 1000, 1 )) + " ms" + msg_details)
+            failed = False
         except Exception as e:
+            failed = True
             rule_obj.logger.error("Rule execution failed: " + builtins.__formatTraceback__(e))
 
+        exceeded = False if execution is None else RuleWatchdog._stop(execution)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(self._rule_name, not failed and not exceeded)
+
+        if self.runtime_measurement:
+            duration = time.perf_counter() - start_time
+            event_info = self._getEventInfo(input)
+            RuleMetrics.record(self._rule_name, event_info, duration, failed)
+            if self.runtime_measurement is True and not failed:
+                msg_details = "" if event_info is None else " [{}: {}]".format(*event_info)
+                rule_obj.logger.info("Rule executed in " + "{:6.1f}".format(round( duration * 1000, 1 )) + " ms" + msg_details)
+
+    @staticmethod
+    def _copyInput(input: dict[str, Any]) -> dict[str, Any]:
+        return {k: input[k] for k in (input.keySet() if hasattr(input, 'keySet') else input.keys())}
+
+    @staticmethod
+    def _getEventInfo(input: dict[str, Any]) -> tuple[str, str] | None:
+        try:
+            event = input['event']
+        except KeyError:
+            return None
+        event_type = event.getType()
+        if event_type.startswith("Item"):
+            return ("Item", event.getItemName())
+        elif event_type.startswith("Group"):
+            return ("Group", event.getItemName())
+        elif event_type.startswith("Thing"):
+            return ("Thing", str(event.getThingUID()))
+        return ("Other", event_type)
+
 def __foreignNoneFallback__(self, name: str):
     raise AttributeError("None object has no attribute '{}'".format(name))
 ForeignNone.__getattr__ = __foreignNoneFallback__
 
+# datetime attributes, which are provided by the decoded java value
+_DATETIME_FIELDS: dict[str, int] = {
+    "_year": 0,
+    "_month": 1,
+    "_day": 2,
+    "_hour": 3,
+    "_minute": 4,
+    "_second": 5,
+    "_microsecond": 6,
+    "_tzinfo": 7,
+    "_hashcode": 8,
+    "_fold": 9,
+}
+
+class _DecodedValueCache():
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, obj: Any, decoder: Callable) -> tuple:
+        # keyed by the java value itself, so no java object is kept alive and equal values share one entry
+        key = (decoder, obj.toString())
+        with self._lock:
+            fields = self._entries.get(key)
+            if fields is not None:
+                self.hits += 1
+                return fields
+            self.misses += 1
+
+        fields = decoder(obj)
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = fields
+        return fields
+_DECODED_VALUE_CACHE = _DecodedValueCache()
+
 @interop_type(Java_Instant)
 class Instant(datetime):
-    _ATTR_MAPPING: dict[str, Any] = {
-        "_year": lambda s: datetime.fromtimestamp(s.getEpochSecond()).year,
-        "_month": lambda s: datetime.fromtimestamp(s.getEpochSecond()).month,
-        "_day": lambda s: datetime.fromtimestamp(s.getEpochSecond()).day,
-        "_hour": lambda s: datetime.fromtimestamp(s.getEpochSecond()).hour,
-        "_minute": lambda s: datetime.fromtimestamp(s.getEpochSecond()).minute,
-        "_second": lambda s: datetime.fromtimestamp(s.getEpochSecond()).second,
-        "_microsecond": lambda s: int(s.getNano() / 1000),
-        "_tzinfo": lambda _: None,
-        "_hashcode": lambda _: -1,
-        "_fold": lambda _: 0,
-    }
-
     def __new__(cls, year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0,
                 microsecond: int = 0, tzinfo: Union[datetime.tzinfo, None] = None, *, fold = 0):
         return datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second, microsecond=microsecond, tzinfo=tzinfo, fold=fold)
 
+    @staticmethod
+    def _decode(s: Java_Instant) -> tuple:
+        value = datetime.fromtimestamp(s.getEpochSecond())
+        return (value.year, value.month, value.day, value.hour, value.minute, value.second, int(s.getNano() / 1000), None, -1, 0)
+
     def __getattribute__(self, name: str):
-        if name == "_ATTR_MAPPING":
-            return super().__getattribute__(name)
-        if name in self._ATTR_MAPPING:
-            return self._ATTR_MAPPING[name](super())
+        index = _DATETIME_FIELDS.get(name)
+        if index is not None:
+            return _DECODED_VALUE_CACHE.get(self, Instant._decode)[index]
         return super().__getattribute__(name)
 
     def __hash__(self):
@@ -262,28 +1690,19 @@ class Instant(datetime):
 
 @interop_type(Java_ZonedDateTime)
 class DateTime(datetime):
-    _ATTR_MAPPING: dict[str, Any] = {
-        "_year": lambda s: s.getYear(),
-        "_month": lambda s: s.getMonthValue(),
-        "_day": lambda s: s.getDayOfMonth(),
-        "_hour": lambda s: s.getHour(),
-        "_minute": lambda s: s.getMinute(),
-        "_second": lambda s: s.getSecond(),
-        "_microsecond": lambda s: int(s.getNano() / 1000),
-        "_tzinfo": lambda s: timezone(timedelta(seconds=s.getOffset().getTotalSeconds()), s.getZone().getId()),
-        "_hashcode": lambda _: -1,
-        "_fold": lambda _: 0,
-    }
-
     def __new__(cls, year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0,
                 microsecond: int = 0, tzinfo = None, *, fold = 0):
         return datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second, microsecond=microsecond, tzinfo=tzinfo, fold=fold)
 
+    @staticmethod
+    def _decode(s: Java_ZonedDateTime) -> tuple:
+        tzinfo = timezone(timedelta(seconds=s.getOffset().getTotalSeconds()), s.getZone().getId())
+        return (s.getYear(), s.getMonthValue(), s.getDayOfMonth(), s.getHour(), s.getMinute(), s.getSecond(), int(s.getNano() / 1000), tzinfo, -1, 0)
+
     def __getattribute__(self, name: str):
-        if name == "_ATTR_MAPPING":
-            return super().__getattribute__(name)
-        if name in self._ATTR_MAPPING:
-            return self._ATTR_MAPPING[name](super())
+        index = _DATETIME_FIELDS.get(name)
+        if index is not None:
+            return _DECODED_VALUE_CACHE.get(self, DateTime._decode)[index]
         return super().__getattribute__(name)
 
     def __hash__(self):
@@ -310,27 +1729,35 @@ class Item(Java_Item if TYPE_CHECKING else object):
         return True
 
     def getThings(self) -> list[Java_Thing]:
+        if _LinkIndex.isEnabled():
+            return _LinkIndex.getItemThings(self.getName())
         return ITEM_CHANNEL_LINK_REGISTRY.getBoundThings(self.getName())
 
     def getChannels(self) -> list[Java_Channel]:
+        if _LinkIndex.isEnabled():
+            return _LinkIndex.getItemChannels(self.getName())
         return [Registry.getChannel(uid.getAsString()) for uid in ITEM_CHANNEL_LINK_REGISTRY.getBoundChannels(self.getName())]
 
     def getChannelUIDs(self) -> list[str]:
+        if _LinkIndex.isEnabled():
+            return [link.getLinkedUID() for link in _LinkIndex.getItemLinks(self.getName())]
         return ITEM_CHANNEL_LINK_REGISTRY.getBoundChannels(self.getName())
 
     def getChannelLinks(self) -> list[Java_ItemChannelLink]:
+        if _LinkIndex.isEnabled():
+            return _LinkIndex.getItemLinks(self.getName())
         return ITEM_CHANNEL_LINK_REGISTRY.getLinks(self.getName())
 
     def linkChannel(self, channel_uid: str, link_config: dict[str, str] = {}) -> Java_ItemChannelLink:
         uid = Java_ChannelUID(channel_uid)
         config = Configuration(link_config)
 
-        links = ITEM_CHANNEL_LINK_REGISTRY.getLinks(uid)
-        for link in links:
-            if link.getItemName() == self.getName():
-                if not link.getConfiguration().equals(config):
-                    ITEM_CHANNEL_LINK_REGISTRY.update(link)
-                return link
+        link = self._getChannelLink(uid)
+        if link is not None:
+            if not link.getConfiguration().equals(config):
+                link = Java_ItemChannelLink(self.getName(), uid, config)
+                ITEM_CHANNEL_LINK_REGISTRY.update(link)
+            return link
 
         link = Java_ItemChannelLink(self.getName(), uid, config)
         ITEM_CHANNEL_LINK_REGISTRY.add(link)
@@ -339,19 +1766,28 @@ class Item(Java_Item if TYPE_CHECKING else object):
     def unlinkChannel(self, channel_uid: str) -> Java_ItemChannelLink:
         uid = Java_ChannelUID(channel_uid)
 
+        link = self._getChannelLink(uid)
+        if link is not None:
+            ITEM_CHANNEL_LINK_REGISTRY.remove(link.getUID())
+            return link
+
+        raise NotFoundException("Link {} not found".format(channel_uid))
+
+    def _getChannelLink(self, uid: Java_ChannelUID) -> Java_ItemChannelLink | None:
+        if _LinkIndex.isEnabled():
+            return _LinkIndex.getLink(self.getName(), uid.getAsString())
+
         links = ITEM_CHANNEL_LINK_REGISTRY.getLinks(uid)
         for link in links:
             if link.getItemName() == self.getName():
-                ITEM_CHANNEL_LINK_REGISTRY.remove(link.getUID())
                 return link
-
-        raise NotFoundException("Link {} not found".format(channel_uid))
+        return None
 
     def getPersistence(self, service_id: str | None = None) -> 'ItemPersistence':
-        return ItemPersistence(self, service_id)
+        return _ItemProxyCache.get(self, ItemPersistence, service_id)
 
     def getSemantic(self) -> 'ItemSemantic':
-        return ItemSemantic(self)
+        return _ItemProxyCache.get(self, ItemSemantic)
 
     def getMetadata(self) -> 'ItemMetadata':
         return ItemMetadata(self)
@@ -362,105 +1798,856 @@ class Item(Java_Item if TYPE_CHECKING else object):
         return ''.join([c if c.isalnum() else '_' for c in s.replace('"', '').replace("'", '')])
 
     @staticmethod
-    def _checkIfDifferent(current_state: Any, new_state: Any):
-        if not java.instanceof(current_state, Java_UnDefType):
-            if java.instanceof(current_state, Java_PercentType):
-                if isinstance(new_state, str):
-                    if new_state == "UP":
-                        new_state = 0
-                    if new_state == "DOWN":
-                        new_state = 100
-                elif java.instanceof(new_state, Java_UpDownType):
-                    new_state = (0 if new_state.toFullString() == "UP" else 100)
-            elif java.instanceof(current_state, Java_PrimitiveType):
-                current_state = current_state.toFullString()
-            elif isinstance(current_state, datetime):
-                current_state = current_state.isoformat()
-            else:
-                current_state = str(current_state)
+    def _checkIfDifferent(current_state: Any, new_state: Any) -> bool:
+        comparator = _STATE_COMPARATORS.get(current_state.getClass().getName(), _StateComparator.compareFallback)
+        return comparator(current_state, new_state)
 
-            if java.instanceof(new_state, Java_PrimitiveType):
-                new_state = new_state.toFullString()
-            elif isinstance(new_state, datetime):
-                new_state = new_state.isoformat()
-            else:
-                new_state = str(new_state)
+class _StateComparator():
+    @staticmethod
+    def _toNumber(value: Any) -> float | None:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        if java.instanceof(value, Java_DecimalType):
+            return value.doubleValue()
+        return None
 
-            return current_state != new_state
+    @staticmethod
+    def compareUndefined(current_state: Java_State, new_state: Any) -> bool:
         return True
 
+    @staticmethod
+    def compareDecimal(current_state: Java_DecimalType, new_state: Any) -> bool:
+        number = _StateComparator._toNumber(new_state)
+        if number is None:
+            return _StateComparator.compareFallback(current_state, new_state)
+        return current_state.doubleValue() != number
+
+    @staticmethod
+    def comparePercent(current_state: Java_PercentType, new_state: Any) -> bool:
+        if isinstance(new_state, str):
+            if new_state in ("UP", "OFF"):
+                new_state = 0
+            elif new_state in ("DOWN", "ON"):
+                new_state = 100
+        elif not isinstance(new_state, (int, float)) and java.instanceof(new_state, Java_UpDownType):
+            new_state = (0 if new_state.toFullString() == "UP" else 100)
+        elif not isinstance(new_state, (int, float)) and java.instanceof(new_state, Java_OnOffType):
+            # like a dimmer item, ON is 100 and OFF is 0
+            new_state = (100 if new_state.toFullString() == "ON" else 0)
+        return _StateComparator.compareDecimal(current_state, new_state)
+
+    @staticmethod
+    def compareQuantity(current_state: Java_QuantityType, new_state: Any) -> bool:
+        number = _StateComparator._toNumber(new_state)
+        if number is not None:
+            # plain numbers are interpreted in the unit of the item state
+            return current_state.doubleValue() != number
+
+        if isinstance(new_state, str):
+            try:
+                new_state = Java_QuantityType(new_state)
+            except Exception:
+                return _StateComparator.compareFallback(current_state, new_state)
+        elif not java.instanceof(new_state, Java_QuantityType):
+            return _StateComparator.compareFallback(current_state, new_state)
+
+        converted_state = new_state.toUnit(current_state.getUnit())
+        if converted_state is None:
+            return True
+        return not math.isclose(current_state.doubleValue(), converted_state.doubleValue(), rel_tol=1e-12)
+
+    @staticmethod
+    def compareOnOff(current_state: Java_State, new_state: Any) -> bool:
+        if isinstance(new_state, bool):
+            return current_state.toString() != ("ON" if new_state else "OFF")
+        if not isinstance(new_state, (str, int, float)) and java.instanceof(new_state, Java_DecimalType):
+            # e.g. PercentType, every value except 0 is ON
+            return current_state.toString() != ("ON" if new_state.doubleValue() != 0 else "OFF")
+        return _StateComparator.compareString(current_state, new_state)
+
+    @staticmethod
+    def compareString(current_state: Java_State, new_state: Any) -> bool:
+        if isinstance(new_state, str):
+            return current_state.toString() != new_state
+        return _StateComparator.compareFallback(current_state, new_state)
+
+    @staticmethod
+    def compareDateTime(current_state: Java_DateTimeType, new_state: Any) -> bool:
+        if isinstance(new_state, datetime):
+            return current_state.getZonedDateTime() != (new_state.astimezone() if new_state.tzinfo is None else new_state)
+        return _StateComparator.compareFallback(current_state, new_state)
+
+    @staticmethod
+    def compareFallback(current_state: Any, new_state: Any) -> bool:
+        if java.instanceof(current_state, Java_UnDefType):
+            return True
+
+        if java.instanceof(current_state, Java_PrimitiveType):
+            current_state = current_state.toFullString()
+        elif isinstance(current_state, datetime):
+            current_state = current_state.isoformat()
+        else:
+            current_state = str(current_state)
+
+        if java.instanceof(new_state, Java_PrimitiveType):
+            new_state = new_state.toFullString()
+        elif isinstance(new_state, datetime):
+            new_state = new_state.isoformat()
+        else:
+            new_state = str(new_state)
+
+        return current_state != new_state
+
+# comparators by java class name of the current item state
+_STATE_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "org.openhab.core.types.UnDefType": _StateComparator.compareUndefined,
+    "org.openhab.core.library.types.DecimalType": _StateComparator.compareDecimal,
+    "org.openhab.core.library.types.PercentType": _StateComparator.comparePercent,
+    "org.openhab.core.library.types.QuantityType": _StateComparator.compareQuantity,
+    "org.openhab.core.library.types.OnOffType": _StateComparator.compareOnOff,
+    "org.openhab.core.library.types.OpenClosedType": _StateComparator.compareString,
+    "org.openhab.core.library.types.UpDownType": _StateComparator.compareString,
+    "org.openhab.core.library.types.StringType": _StateComparator.compareString,
+    "org.openhab.core.library.types.DateTimeType": _StateComparator.compareDateTime,
+}
+
+def _timeWeightedStatistics(boundaries: array, values: array) -> dict[str, float]:
+    # 'boundaries' contains one more entry than 'values'. Each value is valid from boundaries[i] to boundaries[i+1]
+    if np is not None:
+        _values = np.frombuffer(values, dtype=np.float64)
+        durations = np.diff(np.frombuffer(boundaries, dtype=np.float64))
+        duration = float(durations.sum())
+        integral = float(np.dot(_values, durations))
+        average = integral / duration if duration > 0 else float(_values[-1])
+        variance = float(np.dot(durations, (_values - average) ** 2)) / duration if duration > 0 else 0.0
+        minimum = float(_values.min())
+        maximum = float(_values.max())
+    else:
+        duration = integral = 0.0
+        minimum = maximum = values[0]
+        for i, value in enumerate(values):
+            _duration = boundaries[i + 1] - boundaries[i]
+            duration += _duration
+            integral += value * _duration
+            if value < minimum:
+                minimum = value
+            if value > maximum:
+                maximum = value
+        average = integral / duration if duration > 0 else values[-1]
+        variance = 0.0
+        if duration > 0:
+            for i, value in enumerate(values):
+                variance += ( boundaries[i + 1] - boundaries[i] ) * ( value - average ) ** 2
+            variance = variance / duration
+
+    return {
+        "average": average,
+        "min": minimum,
+        "max": maximum,
+        "stddev": math.sqrt(variance),
+        "integral": integral,
+        "duration": duration,
+        "count": len(values)
+    }
+
 class _JavaCallProxy:
+    # resolved java methods, shared by all proxies of the same java class
+    _handles: dict[int, dict[str, Callable]] = {}
+
     def __init__(self, proxy: Java_Object, callback: Callable):
         self.proxy = proxy
         self.callback = callback
 
     def __getattr__(self, name: str):
-        attr = getattr(self.proxy, name)
-        if callable(attr) and java.is_function(attr):
-            return lambda *args, **kwargs: attr(*(self.callback(*args)))
-        return attr
+        # only called once per name. Bound functions are stored as instance attributes, which are found without calling __getattr__ again
+        handles = _JavaCallProxy._handles.setdefault(id(self.proxy), {})
+        attr = handles.get(name)
+        if attr is None:
+            attr = getattr(self.proxy, name)
+            if not callable(attr) or not java.is_function(attr):
+                return attr
+            handles[name] = attr
+        func = self._bind(name, attr)
+        setattr(self, name, func)
+        return func
+
+    def _bind(self, name: str, attr: Callable) -> Callable:
+        callback = self.callback
+        return lambda *args, **kwargs: attr(*(callback(*args)))
 
     def __str__(self):
         return "{} => java proxy class {}".format(super().__str__(), str(self.proxy))
 
+class _PersistenceCache():
+    # read only persistence queries, which can be cached
+    CACHEABLE_PREFIXES = ("average", "maximum", "minimum", "median", "sum", "delta", "count", "variance", "deviation", "riemannSum", "evolutionRate",
+                          "persistedState", "historicState", "previousState", "nextState", "changed", "updated", "lastUpdate", "lastChange", "nextUpdate", "nextChange")
+    # modifying calls, which are invalidating the cache of an item
+    MODIFYING_METHODS = ("persist", "removeAllStatesBetween", "removeAllStatesSince", "removeAllStatesUntil")
+
+    _lock = threading.Lock()
+    _entries: OrderedDict = OrderedDict()
+    _keys_by_item: dict[str, set] = {}
+    _enabled = False
+    ttl = 10.0
+    max_size = 1000
+    time_bucket = 10.0
+    hits = 0
+    misses = 0
+    evictions = 0
+    invalidations = 0
+
+    @staticmethod
+    def enable(ttl: float, max_size: int, time_bucket: float):
+        _PersistenceCache.ttl = ttl
+        _PersistenceCache.max_size = max_size
+        _PersistenceCache.time_bucket = time_bucket
+        _PersistenceCache._enabled = True
+
+    @staticmethod
+    def disable():
+        _PersistenceCache._enabled = False
+        with _PersistenceCache._lock:
+            _PersistenceCache._entries.clear()
+            _PersistenceCache._keys_by_item = {}
+
+    @staticmethod
+    def _getLastUpdate(item: Item) -> int | None:
+        last_update = item.getLastStateUpdate()
+        return None if last_update is None else last_update.toInstant().toEpochMilli()
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, datetime):
+            # similar timestamps, like 'datetime.now() - timedelta(hours=1)', are sharing the same cache entry
+            return ("datetime", int(value.timestamp() // _PersistenceCache.time_bucket))
+        if isinstance(value, timedelta):
+            return ("timedelta", value.total_seconds())
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise TypeError()
+
+    @staticmethod
+    def call(item: Item, service_id: str | None, name: str, func: Callable, args: tuple) -> Any:
+        item_name = item.getName()
+        try:
+            key = (item_name, service_id, name, tuple(_PersistenceCache._normalize(arg) for arg in args))
+        except TypeError:
+            return func(*args)
+
+        # instead of listening to all state events of the system, an entry is only valid as long as the item didn't receive an update.
+        # strategies like everyUpdate are persisting a new value without a state change
+        last_update = _PersistenceCache._getLastUpdate(item)
+        now = time.monotonic()
+        with _PersistenceCache._lock:
+            entry = _PersistenceCache._entries.get(key)
+            if entry is not None and entry[0] > now:
+                if entry[1] == last_update:
+                    _PersistenceCache._entries.move_to_end(key)
+                    _PersistenceCache.hits += 1
+                    return entry[2]
+                _PersistenceCache.invalidations += 1
+            _PersistenceCache.misses += 1
+
+        result = func(*args)
+
+        with _PersistenceCache._lock:
+            _PersistenceCache._entries[key] = (now + _PersistenceCache.ttl, last_update, result)
+            _PersistenceCache._entries.move_to_end(key)
+            _PersistenceCache._keys_by_item.setdefault(item_name, set()).add(key)
+            while len(_PersistenceCache._entries) > _PersistenceCache.max_size:
+                old_key, _ = _PersistenceCache._entries.popitem(last=False)
+                _PersistenceCache._keys_by_item.get(old_key[0], set()).discard(old_key)
+                _PersistenceCache.evictions += 1
+        return result
+
+    @staticmethod
+    def invalidate(item_name: str):
+        with _PersistenceCache._lock:
+            keys = _PersistenceCache._keys_by_item.pop(item_name, None)
+            if keys is None:
+                return
+            for key in keys:
+                _PersistenceCache._entries.pop(key, None)
+            _PersistenceCache.invalidations += 1
+
+    @staticmethod
+    def getStats() -> dict[str, Any]:
+        with _PersistenceCache._lock:
+            requests = _PersistenceCache.hits + _PersistenceCache.misses
+            return {
+                "enabled": _PersistenceCache._enabled,
+                "size": len(_PersistenceCache._entries),
+                "hits": _PersistenceCache.hits,
+                "misses": _PersistenceCache.misses,
+                "hit_rate": _PersistenceCache.hits / requests if requests > 0 else 0.0,
+                "evictions": _PersistenceCache.evictions,
+                "invalidations": _PersistenceCache.invalidations
+            }
+
+class _ItemProxyCache():
+    # ItemPersistence and ItemSemantic objects are reused, together with their already bound java methods
+    MAX_SIZE = 4096
+
+    _lock = threading.Lock()
+    _proxies: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def get(item: Item, cls: type, *args) -> _JavaCallProxy:
+        key = (cls, item.getName()) + args
+        with _ItemProxyCache._lock:
+            proxy = _ItemProxyCache._proxies.get(key)
+            # a replaced item, e.g. after a registry update, gets a new proxy. Identity is checked,
+            # because java equals of a replaced item with the same name can still be true
+            if proxy is not None and proxy.item is item:
+                _ItemProxyCache._proxies.move_to_end(key)
+                return proxy
+        proxy = cls(item, *args)
+        with _ItemProxyCache._lock:
+            _ItemProxyCache._proxies[key] = proxy
+            _ItemProxyCache._proxies.move_to_end(key)
+            if len(_ItemProxyCache._proxies) > _ItemProxyCache.MAX_SIZE:
+                _ItemProxyCache._proxies.popitem(last=False)
+        return proxy
+
 class ItemSemantic(Java_Semantics if TYPE_CHECKING else _JavaCallProxy):
     def __init__(self, item: Item):
         super().__init__(Java_Semantics, lambda *args: tuple([item]) + args)
+        self.item = item
 
 class ItemPersistence(Java_PersistenceExtensions if TYPE_CHECKING else _JavaCallProxy):
     def __init__(self, item: Item, service_id: str | None = None):
         super().__init__(Java_PersistenceExtensions, lambda *args: tuple([item]) + args + tuple([] if service_id is None else [service_id]) )
+        self.item = item
+        self.service_id = service_id
+
+    def _bind(self, name: str, attr: Callable) -> Callable:
+        func = super()._bind(name, attr)
+        if name.startswith(_PersistenceCache.CACHEABLE_PREFIXES):
+            def query(*args):
+                if _PersistenceCache._enabled:
+                    return _PersistenceCache.call(self.item, self.service_id, name, func, args)
+                return func(*args)
+            return query
+        if name in _PersistenceCache.MODIFYING_METHODS:
+            def modify(*args):
+                try:
+                    return func(*args)
+                finally:
+                    if _PersistenceCache._enabled:
+                        _PersistenceCache.invalidate(self.item.getName())
+            return modify
+        return func
 
-    def getStableMinMaxState(self, time_slot: int, end_time: datetime | None = None) -> tuple[Java_DecimalType,Java_DecimalType,Java_DecimalType]:
-        current_end_time = datetime.now().astimezone() if end_time is None else end_time
-        min_time = current_end_time - timedelta(seconds=time_slot)
+    @staticmethod
+    def enableCache(ttl: float = 10, max_size: int = 1000, time_bucket: float = 10):
+        _PersistenceCache.enable(ttl, max_size, time_bucket)
+
+    @staticmethod
+    def disableCache():
+        _PersistenceCache.disable()
 
-        min_value = max_value = None
-        value = duration = 0.0
+    @staticmethod
+    def getCacheStats() -> dict[str, Any]:
+        return _PersistenceCache.getStats()
 
-        entry = self.persistedState(current_end_time)
+    def getStableMinMaxState(self, time_slot: int, end_time: datetime | None = None) -> tuple[Java_DecimalType,Java_DecimalType,Java_DecimalType]:
+        statistics = self.getStableStatistics(time_slot, end_time)
+        return ( Java_DecimalType(statistics['average']), Java_DecimalType(statistics['min']), Java_DecimalType(statistics['max']) )
+
+    def getStableStatistics(self, time_slot: int, end_time: datetime | None = None) -> dict[str, float]:
+        end_time = datetime.now().astimezone() if end_time is None else ( end_time.astimezone() if end_time.tzinfo is None else end_time )
+        start_time = end_time - timedelta(seconds=time_slot)
+
+        timestamps, values = self._getWindow(start_time, end_time)
+        if len(values) == 0:
+            raise NotFoundException("No persisted state for {} found".format(self.item.getName()))
+        timestamps.append(end_time.timestamp())
+        return _timeWeightedStatistics(timestamps, values)
+
+    def getRollingWindow(self, time_slot: int, max_segments: int = 10000) -> 'RollingWindow':
+        return _RollingWindowRegistry.get(self, time_slot, max_segments)
+
+    def _getWindow(self, start_time: datetime, end_time: datetime) -> tuple[array, array]:
+        # start timestamps and values of all states, which are valid between start_time and end_time
+        start_timestamp = start_time.timestamp()
+        end_timestamp = end_time.timestamp()
+
+        timestamps = array('d')
+        values = array('d')
+
+        entry = self.persistedState(start_time)
+        if entry is not None:
+            timestamps.append(start_timestamp)
+            values.append(entry.getState().doubleValue())
+
+        for entry in self.getAllStatesBetween(start_time, end_time):
+            timestamp = entry.getTimestamp().timestamp()
+            if timestamp > end_timestamp:
+                break
+            value = entry.getState().doubleValue()
+            if timestamp <= start_timestamp or ( len(timestamps) > 0 and timestamp <= timestamps[-1] ):
+                if len(values) == 0:
+                    timestamps.append(start_timestamp)
+                    values.append(value)
+                else:
+                    values[-1] = value
+                continue
+            timestamps.append(timestamp)
+            values.append(value)
+        return timestamps, values
 
-        while True:
-            currentStartTime = entry.getTimestamp()
+    def getStableState(self, time_slot: int, end_time: datetime | None = None) -> Java_DecimalType:
+        value, _, _ = self.getStableMinMaxState(time_slot, end_time)
+        return value
 
-            if currentStartTime < min_time:
-                currentStartTime = min_time
+    def iterStates(self, start_time: datetime, end_time: datetime | None = None, chunk: int = 10000) -> Iterator[tuple[array, array]]:
+        if chunk <= 0:
+            raise ValueError("chunk must be greater than 0")
 
-            _duration = ( currentStartTime - current_end_time ).total_seconds()
-            _value = entry.getState().doubleValue()
+        service = self._getQueryableService()
 
-            if min_value is None or min_value > _value:
-                min_value = _value
-            if max_value is None or max_value < _value:
-                max_value = _value
+        criteria = Java_FilterCriteria()
+        criteria.setItemName(self.item.getName())
+        criteria.setBeginDate(start_time.astimezone() if start_time.tzinfo is None else start_time)
+        criteria.setEndDate(datetime.now().astimezone() if end_time is None else ( end_time.astimezone() if end_time.tzinfo is None else end_time ))
+        criteria.setOrdering(Java_FilterCriteria.Ordering.ASCENDING)
 
-            duration = duration + _duration
-            value = value + ( _value * _duration )
+        # keyset paging, every query starts at the last returned timestamp. Services are often ignoring the page number, but not the begin date.
+        # every page is converted into compact arrays, without keeping the HistoricItem proxies
+        criteria.setPageNumber(0)
+        last_timestamp = None
+        # number of already returned states with 'last_timestamp'. The begin date is inclusive, so they are part of the next page again
+        skip = 0
+        while True:
+            page_size = chunk + skip
+            criteria.setPageSize(page_size)
+            timestamps = array('d')
+            values = array('d')
+            size = 0
+            seen = 0
+            for entry in service.query(criteria):
+                size += 1
+                timestamp = entry.getTimestamp().timestamp()
+                if last_timestamp is not None and timestamp <= last_timestamp:
+                    if timestamp < last_timestamp:
+                        continue
+                    seen += 1
+                    if seen <= skip:
+                        continue
+                timestamps.append(timestamp)
+                values.append(Registry._toFloat(entry.getState()))
+            if len(timestamps) == 0:
+                if size >= page_size:
+                    raise Exception("Persistence service {} returns no states after {}".format(service.getId(), datetime.fromtimestamp(last_timestamp)))
+                break
 
-            current_end_time = currentStartTime - timedelta(microseconds=1)
-            if current_end_time < min_time:
+            if timestamps[-1] == last_timestamp:
+                skip += len(timestamps)
+            else:
+                last_timestamp = timestamps[-1]
+                skip = 0
+                for timestamp in reversed(timestamps):
+                    if timestamp != last_timestamp:
+                        break
+                    skip += 1
+            yield timestamps, values
+            if size < page_size:
                 break
+            criteria.setBeginDate(datetime.fromtimestamp(last_timestamp).astimezone())
+
+    def exportStates(self, path: str, start_time: datetime, end_time: datetime | None = None, format: str = "csv", chunk: int = 10000) -> int:
+        if format not in _StateWriter.FORMATS:
+            raise ValueError("Unsupported format '{}'. Supported formats are {}".format(format, ", ".join(_StateWriter.FORMATS)))
+
+        count = 0
+        with _StateWriter.FORMATS[format](path) as writer:
+            for timestamps, values in self.iterStates(start_time, end_time, chunk):
+                writer.write(timestamps, values)
+                count += len(timestamps)
+        return count
+
+    def _getQueryableService(self) -> Java_QueryablePersistenceService:
+        service = PERSISTENCE_SERVICE_REGISTRY.getDefault() if self.service_id is None else PERSISTENCE_SERVICE_REGISTRY.get(self.service_id)
+        if service is None:
+            raise NotFoundException("Persistence service {} not found".format("default" if self.service_id is None else self.service_id))
+        if not java.instanceof(service, Java_QueryablePersistenceService):
+            raise Exception("Persistence service {} is not queryable".format(service.getId()))
+        return service
+
+class _StateWriter():
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def open(self):
+        raise NotImplementedError()
+
+    def write(self, timestamps: array, values: array):
+        raise NotImplementedError()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class _CSVStateWriter(_StateWriter):
+    def open(self):
+        self.file = open(self.path, "w")
+        self.file.write("timestamp,value\n")
+
+    def write(self, timestamps: array, values: array):
+        self.file.write("".join("{!r},{!r}\n".format(timestamp, value) for timestamp, value in zip(timestamps, values)))
+
+class _NPYStateWriter(_StateWriter):
+    # the header is rewritten with the final shape, after all rows are written. Its size is fixed to 128 bytes.
+    HEADER_SIZE = 128
+
+    def open(self):
+        self.file = open(self.path, "wb")
+        self.rows = 0
+        self._writeHeader()
+
+    def _writeHeader(self):
+        header = "{{'descr': '<f8', 'fortran_order': False, 'shape': ({}, 2), }}".format(self.rows)
+        header = header.ljust(_NPYStateWriter.HEADER_SIZE - 10 - 1) + "\n"
+        self.file.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1"))
+
+    def write(self, timestamps: array, values: array):
+        rows = array('d', [0.0]) * (len(timestamps) * 2)
+        rows[0::2] = timestamps
+        rows[1::2] = values
+        if sys.byteorder != "little":
+            rows.byteswap()
+        self.file.write(rows.tobytes())
+        self.rows += len(timestamps)
+
+    def close(self):
+        if self.file is not None:
+            self.file.seek(0)
+            self._writeHeader()
+        super().close()
+
+class _ArrowStateWriter(_StateWriter):
+    def open(self):
+        if pa is None:
+            raise Exception("Arrow export needs the python module 'pyarrow'")
+        self.schema = pa.schema([("timestamp", pa.float64()), ("value", pa.float64())])
+        self.file = pa.ipc.new_file(self.path, self.schema)
+
+    def write(self, timestamps: array, values: array):
+        self.file.write_batch(pa.record_batch([pa.array(timestamps, pa.float64()), pa.array(values, pa.float64())], schema=self.schema))
+
+_StateWriter.FORMATS = {"csv": _CSVStateWriter, "npy": _NPYStateWriter, "arrow": _ArrowStateWriter}
+
+class _Resampler():
+    METHODS = ("last", "mean", "time_weighted")
+
+    def __init__(self, start: float, end: float, step: float, method: str, initial_value: float):
+        self.start = start
+        self.end = end
+        self.step = step
+        self.method = method
+        self.size = max(0, math.ceil((end - start) / step))
+        self.result = array('d', [float("nan")]) * self.size
+
+        self._bucket = 0
+        self._time = start
+        self._value = initial_value
+        self._sum = 0.0
+        self._weight = 0.0
+
+    def _advance(self, timestamp: float):
+        # close all buckets, which are ending before or at 'timestamp'
+        while self._bucket < self.size:
+            bucket_end = min(self.start + (self._bucket + 1) * self.step, self.end)
+            if timestamp < bucket_end:
+                self._accumulate(timestamp)
+                return
+            self._accumulate(bucket_end)
+            if self.method == "last":
+                self.result[self._bucket] = self._value
+            elif self._weight > 0:
+                self.result[self._bucket] = self._sum / self._weight
+            self._sum = self._weight = 0.0
+            self._bucket += 1
+
+    def _accumulate(self, timestamp: float):
+        if self.method == "time_weighted" and timestamp > self._time and not math.isnan(self._value):
+            self._sum += self._value * ( timestamp - self._time )
+            self._weight += timestamp - self._time
+        self._time = max(self._time, timestamp)
+
+    def add(self, timestamp: float, value: float):
+        if timestamp > self.start:
+            self._advance(timestamp)
+        self._value = value
+        if self.method == "mean" and timestamp >= self.start and not math.isnan(value):
+            self._sum += value
+            self._weight += 1
+
+    def finish(self) -> array:
+        self._advance(self.end)
+        return self.result
+
+def _lttb(timestamps: array, values: array, threshold: int) -> tuple[array, array]:
+    # Largest-Triangle-Three-Buckets, keeps the first and last point and one point with the largest triangle area per bucket
+    length = len(values)
+    if threshold >= length or threshold < 3:
+        return array('d', timestamps), array('d', values)
+
+    sampled_timestamps = array('d', [timestamps[0]])
+    sampled_values = array('d', [values[0]])
+    bucket_size = ( length - 2 ) / ( threshold - 2 )
+    a = 0
+    for i in range(threshold - 2):
+        # average of the next bucket
+        next_start = int(( i + 1 ) * bucket_size) + 1
+        next_end = min(int(( i + 2 ) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_timestamp = sum(timestamps[next_start:next_end]) / next_count
+        avg_value = sum(values[next_start:next_end]) / next_count
+
+        a_timestamp = timestamps[a]
+        a_value = values[a]
+        max_area = -1.0
+        selected = a
+        for j in range(int(i * bucket_size) + 1, int(( i + 1 ) * bucket_size) + 1):
+            area = abs(( a_timestamp - avg_timestamp ) * ( values[j] - a_value ) - ( a_timestamp - timestamps[j] ) * ( avg_value - a_value ))
+            if area > max_area:
+                max_area = area
+                selected = j
+        sampled_timestamps.append(timestamps[selected])
+        sampled_values.append(values[selected])
+        a = selected
+
+    sampled_timestamps.append(timestamps[-1])
+    sampled_values.append(values[-1])
+    return sampled_timestamps, sampled_values
+
+class Persistence():
+    @staticmethod
+    def _toTimestamp(value: datetime | None) -> datetime:
+        if value is None:
+            return datetime.now().astimezone()
+        return value.astimezone() if value.tzinfo is None else value
 
-            entry = self.persistedState(current_end_time)
+    @staticmethod
+    def resample(items: list[Union[str, Item]], start_time: datetime, end_time: datetime | None = None, step: Union[int, float, timedelta] = 60, method: str = "last", service_id: str | None = None, chunk: int = 10000) -> dict[str, Any]:
+        if method not in _Resampler.METHODS:
+            raise ValueError("Unsupported method '{}'. Supported methods are {}".format(method, ", ".join(_Resampler.METHODS)))
+        step = step.total_seconds() if isinstance(step, timedelta) else float(step)
+        if step <= 0:
+            raise ValueError("step must be greater than 0")
+
+        start_time = Persistence._toTimestamp(start_time)
+        end_time = Persistence._toTimestamp(end_time)
+        start = start_time.timestamp()
+        end = end_time.timestamp()
+
+        result = {}
+        for item in items:
+            if isinstance(item, str):
+                item = Registry.getItem(item)
+            persistence = item.getPersistence(service_id)
+
+            entry = persistence.persistedState(start_time)
+            resampler = _Resampler(start, end, step, method, float("nan") if entry is None else Registry._toFloat(entry.getState()))
+            # every item is processed in one pass over its persisted states, directly into the shared grid
+            for timestamps, values in persistence.iterStates(start_time, end_time, chunk):
+                for timestamp, value in zip(timestamps, values):
+                    resampler.add(timestamp, value)
+            result[item.getName()] = resampler.finish()
+
+        size = max(0, math.ceil((end - start) / step))
+        return {"timestamps": array('d', (start + i * step for i in range(size))), "values": result}
 
-        return ( Java_DecimalType(value / duration), Java_DecimalType(min_value), Java_DecimalType(max_value) )
+    @staticmethod
+    def downsample(timestamps: Union[array, list[float]], values: Union[array, list[float]], threshold: int) -> tuple[array, array]:
+        if len(timestamps) != len(values):
+            raise ValueError("timestamps and values must have the same length")
+        return _lttb(timestamps, values, threshold)
 
-    def getStableState(self, time_slot: int, end_time: datetime | None = None) -> Java_DecimalType:
-        value, _, _ = self.getStableMinMaxState(time_slot, end_time)
-        return value
+    @staticmethod
+    def getDownsampledStates(item: Union[str, Item], start_time: datetime, end_time: datetime | None = None, threshold: int = 1000, service_id: str | None = None) -> tuple[array, array]:
+        if isinstance(item, str):
+            item = Registry.getItem(item)
+        timestamps = array('d')
+        values = array('d')
+        for _timestamps, _values in item.getPersistence(service_id).iterStates(start_time, end_time):
+            timestamps.extend(_timestamps)
+            values.extend(_values)
+        return _lttb(timestamps, values, threshold)
+
+class RollingWindow():
+    def __init__(self, item_name: str, time_slot: int, max_segments: int = 10000):
+        self.item_name = item_name
+        self.time_slot = time_slot
+        self.max_segments = max_segments
+
+        self._lock = threading.Lock()
+        # (start timestamp, value, sequence) of all states in the window. The last one is still open.
+        self._segments = deque()
+        self._sequence = 0
+        # monotonic queues of (sequence, value) for min and max
+        self._min_queue = deque()
+        self._max_queue = deque()
+        # aggregates of all closed segments
+        self._integral = 0.0
+        self._square_integral = 0.0
+        self._duration = 0.0
+
+    def add(self, value: float, timestamp: float | None = None):
+        if value != value: # NaN, e.g. UNDEF
+            return
+        timestamp = time.time() if timestamp is None else timestamp
+
+        with self._lock:
+            if len(self._segments) > 0:
+                last_start, last_value, _ = self._segments[-1]
+                if value == last_value:
+                    return
+                if timestamp < last_start:
+                    timestamp = last_start
+                duration = timestamp - last_start
+                self._integral += last_value * duration
+                self._square_integral += last_value * last_value * duration
+                self._duration += duration
+
+            self._sequence += 1
+            self._segments.append((timestamp, value, self._sequence))
+            while len(self._min_queue) > 0 and self._min_queue[-1][1] >= value:
+                self._min_queue.pop()
+            self._min_queue.append((self._sequence, value))
+            while len(self._max_queue) > 0 and self._max_queue[-1][1] <= value:
+                self._max_queue.pop()
+            self._max_queue.append((self._sequence, value))
+
+            while len(self._segments) > self.max_segments:
+                self._evictFirst()
+
+    def _evictFirst(self):
+        start, value, sequence = self._segments.popleft()
+        duration = self._segments[0][0] - start
+        self._integral -= value * duration
+        self._square_integral -= value * value * duration
+        self._duration -= duration
+        if self._min_queue[0][0] == sequence:
+            self._min_queue.popleft()
+        if self._max_queue[0][0] == sequence:
+            self._max_queue.popleft()
+
+    def getStatistics(self, now: float | None = None) -> dict[str, float]:
+        now = time.time() if now is None else now
+        window_start = now - self.time_slot
+
+        with self._lock:
+            if len(self._segments) == 0:
+                raise NotFoundException("No state for {} available".format(self.item_name))
+
+            while len(self._segments) > 1 and self._segments[1][0] <= window_start:
+                self._evictFirst()
+
+            integral = self._integral
+            square_integral = self._square_integral
+            duration = self._duration
+
+            # first closed segment can start before the window
+            first_start, first_value, _ = self._segments[0]
+            if len(self._segments) > 1 and first_start < window_start:
+                cut = window_start - first_start
+                integral -= first_value * cut
+                square_integral -= first_value * first_value * cut
+                duration -= cut
+
+            last_start, last_value, _ = self._segments[-1]
+            open_duration = max(0.0, now - max(last_start, window_start))
+            integral += last_value * open_duration
+            square_integral += last_value * last_value * open_duration
+            duration += open_duration
+
+            average = integral / duration if duration > 0 else last_value
+            variance = square_integral / duration - average * average if duration > 0 else 0.0
+
+            return {
+                "average": average,
+                "min": self._min_queue[0][1],
+                "max": self._max_queue[0][1],
+                "stddev": math.sqrt(max(variance, 0.0)),
+                "integral": integral,
+                "duration": duration,
+                "count": len(self._segments)
+            }
+
+    def getAverage(self) -> float:
+        return self.getStatistics()['average']
+
+class _RollingWindowRegistry():
+    _lock = threading.Lock()
+    _windows: dict[tuple[str, int, str | None], RollingWindow] = {}
+    _windows_by_item: dict[str, list[RollingWindow]] = {}
+
+    @staticmethod
+    def get(persistence: 'ItemPersistence', time_slot: int, max_segments: int) -> RollingWindow:
+        item_name = persistence.item.getName()
+        key = (item_name, time_slot, persistence.service_id)
+        with _RollingWindowRegistry._lock:
+            window = _RollingWindowRegistry._windows.get(key)
+            if window is not None:
+                return window
+
+            window = RollingWindow(item_name, time_slot, max_segments)
+            end_time = datetime.now().astimezone()
+            timestamps, values = persistence._getWindow(end_time - timedelta(seconds=time_slot), end_time)
+            for timestamp, value in zip(timestamps, values):
+                window.add(value, timestamp)
+            # changes between loading and subscribing are covered by the current state
+            window.add(Registry._toFloat(persistence.item.getState()))
+
+            _RollingWindowRegistry._windows[key] = window
+            _RollingWindowRegistry._windows_by_item.setdefault(item_name, []).append(window)
+            _EventDispatcher.subscribe("ItemStateChangedEvent", _RollingWindowRegistry._onStateChanged)
+            return window
+
+    @staticmethod
+    def _onStateChanged(event):
+        windows = _RollingWindowRegistry._windows_by_item.get(event.getItemName())
+        if windows is None:
+            return
+        value = Registry._toFloat(event.getItemState())
+        for window in windows:
+            window.add(value)
 
 class ItemMetadata():
     def __init__(self, item):
         self.item = item
 
     def get(self, namespace: str) -> Java_Metadata:
+        if _MetadataIndex.isEnabled():
+            return _MetadataIndex.get(self.item.getName(), namespace)
         return METADATA_REGISTRY.get(Java_MetadataKey(namespace, self.item.getName()))
 
     def set(self, namespace: str, value, configuration = None) -> Java_Metadata:
+        metadata = Java_Metadata(Java_MetadataKey(namespace, self.item.getName()), value, configuration)
         if self.get(namespace) is None:
-            return METADATA_REGISTRY.add(Java_Metadata(Java_MetadataKey(namespace, self.item.getName()), value, configuration))
+            return METADATA_REGISTRY.add(metadata)
         else:
-            return METADATA_REGISTRY.update(Java_Metadata(Java_MetadataKey(namespace, self.item.getName()), value, configuration))
+            return METADATA_REGISTRY.update(metadata)
 
     def remove(self, namespace: str) -> Java_Metadata:
         return METADATA_REGISTRY.remove(Java_MetadataKey(namespace, self.item.getName()))
@@ -468,6 +2655,516 @@ class ItemMetadata():
     def removeAll(self):
         METADATA_REGISTRY.removeItemMetadata(self.item.getName())
 
+class _MetadataIndex():
+    _lock = threading.RLock()
+    _by_namespace: dict[str, dict[str, Java_Metadata]] = {}
+    _by_item: dict[str, dict[str, Java_Metadata]] = {}
+    _listener = None
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return _MetadataIndex._listener is not None
+
+    @staticmethod
+    def enable():
+        with _MetadataIndex._lock:
+            if _MetadataIndex._listener is not None:
+                return
+
+            class RegistryChangeListener(Java_RegistryChangeListener):
+                def added(self, element):
+                    _MetadataIndex._add(element)
+
+                def removed(self, element):
+                    _MetadataIndex._remove(element)
+
+                def updated(self, old_element, element):
+                    with _MetadataIndex._lock:
+                        _MetadataIndex._remove(old_element)
+                        _MetadataIndex._add(element)
+
+            # listener first, to not miss changes during the initial load
+            _MetadataIndex._listener = RegistryChangeListener()
+            METADATA_REGISTRY.addRegistryChangeListener(_MetadataIndex._listener)
+            scope.lifecycleTracker.addDisposeHook(_MetadataIndex.disable)
+
+            for metadata in METADATA_REGISTRY.getAll():
+                _MetadataIndex._add(metadata)
+
+    @staticmethod
+    def disable():
+        with _MetadataIndex._lock:
+            if _MetadataIndex._listener is None:
+                return
+            METADATA_REGISTRY.removeRegistryChangeListener(_MetadataIndex._listener)
+            _MetadataIndex._listener = None
+            _MetadataIndex._by_namespace = {}
+            _MetadataIndex._by_item = {}
+
+    @staticmethod
+    def _add(metadata: Java_Metadata):
+        key = metadata.getUID()
+        namespace = key.getNamespace()
+        item_name = key.getItemName()
+        with _MetadataIndex._lock:
+            _MetadataIndex._by_namespace.setdefault(namespace, {})[item_name] = metadata
+            _MetadataIndex._by_item.setdefault(item_name, {})[namespace] = metadata
+
+    @staticmethod
+    def _remove(metadata: Java_Metadata):
+        key = metadata.getUID()
+        namespace = key.getNamespace()
+        item_name = key.getItemName()
+        with _MetadataIndex._lock:
+            items = _MetadataIndex._by_namespace.get(namespace)
+            if items is not None:
+                items.pop(item_name, None)
+                if len(items) == 0:
+                    del _MetadataIndex._by_namespace[namespace]
+            namespaces = _MetadataIndex._by_item.get(item_name)
+            if namespaces is not None:
+                namespaces.pop(namespace, None)
+                if len(namespaces) == 0:
+                    del _MetadataIndex._by_item[item_name]
+
+    @staticmethod
+    def get(item_name: str, namespace: str) -> Java_Metadata | None:
+        return _MetadataIndex._by_item.get(item_name, {}).get(namespace)
+
+class MetadataTransaction():
+    def __init__(self):
+        self._operations = []
+
+    def set(self, item_name: str, namespace: str, value: str, configuration: dict[str, Any] | None = None) -> 'MetadataTransaction':
+        self._operations.append((item_name, namespace, value, configuration))
+        return self
+
+    def remove(self, item_name: str, namespace: str) -> 'MetadataTransaction':
+        self._operations.append((item_name, namespace, None, None))
+        return self
+
+    def commit(self) -> dict[str, int]:
+        _MetadataIndex.enable()
+
+        operations = self._operations
+        self._operations = []
+
+        # already applied operations are reverted, if a later one fails
+        undo = []
+        result = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        try:
+            for item_name, namespace, value, configuration in operations:
+                existing = _MetadataIndex.get(item_name, namespace)
+                if value is None:
+                    if existing is None:
+                        result["unchanged"] += 1
+                    else:
+                        METADATA_REGISTRY.remove(existing.getUID())
+                        undo.append(lambda existing=existing: METADATA_REGISTRY.add(existing))
+                        result["removed"] += 1
+                    continue
+
+                metadata = Java_Metadata(Java_MetadataKey(namespace, item_name), value, configuration)
+                if existing is None:
+                    METADATA_REGISTRY.add(metadata)
+                    undo.append(lambda metadata=metadata: METADATA_REGISTRY.remove(metadata.getUID()))
+                    result["added"] += 1
+                elif existing.getValue() != metadata.getValue() or not existing.getConfiguration().equals(metadata.getConfiguration()):
+                    METADATA_REGISTRY.update(metadata)
+                    undo.append(lambda existing=existing: METADATA_REGISTRY.update(existing))
+                    result["updated"] += 1
+                else:
+                    result["unchanged"] += 1
+        except Exception:
+            for revert in reversed(undo):
+                try:
+                    revert()
+                except Exception as e:
+                    logger.error("Metadata rollback failed: " + builtins.__formatTraceback__(e))
+            raise
+        return result
+
+    def rollback(self):
+        self._operations = []
+
+    def __enter__(self) -> 'MetadataTransaction':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+class Metadata():
+    @staticmethod
+    def enableIndex():
+        _MetadataIndex.enable()
+
+    @staticmethod
+    def disableIndex():
+        _MetadataIndex.disable()
+
+    @staticmethod
+    def get(item_name: str, namespace: str) -> Java_Metadata | None:
+        _MetadataIndex.enable()
+        return _MetadataIndex.get(item_name, namespace)
+
+    @staticmethod
+    def getAll(namespace: str) -> dict[str, Java_Metadata]:
+        _MetadataIndex.enable()
+        with _MetadataIndex._lock:
+            return dict(_MetadataIndex._by_namespace.get(namespace, {}))
+
+    @staticmethod
+    def getNamespaces(item_name: str) -> dict[str, Java_Metadata]:
+        _MetadataIndex.enable()
+        with _MetadataIndex._lock:
+            return dict(_MetadataIndex._by_item.get(item_name, {}))
+
+    @staticmethod
+    def itemsWith(namespace: str, value: str | None = None) -> list[str]:
+        _MetadataIndex.enable()
+        with _MetadataIndex._lock:
+            items = _MetadataIndex._by_namespace.get(namespace, {})
+            if value is None:
+                return list(items.keys())
+            return [item_name for item_name, metadata in items.items() if metadata.getValue() == value]
+
+    @staticmethod
+    def transaction() -> MetadataTransaction:
+        return MetadataTransaction()
+
+class _LinkIndex():
+    _lock = threading.RLock()
+    _item_links: dict[str, dict[str, Java_ItemChannelLink]] = {}
+    _channel_items: dict[str, set[str]] = {}
+    _thing_channels: dict[str, set[str]] = {}
+    _things: dict[str, Java_Thing] = {}
+    _channels: dict[str, Java_Channel] = {}
+    _link_listener = None
+    _thing_listener = None
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return _LinkIndex._link_listener is not None
+
+    @staticmethod
+    def enable():
+        with _LinkIndex._lock:
+            if _LinkIndex._link_listener is not None:
+                return
+
+            class LinkChangeListener(Java_RegistryChangeListener):
+                def added(self, element):
+                    _LinkIndex._addLink(element)
+
+                def removed(self, element):
+                    _LinkIndex._removeLink(element)
+
+                def updated(self, old_element, element):
+                    with _LinkIndex._lock:
+                        _LinkIndex._removeLink(old_element)
+                        _LinkIndex._addLink(element)
+
+            class ThingChangeListener(Java_RegistryChangeListener):
+                def added(self, element):
+                    _LinkIndex._addThing(element)
+
+                def removed(self, element):
+                    _LinkIndex._removeThing(element)
+
+                def updated(self, old_element, element):
+                    with _LinkIndex._lock:
+                        _LinkIndex._removeThing(old_element)
+                        _LinkIndex._addThing(element)
+
+            # listeners first, to not miss changes during the initial load
+            _LinkIndex._link_listener = LinkChangeListener()
+            _LinkIndex._thing_listener = ThingChangeListener()
+            ITEM_CHANNEL_LINK_REGISTRY.addRegistryChangeListener(_LinkIndex._link_listener)
+            scope.things.addRegistryChangeListener(_LinkIndex._thing_listener)
+            scope.lifecycleTracker.addDisposeHook(_LinkIndex.disable)
+
+            for link in ITEM_CHANNEL_LINK_REGISTRY.getAll():
+                _LinkIndex._addLink(link)
+            for thing in scope.things.getAll():
+                _LinkIndex._addThing(thing)
+
+    @staticmethod
+    def disable():
+        with _LinkIndex._lock:
+            if _LinkIndex._link_listener is None:
+                return
+            ITEM_CHANNEL_LINK_REGISTRY.removeRegistryChangeListener(_LinkIndex._link_listener)
+            scope.things.removeRegistryChangeListener(_LinkIndex._thing_listener)
+            _LinkIndex._link_listener = None
+            _LinkIndex._thing_listener = None
+            _LinkIndex._item_links = {}
+            _LinkIndex._channel_items = {}
+            _LinkIndex._thing_channels = {}
+            _LinkIndex._things = {}
+            _LinkIndex._channels = {}
+
+    @staticmethod
+    def _addLink(link: Java_ItemChannelLink):
+        item_name = link.getItemName()
+        channel_uid = link.getLinkedUID()
+        channel_uid_str = channel_uid.getAsString()
+        with _LinkIndex._lock:
+            _LinkIndex._item_links.setdefault(item_name, {})[channel_uid_str] = link
+            _LinkIndex._channel_items.setdefault(channel_uid_str, set()).add(item_name)
+            _LinkIndex._thing_channels.setdefault(channel_uid.getThingUID().getAsString(), set()).add(channel_uid_str)
+
+    @staticmethod
+    def _removeLink(link: Java_ItemChannelLink):
+        item_name = link.getItemName()
+        channel_uid = link.getLinkedUID()
+        channel_uid_str = channel_uid.getAsString()
+        with _LinkIndex._lock:
+            links = _LinkIndex._item_links.get(item_name)
+            if links is not None:
+                links.pop(channel_uid_str, None)
+                if len(links) == 0:
+                    del _LinkIndex._item_links[item_name]
+
+            items = _LinkIndex._channel_items.get(channel_uid_str)
+            if items is not None:
+                items.discard(item_name)
+                if len(items) == 0:
+                    del _LinkIndex._channel_items[channel_uid_str]
+
+                    thing_uid_str = channel_uid.getThingUID().getAsString()
+                    channels = _LinkIndex._thing_channels.get(thing_uid_str)
+                    if channels is not None:
+                        channels.discard(channel_uid_str)
+                        if len(channels) == 0:
+                            del _LinkIndex._thing_channels[thing_uid_str]
+
+    @staticmethod
+    def _addThing(thing: Java_Thing):
+        channels = {channel.getUID().getAsString(): channel for channel in thing.getChannels()}
+        with _LinkIndex._lock:
+            _LinkIndex._things[thing.getUID().getAsString()] = thing
+            _LinkIndex._channels.update(channels)
+
+    @staticmethod
+    def _removeThing(thing: Java_Thing):
+        channel_uids = [channel.getUID().getAsString() for channel in thing.getChannels()]
+        with _LinkIndex._lock:
+            _LinkIndex._things.pop(thing.getUID().getAsString(), None)
+            for channel_uid_str in channel_uids:
+                _LinkIndex._channels.pop(channel_uid_str, None)
+
+    @staticmethod
+    def getLink(item_name: str, channel_uid: str) -> Java_ItemChannelLink | None:
+        return _LinkIndex._item_links.get(item_name, {}).get(channel_uid)
+
+    @staticmethod
+    def getItemLinks(item_name: str) -> list[Java_ItemChannelLink]:
+        with _LinkIndex._lock:
+            return list(_LinkIndex._item_links.get(item_name, {}).values())
+
+    @staticmethod
+    def getItemChannels(item_name: str) -> list[Java_Channel]:
+        with _LinkIndex._lock:
+            channel_uids = list(_LinkIndex._item_links.get(item_name, {}).keys())
+        return [_LinkIndex.getChannel(channel_uid) for channel_uid in channel_uids]
+
+    @staticmethod
+    def getItemThings(item_name: str) -> list[Java_Thing]:
+        with _LinkIndex._lock:
+            thing_uids = {link.getLinkedUID().getThingUID().getAsString() for link in _LinkIndex._item_links.get(item_name, {}).values()}
+            return [_LinkIndex._things[thing_uid] for thing_uid in thing_uids if thing_uid in _LinkIndex._things]
+
+    @staticmethod
+    def getChannel(channel_uid: str) -> Java_Channel:
+        channel = _LinkIndex._channels.get(channel_uid)
+        if channel is None:
+            raise NotFoundException("Channel {} not found".format(channel_uid))
+        return channel
+
+    @staticmethod
+    def getChannelItemNames(channel_uid: str) -> list[str]:
+        with _LinkIndex._lock:
+            return list(_LinkIndex._channel_items.get(channel_uid, set()))
+
+    @staticmethod
+    def getThingChannelUIDs(thing_uid: str) -> list[str]:
+        with _LinkIndex._lock:
+            return list(_LinkIndex._thing_channels.get(thing_uid, set()))
+
+    @staticmethod
+    def getThingItemNames(thing_uid: str) -> list[str]:
+        with _LinkIndex._lock:
+            item_names = set()
+            for channel_uid_str in _LinkIndex._thing_channels.get(thing_uid, set()):
+                item_names.update(_LinkIndex._channel_items.get(channel_uid_str, set()))
+            return list(item_names)
+
+class _ItemStateCache():
+    # only items, which are written by this script, are tracked. Own writes are pending until their state event is received,
+    # so that older state events are not overwriting them. Unconfirmed writes, e.g. rejected updates, are expiring after 'pending_timeout' seconds.
+    pending_timeout = 5.0
+
+    _lock = threading.Lock()
+    _states: dict[str, Any] = {}
+    _pending: dict[str, deque] = {}
+    _enabled = False
+
+    @staticmethod
+    def enable():
+        if _ItemStateCache._enabled:
+            return
+        _ItemStateCache._enabled = True
+        _EventDispatcher.subscribe("ItemStateChangedEvent", _ItemStateCache._onStateChanged)
+        _EventDispatcher.subscribe("ItemRemovedEvent", _ItemStateCache._onItemRemoved)
+
+    @staticmethod
+    def _onStateChanged(event):
+        item_name = event.getItemName()
+        with _ItemStateCache._lock:
+            if item_name not in _ItemStateCache._states:
+                return
+            state = event.getItemState()
+            pending = _ItemStateCache._pending.get(item_name)
+            if pending:
+                expired = time.monotonic() - _ItemStateCache.pending_timeout
+                while pending and pending[0][0] < expired:
+                    pending.popleft()
+                for index, (_, value) in enumerate(pending):
+                    if not _ItemStateCache.isDifferent(state, value):
+                        # all writes up to the confirmed one are done
+                        for _ in range(index + 1):
+                            pending.popleft()
+                        break
+                # the cache contains the latest own write, until it is confirmed
+                if pending:
+                    return
+            _ItemStateCache._states[item_name] = state
+
+    @staticmethod
+    def _onItemRemoved(event):
+        # topic => openhab/items/{itemName}/removed
+        item_name = event.getTopic().split("/")[2]
+        with _ItemStateCache._lock:
+            _ItemStateCache._states.pop(item_name, None)
+            _ItemStateCache._pending.pop(item_name, None)
+
+    @staticmethod
+    def get(item_name: str) -> Any:
+        with _ItemStateCache._lock:
+            pending = _ItemStateCache._pending.get(item_name)
+            if pending and pending[-1][0] < time.monotonic() - _ItemStateCache.pending_timeout:
+                # the latest own write was never confirmed, so the real item state is unknown
+                pending.clear()
+                _ItemStateCache._states[item_name] = None
+                return None
+            return _ItemStateCache._states.get(item_name)
+
+    @staticmethod
+    def track(item_name: str, read_state: Callable) -> Any:
+        # the item is tracked before its state is read, to not miss a state event in between
+        with _ItemStateCache._lock:
+            _ItemStateCache._states.setdefault(item_name, None)
+        state = read_state()
+        with _ItemStateCache._lock:
+            if _ItemStateCache._states.get(item_name) is None:
+                _ItemStateCache._states[item_name] = state
+            return _ItemStateCache._states[item_name]
+
+    @staticmethod
+    def set(item_name: str, state: Any):
+        with _ItemStateCache._lock:
+            _ItemStateCache._states[item_name] = state
+            _ItemStateCache._pending.setdefault(item_name, deque()).append((time.monotonic(), state))
+
+    @staticmethod
+    def isDifferent(current_state: Any, new_state: Any) -> bool:
+        # both states are either java states, received by an event, or values written by this script. They are normalized by
+        # the comparator of the java state, e.g. "ON" and OnOffType.ON or DecimalType 5 and QuantityType "5 °C" are equal
+        current_is_java = not isinstance(current_state, (str, int, float, datetime))
+        new_is_java = not isinstance(new_state, (str, int, float, datetime))
+        if new_is_java and (not current_is_java or (java.instanceof(new_state, Java_QuantityType) and not java.instanceof(current_state, Java_QuantityType))):
+            current_state, new_state = new_state, current_state
+            current_is_java = True
+        if current_is_java:
+            return Item._checkIfDifferent(current_state, new_state)
+
+        current_number = _StateComparator._toNumber(current_state)
+        new_number = _StateComparator._toNumber(new_state)
+        if current_number is not None and new_number is not None:
+            return current_number != new_number
+        return _StateComparator.compareFallback(current_state, new_state)
+
+class _ItemCache():
+    _lock = threading.Lock()
+    _items: dict[str, Item] = {}
+    _generation = 0
+    _listener = None
+    _dispose_hook_added = False
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return _ItemCache._listener is not None
+
+    @staticmethod
+    def enable():
+        with _ItemCache._lock:
+            if _ItemCache._listener is not None:
+                return
+
+            class RegistryChangeListener(Java_RegistryChangeListener):
+                def added(self, element):
+                    _ItemCache.invalidate(element.getName())
+
+                def removed(self, element):
+                    _ItemCache.invalidate(element.getName())
+
+                def updated(self, old_element, element):
+                    _ItemCache.invalidate(element.getName())
+
+            _ItemCache._listener = RegistryChangeListener()
+            scope.itemRegistry.addRegistryChangeListener(_ItemCache._listener)
+            if not _ItemCache._dispose_hook_added:
+                scope.lifecycleTracker.addDisposeHook(_ItemCache.disable)
+                _ItemCache._dispose_hook_added = True
+
+    @staticmethod
+    def disable():
+        with _ItemCache._lock:
+            if _ItemCache._listener is None:
+                return
+            scope.itemRegistry.removeRegistryChangeListener(_ItemCache._listener)
+            _ItemCache._listener = None
+            _ItemCache._items = {}
+            _ItemCache._generation += 1
+
+    @staticmethod
+    def invalidate(item_name: str):
+        with _ItemCache._lock:
+            _ItemCache._items.pop(item_name, None)
+            _ItemCache._generation += 1
+
+    @staticmethod
+    def get(item_name: str) -> Item:
+        item = _ItemCache._items.get(item_name)
+        with _ItemCache._lock:
+            if item is not None:
+                _ItemCache.hits += 1
+                return item
+            _ItemCache.misses += 1
+            generation = _ItemCache._generation
+
+        item = scope.itemRegistry.getItem(item_name)
+        with _ItemCache._lock:
+            # skip caching, if the registry was changed in the meantime
+            if generation == _ItemCache._generation and _ItemCache._listener is not None:
+                _ItemCache._items[item_name] = item
+        return item
+
 class Registry():
     @staticmethod
     def getThings() -> list[Java_Thing]:
@@ -475,18 +3172,92 @@ class Registry():
 
     @staticmethod
     def getThing(uid: str) -> Java_Thing:
-        thing = scope.things.get(Java_ThingUID(uid))
+        thing = _LinkIndex._things.get(uid) if _LinkIndex.isEnabled() else None
+        if thing is None:
+            thing = scope.things.get(Java_ThingUID(uid))
         if thing is None:
             raise NotFoundException("Thing {} not found".format(uid))
         return thing
 
     @staticmethod
     def getChannel(uid: str) -> Java_Channel:
-        channel = scope.things.getChannel(Java_ChannelUID(uid))
+        channel = _LinkIndex._channels.get(uid) if _LinkIndex.isEnabled() else None
+        if channel is None:
+            channel = scope.things.getChannel(Java_ChannelUID(uid))
         if channel is None:
             raise NotFoundException("Channel {} not found".format(uid))
         return channel
 
+    @staticmethod
+    def enableLinkIndex():
+        _LinkIndex.enable()
+
+    @staticmethod
+    def disableLinkIndex():
+        _LinkIndex.disable()
+
+    @staticmethod
+    def getChannelItemNames(channel_uid: str) -> list[str]:
+        _LinkIndex.enable()
+        return _LinkIndex.getChannelItemNames(channel_uid)
+
+    @staticmethod
+    def getThingChannelUIDs(thing_uid: str) -> list[str]:
+        _LinkIndex.enable()
+        return _LinkIndex.getThingChannelUIDs(thing_uid)
+
+    @staticmethod
+    def getThingItemNames(thing_uid: str) -> list[str]:
+        _LinkIndex.enable()
+        return _LinkIndex.getThingItemNames(thing_uid)
+
+    @staticmethod
+    def reconcileLinks(desired_links: list[tuple], managed_items: list[str] | None = None, dry_run: bool = False) -> dict[str, Any]:
+        _LinkIndex.enable()
+
+        desired = {}
+        for entry in desired_links:
+            item_name, channel_uid = entry[0], entry[1]
+            link_config = entry[2] if len(entry) > 2 and entry[2] is not None else {}
+            desired.setdefault(item_name, {})[Java_ChannelUID(channel_uid).getAsString()] = link_config
+
+        # links of other items are never touched
+        if managed_items is None:
+            managed_items = list(desired.keys())
+
+        to_add = []
+        to_update = []
+        to_remove = []
+        unchanged = 0
+        for item_name in set(managed_items) | set(desired.keys()):
+            existing_links = {link.getLinkedUID().getAsString(): link for link in _LinkIndex.getItemLinks(item_name)}
+            for channel_uid, link_config in desired.get(item_name, {}).items():
+                config = Configuration(link_config)
+                link = existing_links.pop(channel_uid, None)
+                if link is None:
+                    to_add.append(Java_ItemChannelLink(item_name, Java_ChannelUID(channel_uid), config))
+                elif not link.getConfiguration().equals(config):
+                    to_update.append(Java_ItemChannelLink(item_name, Java_ChannelUID(channel_uid), config))
+                else:
+                    unchanged += 1
+            if item_name in managed_items:
+                to_remove.extend(existing_links.values())
+
+        if not dry_run:
+            for link in to_remove:
+                ITEM_CHANNEL_LINK_REGISTRY.remove(link.getUID())
+            for link in to_update:
+                ITEM_CHANNEL_LINK_REGISTRY.update(link)
+            for link in to_add:
+                ITEM_CHANNEL_LINK_REGISTRY.add(link)
+
+        return {
+            "added": [link.getUID() for link in to_add],
+            "updated": [link.getUID() for link in to_update],
+            "removed": [link.getUID() for link in to_remove],
+            "unchanged": unchanged
+        }
+
     @staticmethod
     def getItems() -> list[Item]:
         return scope.itemRegistry.getItems()
@@ -502,15 +3273,110 @@ class Registry():
             state = default
         return state
 
+    @staticmethod
+    def getItemStates(names_or_pattern: Union[list[str], str], columnar: bool = False) -> dict[str, Any]:
+        if not isinstance(names_or_pattern, (str, list, tuple, set)):
+            raise Exception("Unsupported parameter type {}".format(type(names_or_pattern)))
+
+        if isinstance(names_or_pattern, str):
+            # all states are copied at once on the java side, so the matching names and their states are one consistent snapshot.
+            # Same pattern conversion as ItemRegistry.getItems(pattern), but applied to the copied names
+            states = Java_HashMap(scope.items)
+            regex = re.compile(names_or_pattern.replace("?", ".?").replace("*", ".*?"))
+            names = [item_name for item_name in states.keySet() if regex.fullmatch(item_name)]
+        else:
+            # only the requested names are looked up, instead of copying the states of all items
+            states = scope.items
+            names = list(names_or_pattern)
+
+        result = {}
+        for item_name in names:
+            state = states.get(item_name)
+            if state is None:
+                raise NotFoundException("Item {} not found".format(item_name))
+            result[item_name] = state
+
+        if not columnar:
+            return result
+
+        # the time of the last state update is not part of the state map and can't be fetched in bulk.
+        # It costs one item lookup (skipped if the item cache is enabled) and one getLastStateUpdate call per item
+        nan = float("nan")
+        values = array('d')
+        timestamps = array('d')
+        for item_name in names:
+            values.append(Registry._toFloat(result[item_name]))
+            last_update = Registry.getItem(item_name).getLastStateUpdate()
+            timestamps.append(nan if last_update is None else last_update.toEpochSecond() + last_update.getNano() / 1000000000)
+        return {"names": names, "values": values, "timestamps": timestamps}
+
+    @staticmethod
+    def _toFloat(state: Java_State) -> float:
+        if java.instanceof(state, Java_DecimalType) or java.instanceof(state, Java_QuantityType):
+            return state.doubleValue()
+        if java.instanceof(state, Java_UnDefType):
+            return float("nan")
+        # e.g. OnOffType, OpenClosedType or UpDownType
+        state = getattr(state, "as")(Java_DecimalType)
+        return float("nan") if state is None else state.doubleValue()
+
     @staticmethod
     def getItem(item_name: str) -> Item:
         if not isinstance(item_name, str):
             raise Exception("Unsupported parameter type {}".format(type(item_name)))
         try:
+            if _ItemCache.isEnabled():
+                return _ItemCache.get(item_name)
             return scope.itemRegistry.getItem(item_name)
         except Java_ItemNotFoundException:
             raise NotFoundException("Item {} not found".format(item_name))
 
+    @staticmethod
+    def enableItemCache():
+        _ItemCache.enable()
+
+    @staticmethod
+    def disableItemCache():
+        _ItemCache.disable()
+
+    @staticmethod
+    def getItemCacheStats() -> dict[str, Any]:
+        return {"enabled": _ItemCache.isEnabled(), "size": len(_ItemCache._items), "hits": _ItemCache.hits, "misses": _ItemCache.misses}
+
+    @staticmethod
+    def postUpdates(states: dict[str, Union[Java_State, int, float, str]], source: str | None = None) -> int:
+        return Registry._sendBulk(states, source, False)
+
+    @staticmethod
+    def sendCommands(commands: dict[str, Union[Java_State, int, float, str]], source: str | None = None) -> int:
+        return Registry._sendBulk(commands, source, True)
+
+    @staticmethod
+    def _sendBulk(states: dict[str, Any], source: str | None, is_command: bool) -> int:
+        _ItemStateCache.enable()
+
+        count = 0
+        for item_name, state in states.items():
+            item = None
+            current_state = _ItemStateCache.get(item_name)
+            if current_state is None:
+                item = Registry.getItem(item_name)
+                current_state = _ItemStateCache.track(item_name, item.getState)
+
+            if not _ItemStateCache.isDifferent(current_state, state):
+                continue
+
+            if item is None:
+                item = Registry.getItem(item_name)
+            if is_command:
+                # a command doesn't need to change the item state, e.g. with autoupdate=false
+                scope.events.sendCommand(item, state, source)
+            else:
+                scope.events.postUpdate(item, state, source)
+                _ItemStateCache.set(item_name, state)
+            count += 1
+        return count
+
     @staticmethod
     def resolveItem(item_or_item_name: Union[Item, str]) -> Item:
         if isinstance(item_or_item_name, Item):
@@ -1,36 +1,165 @@
 import java
 
-import uuid
+import itertools
 import re
+import time
+
+from inspect import signature
+from typing import Callable, Union
 
 from org.openhab.core.automation.util import ConditionBuilder as Java_ConditionBuilder, TriggerBuilder as Java_TriggerBuilder
 from org.openhab.core.config.core import Configuration as Java_Configuration
 from org.openhab.core.types import Command as Java_Command, State as Java_State
 
 
+# ids without a given name are temporary and marked with 'generated_id'. They are replaced by content derived ids, when the rule is created
+GENERATED_UID_PREFIX = "generated_"
+_generated_uid_counter = itertools.count(1)
+
+_INVALID_UID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+_VALID_UID_START = re.compile(r"^[A-Za-z0-9]")
+_MULTIPLE_UNDERSCORES = re.compile(r"__+")
+
 def validateUID(uid: str) -> str:
     if uid is None:
-        uid = uuid.uuid4().hex
-    else:
-        uid = re.sub(r"[^A-Za-z0-9_-]", "_", uid)
-        uid = "{}_{}".format(uid, uuid.uuid4().hex)
-    if not re.match("^[A-Za-z0-9]", uid):# in case the first character is still invalid
+        return "{}{}".format(GENERATED_UID_PREFIX, next(_generated_uid_counter))
+    uid = _INVALID_UID_CHARS.sub("_", uid)
+    if not _VALID_UID_START.match(uid):# in case the first character is still invalid
         uid = "{}_{}".format("jython", uid)
-    uid = re.sub(r"__+", "_", uid)
+    uid = _MULTIPLE_UNDERSCORES.sub("_", uid)
     return uid
 
+class _FilterPredicate():
+    def __init__(self, predicate: Callable):
+        self.predicate = predicate
+        self.accepted = 0
+        self.rejected = 0
+
+    def __call__(self, event) -> bool:
+        if self.predicate(event):
+            self.accepted += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def getStats(self) -> dict[str, int]:
+        return {"accepted": self.accepted, "rejected": self.rejected}
+
+class EventFilter():
+    # common predicates for the 'filter' argument of GenericEventTrigger and ItemEventTrigger. Each one is a function of the event.
+    @staticmethod
+    def wrap(predicate: Callable | None) -> _FilterPredicate | None:
+        if predicate is None or isinstance(predicate, _FilterPredicate):
+            return predicate
+        if not callable(predicate):
+            raise ValueError(u"Paramater invalid in call to EventFilter")
+        return _FilterPredicate(predicate)
+
+    @staticmethod
+    def _getValue(event):
+        for getter in ("getItemState", "getItemCommand", "getStatusInfo"):
+            if hasattr(event, getter):
+                value = getattr(event, getter)()
+                return value.getStatus() if getter == "getStatusInfo" else value
+        return None
+
+    @staticmethod
+    def _toFloat(value) -> float | None:
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return float(value.doubleValue())
+        except Exception:
+            return None
+
+    @staticmethod
+    def delta(threshold: float) -> Callable:
+        # numeric states, which differ by more than 'threshold' from the last accepted state of the same item. A slow drift is accepted, as soon as it sums up to the threshold
+        last_values = {}
+        def predicate(event) -> bool:
+            value = EventFilter._toFloat(EventFilter._getValue(event))
+            item_name = event.getItemName() if hasattr(event, "getItemName") else None
+            if item_name not in last_values and hasattr(event, "getOldItemState"):
+                last_values[item_name] = EventFilter._toFloat(event.getOldItemState())
+            previous = last_values.get(item_name)
+            # e.g. NULL or UNDEF is always a relevant change
+            if value is None or previous is None or abs(value - previous) > threshold:
+                last_values[item_name] = value
+                return True
+            return False
+        return predicate
+
+    @staticmethod
+    def stateMatches(regex: str) -> Callable:
+        pattern = re.compile(regex)
+        def predicate(event) -> bool:
+            value = EventFilter._getValue(event)
+            return value is not None and pattern.fullmatch(str(value)) is not None
+        return predicate
+
+    @staticmethod
+    def statusTransition(from_status: str = None, to_status: str = None, detail: str = None) -> Callable:
+        from_status = None if from_status is None else from_status.upper()
+        to_status = None if to_status is None else to_status.upper()
+        detail = None if detail is None else detail.upper()
+        def predicate(event) -> bool:
+            if not hasattr(event, "getStatusInfo"):
+                return False
+            status_info = event.getStatusInfo()
+            if to_status is not None and str(status_info.getStatus()) != to_status:
+                return False
+            if detail is not None and str(status_info.getStatusDetail()) != detail:
+                return False
+            if from_status is not None:
+                if not hasattr(event, "getOldStatusInfo") or str(event.getOldStatusInfo().getStatus()) != from_status:
+                    return False
+            return True
+        return predicate
+
+    @staticmethod
+    def all(*predicates: Callable) -> Callable:
+        return lambda event: all(predicate(event) for predicate in predicates)
+
+    @staticmethod
+    def any(*predicates: Callable) -> Callable:
+        return lambda event: any(predicate(event) for predicate in predicates)
+
 class BaseTrigger():
     first_word = ""
     regex = ""
+    # True, if the id was not given by the user
+    generated_id = False
+    regex_flags = re.IGNORECASE
+    # optional python side event filter, see EventFilter
+    filter = None
 
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def pattern(cls) -> re.Pattern:
+        # compiled once per class
+        pattern = cls.__dict__.get('_pattern')
+        if pattern is None:
+            pattern = re.compile(cls.regex, cls.regex_flags)
+            cls._pattern = pattern
+        return pattern
+
+    @classmethod
+    def match(cls, target) -> dict | None:
+        # constructor parameters of a matching DSL string
+        match = cls.pattern().match(target)
         if match is not None:
-            return cls(**match.groupdict())
+            return match.groupdict()
+
+    @classmethod
+    def parse(cls, target):
+        params = cls.match(target)
+        if params is not None:
+            return cls(**params)
 
 class ItemStateChangeTrigger(BaseTrigger):
     def __init__(self, item_name: str, state: Java_State = None, previous_state: Java_State = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"itemName": item_name}
         if state is not None:
@@ -46,6 +175,7 @@ class ItemStateChangeTrigger(BaseTrigger):
 
 class ItemStateUpdateTrigger(BaseTrigger):
     def __init__(self, item_name: str, state: Java_State = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"itemName": item_name}
         if state is not None:
@@ -58,6 +188,7 @@ class ItemStateUpdateTrigger(BaseTrigger):
 
 class ItemCommandTrigger(BaseTrigger):
     def __init__(self, item_name: str, command: Java_Command = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"itemName": item_name}
         if command is not None:
@@ -71,6 +202,7 @@ class ItemCommandTrigger(BaseTrigger):
 
 class GroupStateChangeTrigger(BaseTrigger):
     def __init__(self, group_name: str, state: Java_State = None, previous_state: Java_State = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"groupName": group_name}
         if state is not None:
@@ -87,6 +219,7 @@ class GroupStateChangeTrigger(BaseTrigger):
 
 class GroupStateUpdateTrigger(BaseTrigger):
     def __init__(self, group_name: str, state: Java_State = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"groupName": group_name}
         if state is not None:
@@ -99,6 +232,7 @@ class GroupStateUpdateTrigger(BaseTrigger):
 
 class GroupCommandTrigger(BaseTrigger):
     def __init__(self, group_name: str, command: Java_Command = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"groupName": group_name}
         if command is not None:
@@ -111,6 +245,7 @@ class GroupCommandTrigger(BaseTrigger):
 
 class ThingStatusUpdateTrigger(BaseTrigger):
     def __init__(self, thing_uid: str, status: str = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"thingUID": thing_uid}
         if status is not None:
@@ -123,6 +258,7 @@ class ThingStatusUpdateTrigger(BaseTrigger):
 
 class ThingStatusChangeTrigger(BaseTrigger):
     def __init__(self, thing_uid: str, status: str = None, previous_status: str = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"thingUID": thing_uid}
         if status is not None:
@@ -137,6 +273,7 @@ class ThingStatusChangeTrigger(BaseTrigger):
 
 class ChannelEventTrigger(BaseTrigger):
     def __init__(self, channel_uid: str, event=None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"channelUID": channel_uid}
         if event is not None:
@@ -150,6 +287,7 @@ class ChannelEventTrigger(BaseTrigger):
 
 class SystemStartlevelTrigger(BaseTrigger):
     def __init__(self, startlevel: int, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"startlevel": startlevel}
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("core.SystemStartlevelTrigger").withConfiguration(Java_Configuration(configuration)).build()
@@ -159,14 +297,15 @@ class SystemStartlevelTrigger(BaseTrigger):
     # @when("System reached start level 50")
     regex = r"^System\s+(?:started|reached\s+start\s+level\s+(?P<startlevel>\d+))$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
             startlevel = 40 if match.group('startlevel') is None else match.group('startlevel')
-            return SystemStartlevelTrigger(startlevel=startlevel)
+            return dict(startlevel=startlevel)
 
 class GenericCronTrigger(BaseTrigger):
     def __init__(self, cron_expression: str, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {'cronExpression': cron_expression}
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.GenericCronTrigger").withConfiguration(Java_Configuration(configuration)).build()
@@ -177,8 +316,8 @@ class GenericCronTrigger(BaseTrigger):
     # @when("Time is noon")
     regex = r"^Time\s+(?:cron\s+(?P<cronExpression>.*)|is\s+(?P<namedInstant>midnight|noon))$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
             if match.group('namedInstant') is None:
                 cronExpression = match.group('cronExpression')
@@ -190,10 +329,11 @@ class GenericCronTrigger(BaseTrigger):
             if cronExpression is None:
                 raise ValueError("invalid cron expression")
 
-            return GenericCronTrigger(cron_expression=cronExpression)
+            return dict(cron_expression=cronExpression)
 
 class TimeOfDayTrigger(BaseTrigger):
     def __init__(self, time: str, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"time": time}
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.TimeOfDayTrigger").withConfiguration(Java_Configuration(configuration)).build()
@@ -204,6 +344,7 @@ class TimeOfDayTrigger(BaseTrigger):
 
 class DateTimeTrigger(BaseTrigger):
     def __init__(self, item_name: str, time_only: bool = False, offset: int = 0, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {"itemName": item_name, "timeOnly": time_only, "offset": offset}
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.DateTimeTrigger").withConfiguration(Java_Configuration(configuration)).build()
@@ -213,15 +354,16 @@ class DateTimeTrigger(BaseTrigger):
     # @when("Datetime is Test_Datetime_2 timeOnly")
     regex = r"^Datetime\s+is\s+(?P<item_name>\D\w*)(?:\s+\[(?P<time_only>timeOnly)\])*$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
             params = match.groupdict()
             params['time_only'] = params['time_only'] == "timeOnly"
-            return DateTimeTrigger(**params)
+            return params
 
 class PWMTrigger(BaseTrigger):
     def __init__(self, dutycycle_item: str, interval: int, min_duty_cycle: int, max_duty_cycle: int, dead_man_switch: int, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         configuration = {
             "dutycycleItem": dutycycle_item,
@@ -233,8 +375,10 @@ class PWMTrigger(BaseTrigger):
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("pwm.PWMTrigger").withConfiguration(Java_Configuration(configuration)).build()
 
 class GenericEventTrigger(BaseTrigger):
-    def __init__(self, event_source: str, event_types: str, event_topic: str = "*/*", trigger_name: str = None):
+    def __init__(self, event_source: str, event_types: str, event_topic: str = "*/*", trigger_name: str = None, filter: Callable = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
+        self.filter = EventFilter.wrap(filter)
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Java_Configuration({
             "topic": event_topic,
             "source": event_source,
@@ -242,8 +386,10 @@ class GenericEventTrigger(BaseTrigger):
         })).build()
 
 class ItemEventTrigger(BaseTrigger):
-    def __init__(self, event_types: str, item_name: str = None, trigger_name: str = None):
+    def __init__(self, event_types: str, item_name: str = None, trigger_name: str = None, filter: Callable = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
+        self.filter = EventFilter.wrap(filter)
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Java_Configuration({
             "topic": "*/items/*",
             "source": "/items/{}".format(item_name if item_name else ""),
@@ -256,13 +402,14 @@ class ItemEventTrigger(BaseTrigger):
     # @when("Item updated")
     regex = r"^Item\s+(?P<action>added|removed|updated)$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
-            return ItemEventTrigger(event_types="Item" + match.group('action').capitalize() + "Event")
+            return dict(event_types="Item" + match.group('action').capitalize() + "Event")
 
 class ThingEventTrigger(BaseTrigger):
     def __init__(self, event_types: str, thing_uid: str = None, trigger_name: str = None):
+        self.generated_id = trigger_name is None
         trigger_name = validateUID(trigger_name)
         self.raw_trigger = Java_TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Java_Configuration({
             "topic": "*/things/*",
@@ -276,10 +423,64 @@ class ThingEventTrigger(BaseTrigger):
     # @when("Thing updated")
     regex = r"^Thing\s+(?P<action>added|removed|updated)$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
-            return ThingEventTrigger(event_types="Thing" + match.group('action').capitalize() + "Event")
+            return dict(event_types="Thing" + match.group('action').capitalize() + "Event")
+
+class _ParseCache():
+    # DSL string => (class, constructor parameters). Trigger and condition objects are created for every call, because of their unique ids
+    MAX_SIZE = 4096
+
+    _specs = {}
+    # first word => related classes
+    _dispatch = {}
+
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def resolve(parser, target: str, match_target: str, kind: str) -> tuple[type, dict]:
+        key = (parser, target)
+        spec = _ParseCache._specs.get(key)
+        if spec is not None:
+            _ParseCache.hits += 1
+            return spec
+        _ParseCache.misses += 1
+
+        _target = target.strip()
+        first_word = _target.split()[0]
+
+        for candidate in _ParseCache._getClasses(parser, first_word.lower()):
+            params = candidate.match(match_target)
+            if params is not None:
+                spec = (candidate, params)
+                if len(_ParseCache._specs) >= _ParseCache.MAX_SIZE:
+                    _ParseCache._specs.clear()
+                _ParseCache._specs[key] = spec
+                return spec
+
+        raise ValueError(u"Could not parse {} {}: '{}'".format(first_word, kind, target))
+
+    @staticmethod
+    def _getClasses(parser, first_word: str) -> list[type]:
+        dispatch = _ParseCache._dispatch.get(parser)
+        if dispatch is None:
+            dispatch = {}
+            for candidate in parser.trigger_classes if parser is when else parser.condition_classes:
+                for word in candidate.first_word:
+                    dispatch.setdefault(word, []).append(candidate)
+            _ParseCache._dispatch[parser] = dispatch
+        return dispatch.get(first_word, [])
+
+    @staticmethod
+    def clear():
+        _ParseCache._specs.clear()
+        _ParseCache._dispatch.clear()
+
+    @staticmethod
+    def getStats() -> dict[str, int]:
+        return {"size": len(_ParseCache._specs), "hits": _ParseCache.hits, "misses": _ParseCache.misses}
 
 class when():
     trigger_classes = [
@@ -302,44 +503,65 @@ class when():
         ThingEventTrigger
     ]
 
+    # time spent in parsing, used by the script load report
+    build_duration = 0.0
+
     def __init__(self, term_as_string):
         self.target = term_as_string
 
     def __call__(self, clazz):
+        start_time = time.perf_counter()
         trigger = when.parse(self.target)
         if not hasattr(clazz, '_when_triggers'):
             clazz._when_triggers = []
         clazz._when_triggers.append(trigger)
+        when.build_duration += time.perf_counter() - start_time
         return clazz
 
     @staticmethod
     def parse(target):
-        _target = target.strip()
-        first_word = _target.split()[0]
-
-        for trigger_class in when.trigger_classes:
-            # check if trigger is related to avoid regex
-            if first_word.lower() not in trigger_class.first_word:
-                continue
-
-            trigger = trigger_class.parse(target)
-            if trigger is not None:
-                return trigger
+        trigger_class, params = _ParseCache.resolve(when, target, target, "trigger")
+        return trigger_class(**params)
 
-        raise ValueError(u"Could not parse {} trigger: '{}'".format(first_word, target))
+    @staticmethod
+    def compile(targets: list[str]) -> list[BaseTrigger]:
+        start_time = time.perf_counter()
+        triggers = [when.parse(target) for target in targets]
+        when.build_duration += time.perf_counter() - start_time
+        return triggers
 
 class BaseCondition():
     first_word = ""
     regex = ""
+    # True, if the id was not given by the user
+    generated_id = False
+    regex_flags = re.IGNORECASE
 
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def pattern(cls) -> re.Pattern:
+        # compiled once per class
+        pattern = cls.__dict__.get('_pattern')
+        if pattern is None:
+            pattern = re.compile(cls.regex, cls.regex_flags)
+            cls._pattern = pattern
+        return pattern
+
+    @classmethod
+    def match(cls, target) -> dict | None:
+        # constructor parameters of a matching DSL string
+        match = cls.pattern().match(target)
         if match is not None:
-            return cls(**match.groupdict())
+            return match.groupdict()
+
+    @classmethod
+    def parse(cls, target):
+        params = cls.match(target)
+        if params is not None:
+            return cls(**params)
 
 class ItemStateCondition(BaseCondition):
     def __init__(self, item_name: str, operator: str, state: Java_State = None, condition_name: str = None):
+        self.generated_id = condition_name is None
         condition_name = validateUID(condition_name)
         configuration = {
             "itemName": item_name,
@@ -355,16 +577,17 @@ class ItemStateCondition(BaseCondition):
     # @onlyif("Item Test_Switch_2 equals ON")
     regex = r"^Item\s+(?P<item_name>\w+)\s+((?P<eq>=|==|eq|equals|is)|(?P<neq>!=|not\s+equals|is\s+not)|(?P<lt><|lt|is\s+less\s+than)|(?P<lte><=|lte|is\s+less\s+than\s+or\s+equal)|(?P<gt>>|gt|is\s+greater\s+than)|(?P<gte>>=|gte|is\s+greater\s+than\s+or\s+equal))\s+(?P<state>'[^']+'|\S+)*$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
             operators = [("eq", "="), ("neq", "!="), ("lt", "<"), ("lte", "<="), ("gt", ">"), ("gte", ">=")]
             operator = next((op[1] for op in operators if match.group(op[0]) is not None), None)
 
-            return ItemStateCondition(item_name=match.group('item_name'), operator=operator, state=match.group('state'))
+            return dict(item_name=match.group('item_name'), operator=operator, state=match.group('state'))
 
 class ItemScriptCondition(BaseCondition):
     def __init__(self, script: str, condition_name: str = None):
+        self.generated_id = condition_name is None
         condition_name = validateUID(condition_name)
         configuration = {
             "type": "application/x-python3",
@@ -379,13 +602,53 @@ class ItemScriptCondition(BaseCondition):
     # @onlyif("Script Registry.getItem('TestItem').getState() == scope.ON")
     regex = r"^Script\s+(?P<script>\w+)$"
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
-            return ItemStateCondition(script=match.group('script'))
+            return dict(script=match.group('script'))
+
+class PythonCondition(BaseCondition):
+    # evaluated by the rule itself, before the rule body runs. No condition is registered in the openHAB rule engine
+    def __init__(self, condition: Union[Callable, str], condition_name: str = None):
+        self.generated_id = condition_name is None
+        self.condition_name = validateUID(condition_name)
+        self.raw_condition = None
+        self.evaluated = 0
+        self.rejected = 0
+
+        if isinstance(condition, str):
+            from openhab.jsr223 import TopCallStackFrame
+            # compiled once and evaluated with the globals of the script
+            code = compile(condition, "<PythonCondition>", "eval")
+            self.callback = lambda event, input: eval(code, TopCallStackFrame, {"event": event, "input": input})
+        elif callable(condition):
+            try:
+                with_input = len(signature(condition).parameters) > 1
+            except (TypeError, ValueError):
+                with_input = False
+            self.callback = condition if with_input else lambda event, input: condition(event)
+        else:
+            raise ValueError(u"Paramater invalid in call to PythonCondition")
+
+    first_word = []
+
+    def check(self, input) -> bool:
+        try:
+            event = input['event']
+        except KeyError:
+            event = None
+        self.evaluated += 1
+        if self.callback(event, input):
+            return True
+        self.rejected += 1
+        return False
+
+    def getStats(self) -> dict[str, int]:
+        return {"evaluated": self.evaluated, "rejected": self.rejected}
 
 class EphemerisCondition(BaseCondition):
     def __init__(self, dayset: str, offset: int = 0, condition_name: str = None):
+        self.generated_id = condition_name is None
         condition_name = validateUID(condition_name)
         configuration = {
             "offset": offset
@@ -416,9 +679,11 @@ class EphemerisCondition(BaseCondition):
     regex = r"""^((?P<today>Today\s+is|it'*s)|(?P<plus1>Tomorrow\s+is|Today\s+plus\s+1)|(?P<minus1>Yesterday\s+was|Today\s+minus\s+1)|(Today\s+(?P<plusminus>plus|minus|offset)\s+(?P<offset>-?\d+)\s+is))\s+  # what day
                 (?P<not>not\s+)?(in\s+)?(a\s+)?                        # predicate
                 (?P<dayset>holiday|weekday|weekend|\S+)$"""          # dayset
+    regex_flags = re.IGNORECASE | re.X
+
     @classmethod
-    def parse(cls, target):
-        match = re.match(cls.regex, target, re.IGNORECASE | re.X)
+    def match(cls, target):
+        match = cls.pattern().match(target)
         if match is not None:
             dayset = match.group('dayset')
             if dayset is None:
@@ -447,10 +712,11 @@ class EphemerisCondition(BaseCondition):
             else:
                 dayset = match.group('dayset')
 
-            return EphemerisCondition(dayset=dayset, offset=offset)
+            return dict(dayset=dayset, offset=offset)
 
 class TimeOfDayCondition(BaseCondition):
     def __init__(self, start_time: str, end_time: str, condition_name: str = None):
+        self.generated_id = condition_name is None
         condition_name = validateUID(condition_name)
         configuration = {
             "startTime": start_time,
@@ -470,6 +736,7 @@ class TimeOfDayCondition(BaseCondition):
 
 class IntervalCondition(BaseCondition):
     def __init__(self, min_interval: int, condition_name: str = None):
+        self.generated_id = condition_name is None
         condition_name = validateUID(condition_name)
         configuration = {
             "minInterval": min_interval,
@@ -487,29 +754,29 @@ class onlyif():
         TimeOfDayCondition
     ]
 
-    def __init__(self, term_as_string: str):
+    # time spent in parsing, used by the script load report
+    build_duration = 0.0
+
+    def __init__(self, term_as_string: Union[str, Callable]):
         self.target = term_as_string
 
     def __call__(self, clazz):
-        condition = onlyif.parse(self.target)
+        start_time = time.perf_counter()
+        condition = PythonCondition(self.target) if callable(self.target) else onlyif.parse(self.target)
         if not hasattr(clazz, '_onlyif_conditions'):
             clazz._onlyif_conditions = []
         clazz._onlyif_conditions.append(condition)
+        onlyif.build_duration += time.perf_counter() - start_time
         return clazz
 
     @staticmethod
     def parse(target: str):
-        _target = target.strip()
-        first_word = _target.split()[0]
-
-        for condition_class in onlyif.condition_classes:
-            # check if condition is related to avoid regex
-            if first_word.lower() not in condition_class.first_word:
-                continue
-
-            condition = condition_class.parse(_target)
-            if condition is not None:
-                return condition
-
-        raise ValueError(u"Could not parse {} condition: '{}'".format(first_word, target))
+        condition_class, params = _ParseCache.resolve(onlyif, target, target.strip(), "condition")
+        return condition_class(**params)
 
+    @staticmethod
+    def compile(targets: list[str]) -> list[BaseCondition]:
+        start_time = time.perf_counter()
+        conditions = [onlyif.parse(target) for target in targets]
+        onlyif.build_duration += time.perf_counter() - start_time
+        return conditions
@@ -0,0 +1,68 @@
+from openhab import Registry
+from openhab.helper import _ItemStateCache
+
+from org.openhab.core.library.types import DecimalType, QuantityType, OnOffType
+
+import time
+
+for name in ["TestItemBulk1", "TestItemBulk2"]:
+    try:
+        Registry.getItem(name)
+    except:
+        Registry.addItem(name, "Number")
+
+Registry.getItem("TestItemBulk1").postUpdate(0)
+Registry.getItem("TestItemBulk2").postUpdate(0)
+time.sleep(0.1)
+
+# Check changed values
+assert Registry.postUpdates({"TestItemBulk1": 1, "TestItemBulk2": 2}) == 2
+time.sleep(0.1)
+assert Registry.getItemState("TestItemBulk1").intValue() == 1
+assert Registry.getItemState("TestItemBulk2").intValue() == 2
+
+# Check unchanged values
+assert Registry.postUpdates({"TestItemBulk1": 1, "TestItemBulk2": 3}) == 1
+assert Registry.sendCommands({"TestItemBulk1": 1}) == 0
+
+# Check cache is updated by events
+Registry.getItem("TestItemBulk1").postUpdate(5)
+time.sleep(0.1)
+assert Registry.postUpdates({"TestItemBulk1": 1}) == 1
+
+# Check commands, which are not changing the state
+Registry.getItem("TestItemBulk2").getMetadata().set("autoupdate", "false")
+assert Registry.sendCommands({"TestItemBulk2": 9}) == 1
+time.sleep(0.1)
+assert Registry.getItemState("TestItemBulk2").intValue() == 3
+assert Registry.sendCommands({"TestItemBulk2": 9}) == 1
+Registry.getItem("TestItemBulk2").getMetadata().remove("autoupdate")
+
+# Check unconfirmed writes, e.g. a rejected update
+pending_timeout = _ItemStateCache.pending_timeout
+_ItemStateCache.pending_timeout = 0.2
+_ItemStateCache.set("TestItemBulk1", 7)
+assert Registry.postUpdates({"TestItemBulk1": 7}) == 0
+time.sleep(0.3)
+assert Registry.postUpdates({"TestItemBulk1": 7}) == 1
+time.sleep(0.1)
+assert Registry.getItemState("TestItemBulk1").intValue() == 7
+_ItemStateCache.pending_timeout = pending_timeout
+
+# Check states of different types are compared by the same comparator
+assert not _ItemStateCache.isDifferent("ON", OnOffType.ON)
+assert not _ItemStateCache.isDifferent(OnOffType.ON, "ON")
+assert _ItemStateCache.isDifferent("OFF", OnOffType.ON)
+assert not _ItemStateCache.isDifferent(DecimalType(5), QuantityType("5 °C"))
+assert not _ItemStateCache.isDifferent(QuantityType("5 °C"), DecimalType(5))
+assert _ItemStateCache.isDifferent(DecimalType(6), QuantityType("5 °C"))
+assert not _ItemStateCache.isDifferent(5, "5.0")
+assert not _ItemStateCache.isDifferent(5, DecimalType(5))
+assert _ItemStateCache.isDifferent("ON", "OFF")
+
+# Not found
+try:
+    Registry.postUpdates({"CCCCCCCCC": 1})
+    assert False
+except Exception as e:
+    assert str(e) == "Item CCCCCCCCC not found"
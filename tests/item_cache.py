@@ -0,0 +1,33 @@
+from openhab import Registry
+
+Registry.enableItemCache()
+
+try:
+    item = Registry.getItem("TestItemCache")
+except:
+    item = Registry.addItem("TestItemCache", "Number")
+
+stats = Registry.getItemCacheStats()
+assert stats['enabled'] == True
+
+# Check hit
+Registry.getItem("TestItemCache")
+Registry.getItem("TestItemCache")
+assert Registry.getItemCacheStats()['hits'] >= stats['hits'] + 1
+
+# Check re-created item is not stale
+item1 = Registry.getItem("TestItemCache")
+Registry.removeItem("TestItemCache")
+try:
+    Registry.getItem("TestItemCache")
+    assert False
+except Exception as e:
+    assert str(e) == "Item TestItemCache not found"
+
+Registry.addItem("TestItemCache", "String")
+item2 = Registry.getItem("TestItemCache")
+assert item2.getType() == "String"
+
+Registry.disableItemCache()
+assert Registry.getItemCacheStats()['enabled'] == False
+assert Registry.getItemCacheStats()['size'] == 0
@@ -1,4 +1,5 @@
 from openhab import Registry
+from openhab.helper import _DECODED_VALUE_CACHE
 from datetime import datetime, timedelta
 
 from org.openhab.core.items import Item as Java_Item
@@ -22,3 +23,24 @@ assert isinstance(value1 - value2,timedelta)
 assert (value1 == value2) == False
 assert (value1 < value2) == False
 assert (value1 > value2) == True
+
+# Check decoded values are cached and stay correct
+value3 = item.getLastStateUpdate()
+year = value3.year
+hits = _DECODED_VALUE_CACHE.hits
+assert value3.year == year
+assert _DECODED_VALUE_CACHE.hits > hits
+
+# a second java object with the same value uses the same cache entry
+hits = _DECODED_VALUE_CACHE.hits
+value4 = item.getLastStateUpdate()
+assert value4.year == year
+assert _DECODED_VALUE_CACHE.hits > hits
+
+assert (value3.year, value3.month, value3.day) == (value3.getYear(), value3.getMonthValue(), value3.getDayOfMonth())
+assert (value3.hour, value3.minute, value3.second) == (value3.getHour(), value3.getMinute(), value3.getSecond())
+assert value3.microsecond == int(value3.getNano() / 1000)
+assert value3.utcoffset() == timedelta(seconds=value3.getOffset().getTotalSeconds())
+assert value3 == value4
+assert hash(value3) == hash(value4)
+assert value3.isoformat() == value3.isoformat()
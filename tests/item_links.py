@@ -0,0 +1,37 @@
+from openhab import Registry
+
+import time
+
+try:
+    item = Registry.getItem("TestItemLinks")
+except:
+    item = Registry.addItem("TestItemLinks", "Number")
+
+channel_uid = "astro:sun:testlinks:rise#start"
+
+Registry.enableLinkIndex()
+
+item.linkChannel(channel_uid)
+time.sleep(0.1)
+
+# Check index
+assert Registry.getChannelItemNames(channel_uid) == ["TestItemLinks"]
+assert "TestItemLinks" in Registry.getThingItemNames("astro:sun:testlinks")
+assert channel_uid in Registry.getThingChannelUIDs("astro:sun:testlinks")
+assert [uid.getAsString() for uid in item.getChannelUIDs()] == [channel_uid]
+
+# Check link configuration update
+link = item.linkChannel(channel_uid, {"profile": "system:follow"})
+assert link.getConfiguration().get("profile") == "system:follow"
+assert item.getChannelLinks()[0].getConfiguration().get("profile") == "system:follow"
+
+# Check unlink
+item.unlinkChannel(channel_uid)
+assert Registry.getChannelItemNames(channel_uid) == []
+try:
+    item.unlinkChannel(channel_uid)
+    assert False
+except Exception as e:
+    assert str(e) == "Link {} not found".format(channel_uid)
+
+Registry.disableLinkIndex()
@@ -0,0 +1,36 @@
+from openhab import Registry
+
+import time
+
+for name in ["TestItemReconcile1", "TestItemReconcile2"]:
+    try:
+        Registry.getItem(name)
+    except:
+        Registry.addItem(name, "Number")
+
+channel_uid1 = "astro:sun:testreconcile:rise#start"
+channel_uid2 = "astro:sun:testreconcile:set#start"
+
+Registry.reconcileLinks([], managed_items = ["TestItemReconcile1", "TestItemReconcile2"])
+
+# Check add
+report = Registry.reconcileLinks([("TestItemReconcile1", channel_uid1), ("TestItemReconcile2", channel_uid2)])
+assert len(report['added']) == 2
+assert report['unchanged'] == 0
+
+# Check unchanged
+report = Registry.reconcileLinks([("TestItemReconcile1", channel_uid1), ("TestItemReconcile2", channel_uid2)])
+assert report == {"added": [], "updated": [], "removed": [], "unchanged": 2}
+
+# Check update and remove
+report = Registry.reconcileLinks([("TestItemReconcile1", channel_uid2, {"profile": "system:follow"})], managed_items = ["TestItemReconcile1", "TestItemReconcile2"])
+assert len(report['added']) == 1
+assert len(report['removed']) == 2
+
+# Check dry run
+report = Registry.reconcileLinks([], managed_items = ["TestItemReconcile1"], dry_run = True)
+assert len(report['removed']) == 1
+assert Registry.getChannelItemNames(channel_uid2) == ["TestItemReconcile1"]
+
+Registry.reconcileLinks([], managed_items = ["TestItemReconcile1", "TestItemReconcile2"])
+assert Registry.getThingItemNames("astro:sun:testreconcile") == []
@@ -0,0 +1,48 @@
+from openhab import Registry, Metadata
+
+for name in ["TestItemMetadata1", "TestItemMetadata2"]:
+    try:
+        Registry.getItem(name)
+    except:
+        Registry.addItem(name, "Number")
+
+Registry.getItem("TestItemMetadata1").getMetadata().removeAll()
+Registry.getItem("TestItemMetadata2").getMetadata().removeAll()
+
+# Check transaction
+with Metadata.transaction() as transaction:
+    transaction.set("TestItemMetadata1", "testnamespace", "value1")
+    transaction.set("TestItemMetadata2", "testnamespace", "value2", {"key": "value"})
+
+assert sorted(Metadata.itemsWith("testnamespace")) == ["TestItemMetadata1", "TestItemMetadata2"]
+assert Metadata.itemsWith("testnamespace", "value2") == ["TestItemMetadata2"]
+assert Metadata.get("TestItemMetadata2", "testnamespace").getConfiguration()["key"] == "value"
+
+# Check unchanged and removed
+result = Metadata.transaction().set("TestItemMetadata1", "testnamespace", "value1").remove("TestItemMetadata2", "testnamespace").commit()
+assert result == {"added": 0, "updated": 0, "removed": 1, "unchanged": 1}
+assert Metadata.itemsWith("testnamespace") == ["TestItemMetadata1"]
+
+# Check rollback
+try:
+    with Metadata.transaction() as transaction:
+        transaction.set("TestItemMetadata2", "testnamespace", "value2")
+        raise ValueError("test")
+except ValueError:
+    pass
+assert Metadata.get("TestItemMetadata2", "testnamespace") is None
+
+# Check rollback of applied operations, if a later one fails
+failed = False
+try:
+    Metadata.transaction().set("TestItemMetadata1", "testnamespace", "value4").set("TestItemMetadata2", "invalid namespace", "value").commit()
+except Exception:
+    failed = True
+assert failed
+assert Metadata.get("TestItemMetadata1", "testnamespace").getValue() == "value1"
+
+# Check index is updated by ItemMetadata
+Registry.getItem("TestItemMetadata1").getMetadata().set("testnamespace", "value3")
+assert Metadata.get("TestItemMetadata1", "testnamespace").getValue() == "value3"
+Registry.getItem("TestItemMetadata1").getMetadata().remove("testnamespace")
+assert Metadata.itemsWith("testnamespace") == []
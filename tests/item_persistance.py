@@ -1,4 +1,5 @@
 import builtins
+import time
 
 from openhab import Registry
 from datetime import datetime, timedelta
@@ -45,3 +46,90 @@ persistence.getAllStatesBetween(startDate, endDate)
 test = item.getSemantic().isLocation()
 assert isinstance(test, bool)
 
+
+# Check stable statistics
+try:
+    statistics = persistence.getStableStatistics(3600)
+    assert statistics['min'] <= statistics['average'] <= statistics['max']
+    assert statistics['duration'] <= 3600
+except Exception as e:
+    assert str(e) == "No persisted state for TestItemPersistance found"
+
+# Check query cache
+from openhab.helper import ItemPersistence
+ItemPersistence.enableCache(ttl = 60)
+startDate = datetime.now() - timedelta(hours=1)
+first = persistence.changedSince(startDate)
+second = persistence.changedSince(startDate)
+assert first == second
+stats = ItemPersistence.getCacheStats()
+assert stats['enabled'] and stats['hits'] >= 1
+
+# Check invalidation by an update without state change
+item.postUpdate(item.getState())
+time.sleep(0.1)
+persistence.changedSince(startDate)
+assert ItemPersistence.getCacheStats()['invalidations'] == stats['invalidations'] + 1
+ItemPersistence.disableCache()
+assert ItemPersistence.getCacheStats()['size'] == 0
+
+# Check streaming export
+import os
+import tempfile
+count = 0
+for timestamps, values in persistence.iterStates(datetime.now() - timedelta(days=2), chunk = 100):
+    assert len(timestamps) == len(values) <= 100
+    count += len(values)
+path = os.path.join(tempfile.gettempdir(), "TestItemPersistance.csv")
+assert persistence.exportStates(path, datetime.now() - timedelta(days=2), format = "csv", chunk = 100) >= count
+with open(path) as f:
+    assert f.readline() == "timestamp,value\n"
+os.remove(path)
+try:
+    persistence.exportStates(path, datetime.now(), format = "xls")
+    assert False
+except ValueError:
+    pass
+
+# Check states with the same timestamp across page boundaries
+from org.openhab.core.library.types import DecimalType
+
+class HistoricItem:
+    def __init__(self, timestamp, value):
+        self.timestamp = timestamp
+        self.value = value
+
+    def getTimestamp(self):
+        return self.timestamp
+
+    def getState(self):
+        return self.value
+
+class PersistenceService:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def getId(self):
+        return "test"
+
+    def query(self, criteria):
+        begin = criteria.getBeginDate()
+        begin = datetime.fromtimestamp(begin.toEpochSecond() + begin.getNano() / 1000000000).astimezone()
+        return [entry for entry in self.entries if entry.timestamp >= begin][:criteria.getPageSize()]
+
+startDate = datetime.now().astimezone().replace(microsecond=0) - timedelta(hours=1)
+offsets = [0, 1, 2, 2, 2, 3, 4, 4, 5, 5, 5, 5, 5, 6]
+service = PersistenceService([HistoricItem(startDate + timedelta(seconds=offset), DecimalType(i)) for i, offset in enumerate(offsets)])
+duplicates = ItemPersistence(item)
+duplicates._getQueryableService = lambda: service
+for chunk in [1, 2, 3, 100]:
+    values = []
+    for _, chunk_values in duplicates.iterStates(startDate, chunk = chunk):
+        values.extend(chunk_values)
+    assert values == list(range(len(offsets)))
+
+# Check reused proxies and bound methods
+assert item.getPersistence() is persistence
+assert item.getPersistence("rrd4j") is not persistence
+assert item.getSemantic() is item.getSemantic()
+assert persistence.changedSince is persistence.changedSince
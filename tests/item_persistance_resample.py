@@ -0,0 +1,40 @@
+from openhab import Registry, Persistence
+from datetime import datetime, timedelta
+
+try:
+    item1 = Registry.getItem("TestItemResample1")
+except:
+    item1 = Registry.addItem("TestItemResample1", "Number")
+
+try:
+    item2 = Registry.getItem("TestItemResample2")
+except:
+    item2 = Registry.addItem("TestItemResample2", "Number")
+
+# Check aligned grid
+end_time = datetime.now().astimezone()
+start_time = end_time - timedelta(hours=2)
+for method in ["last", "mean", "time_weighted"]:
+    grid = Persistence.resample([item1, "TestItemResample2"], start_time, end_time, step = timedelta(minutes=15), method = method)
+    assert len(grid["timestamps"]) == 8
+    assert len(grid["values"]["TestItemResample1"]) == 8
+    assert len(grid["values"]["TestItemResample2"]) == 8
+    assert grid["timestamps"][1] - grid["timestamps"][0] == 900
+
+# Check wrong method
+try:
+    Persistence.resample([item1], start_time, end_time, method = "median")
+    assert False
+except ValueError:
+    pass
+
+# Check downsampling
+timestamps = [float(i) for i in range(1000)]
+values = [float(i % 100) for i in range(1000)]
+sampled_timestamps, sampled_values = Persistence.downsample(timestamps, values, 100)
+assert len(sampled_timestamps) == len(sampled_values) == 100
+assert sampled_timestamps[0] == 0 and sampled_timestamps[-1] == 999
+assert max(sampled_values) == 99
+
+sampled_timestamps, sampled_values = Persistence.downsample(timestamps[:10], values[:10], 100)
+assert len(sampled_timestamps) == 10
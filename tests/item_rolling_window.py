@@ -0,0 +1,35 @@
+from openhab import Registry
+from openhab.helper import RollingWindow
+
+import time
+
+try:
+    item = Registry.getItem("TestItemRollingWindow")
+except:
+    item = Registry.addItem("TestItemRollingWindow", "Number")
+
+# Check calculation with synthetic values
+window = RollingWindow("TestItemRollingWindow", 40)
+window.add(1, 0)
+window.add(3, 10)
+window.add(2, 30)
+statistics = window.getStatistics(40)
+assert statistics['average'] == 2.25
+assert statistics['min'] == 1
+assert statistics['max'] == 3
+assert statistics['integral'] == 90
+assert statistics['duration'] == 40
+
+# Check values are leaving the window
+statistics = window.getStatistics(50)
+assert statistics['average'] == 2.5
+assert statistics['min'] == 2
+
+# Check updates by events
+item.postUpdate(1)
+time.sleep(0.1)
+window = item.getPersistence().getRollingWindow(60)
+assert item.getPersistence().getRollingWindow(60) is window
+item.postUpdate(5)
+time.sleep(0.1)
+assert window.getStatistics()['max'] == 5
@@ -0,0 +1,58 @@
+from openhab.helper import Item, _StateComparator
+from datetime import datetime
+
+from org.openhab.core.library.types import DecimalType, PercentType, QuantityType, StringType, OnOffType, DateTimeType
+
+# Check results
+assert Item._checkIfDifferent(DecimalType(1.5), 1.5) == False
+assert Item._checkIfDifferent(DecimalType(1.5), "1.5") == False
+assert Item._checkIfDifferent(DecimalType(1.5), 2) == True
+assert Item._checkIfDifferent(DecimalType(1), DecimalType(1.0)) == False
+assert Item._checkIfDifferent(PercentType(0), "UP") == False
+assert Item._checkIfDifferent(PercentType(100), "DOWN") == False
+assert Item._checkIfDifferent(PercentType(50), 50) == False
+assert Item._checkIfDifferent(QuantityType("21.5 °C"), 21.5) == False
+assert Item._checkIfDifferent(QuantityType("21.5 °C"), "21.5 °C") == False
+assert Item._checkIfDifferent(QuantityType("1 kW"), "1000 W") == False
+assert Item._checkIfDifferent(QuantityType("1 kW"), QuantityType("1001 W")) == True
+assert Item._checkIfDifferent(QuantityType("1 kW"), "1 m") == True
+assert Item._checkIfDifferent(StringType("test"), "test") == False
+assert Item._checkIfDifferent(StringType("test"), "test2") == True
+assert Item._checkIfDifferent(OnOffType.ON, "ON") == False
+assert Item._checkIfDifferent(OnOffType.ON, True) == False
+assert Item._checkIfDifferent(OnOffType.ON, OnOffType.OFF) == True
+now = datetime.now().astimezone().replace(microsecond=0)
+assert Item._checkIfDifferent(DateTimeType(now), now) == False
+assert Item._checkIfDifferent(DateTimeType(now), now.replace(tzinfo=None)) == False
+
+# Check typed comparison against string based comparison, where both are expected to agree
+for current_state, new_state in [
+    (DecimalType(1.5), 1.5),
+    (DecimalType(1.5), 2),
+    (StringType("test"), "test"),
+    (StringType("test"), "test2"),
+    (OnOffType.ON, "ON"),
+    (OnOffType.ON, "OFF")
+]:
+    assert Item._checkIfDifferent(current_state, new_state) == _StateComparator.compareFallback(current_state, new_state)
+
+# Check equal values with a different string representation, where only the typed comparison is right
+for current_state, new_state, different in [
+    (DecimalType(1), "1.0", False),
+    (DecimalType("1.0"), "1", False),
+    (StringType("1"), "1.0", True),
+    (QuantityType("1 kW"), "1000 W", False),
+    (QuantityType("1000 W"), QuantityType("1 kW"), False),
+    (QuantityType("1 kW"), "1001 W", True),
+    (OnOffType.ON, PercentType(100), False),
+    (OnOffType.ON, PercentType(50), False),
+    (OnOffType.OFF, PercentType(0), False),
+    (OnOffType.OFF, PercentType(50), True),
+    (PercentType(100), OnOffType.ON, False),
+    (PercentType(0), OnOffType.OFF, False),
+    (PercentType(50), OnOffType.ON, True),
+    (PercentType(0), "OFF", False)
+]:
+    assert Item._checkIfDifferent(current_state, new_state) == different
+    # the string based comparison reports a change for all of them
+    assert _StateComparator.compareFallback(current_state, new_state)
@@ -0,0 +1,46 @@
+from openhab import Registry
+
+import math
+import time
+
+for name, item_type in [("TestItemStates1", "Number"), ("TestItemStates2", "Switch"), ("TestItemStates3", "String")]:
+    try:
+        Registry.getItem(name)
+    except:
+        Registry.addItem(name, item_type)
+
+Registry.getItem("TestItemStates1").postUpdate(1.5)
+Registry.getItem("TestItemStates2").postUpdate("ON")
+Registry.getItem("TestItemStates3").postUpdate("test")
+time.sleep(0.1)
+
+# Check names
+states = Registry.getItemStates(["TestItemStates1", "TestItemStates2"])
+assert list(states.keys()) == ["TestItemStates1", "TestItemStates2"]
+assert states["TestItemStates1"].doubleValue() == 1.5
+
+# Check pattern
+states = Registry.getItemStates("TestItemStates*")
+assert sorted(states.keys()) == ["TestItemStates1", "TestItemStates2", "TestItemStates3"]
+
+# Check columnar
+columns = Registry.getItemStates(["TestItemStates1", "TestItemStates2", "TestItemStates3"], columnar = True)
+assert columns['names'] == ["TestItemStates1", "TestItemStates2", "TestItemStates3"]
+assert columns['values'][0] == 1.5
+assert columns['values'][1] == 1.0
+assert math.isnan(columns['values'][2])
+assert columns['timestamps'][0] > 0
+
+# Unknown item
+try:
+    Registry.getItemStates(["TestItemStates1", "TestItemStatesUnknown"])
+    assert False
+except Exception as e:
+    assert str(e) == "Item TestItemStatesUnknown not found"
+
+# Invalid parameter type
+try:
+    Registry.getItemStates(1)
+    assert False
+except Exception as e:
+    assert str(e) == "Unsupported parameter type <class 'int'>"
@@ -0,0 +1,48 @@
+from openhab import logger
+from openhab.helper import _LoggerFacade
+from functools import partial
+
+# Check level cache
+assert isinstance(logger.isEnabled("info"), bool)
+assert logger.isEnabled("error") == logger.isErrorEnabled()
+
+# Check lazy formatting
+calls = []
+def expensive():
+    calls.append(1)
+    return "expensive"
+
+logger.info("Value %s of %d items", "test", 2)
+logger.info("Value {} of {} items", "test", 2)
+logger.info(expensive)
+if not logger.isEnabled("trace"):
+    logger.trace(expensive)
+    logger.trace("Value {}", expensive)
+    assert len(calls) == (1 if logger.isEnabled("info") else 0)
+
+# Check which arguments are evaluated lazy
+class Report():
+    def __call__(self):
+        return "report"
+assert logger._format("Value {}", (partial(str, 5),)) == ("Value 5", None)
+assert logger._format("Value {}", (Report(),)) == ("Value report", None)
+assert logger._format("Value {}", ([1].copy,)) == ("Value [1]", None)
+assert logger._format("Value {}", (Report,)) == ("Value " + str(Report), None)
+
+# Check placeholder detection and trailing exceptions
+assert logger._format("Battery at 100% in {}", (5,)) == ("Battery at 100% in 5", None)
+assert logger._format("Value %s of %d items", ("test", 2)) == ("Value test of 2 items", None)
+assert logger._format("50% done", (3,)) == ("50% done", None)
+message, throwable = logger._format("Update failed", (ValueError("test"),))
+assert message.startswith("Update failed\n") and throwable is None
+
+# Check async logging
+logger.enableAsync()
+logger.info("async message")
+logger.disableAsync()
+
+# Check the dispose hook is registered only once
+logger.enableAsync()
+logger.enableAsync()
+assert _LoggerFacade._dispose_hook_registered
+logger.disableAsync()
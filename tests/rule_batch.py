@@ -0,0 +1,91 @@
+from openhab import rule
+from openhab.helper import _RuleRegistration
+from openhab.triggers import GenericCronTrigger, ItemStateCondition
+
+report = rule.getLoadReport()
+registered = report['rules']
+
+# Check automatic batching, while the script is loaded
+@rule(name = "TestRuleLoad", triggers = [ GenericCronTrigger("0 0 0 * * ?") ])
+def test(module, input):
+    pass
+assert rule.getLoadReport()['pending'] == 1
+rule.flush()
+assert rule.getLoadReport()['pending'] == 0
+registered += 1
+
+# Check deferred registration
+with rule.batch():
+    for i in range(5):
+        @rule(name = "TestRuleBatch{}".format(i), triggers = [ GenericCronTrigger("0 0 0 * * ?") ])
+        def test(module, input):
+            pass
+    assert rule.getLoadReport()['pending'] == 5
+    assert rule.getLoadReport()['rules'] == registered
+
+# Check flush at the end of the block
+report = rule.getLoadReport()
+assert report['pending'] == 0
+assert report['rules'] == registered + 5
+for key in ['imports', 'triggers', 'preparation', 'registration']:
+    assert report[key] >= 0
+
+# Check imports are not measured after the script is loaded
+imports = rule.getLoadReport()['imports']
+import json
+assert rule.getLoadReport()['imports'] == imports
+
+# Check failed blocks
+report = rule.getLoadReport()
+try:
+    with rule.batch():
+        @rule(name = "TestRuleBatchFailed", triggers = [ GenericCronTrigger("0 0 0 * * ?") ])
+        def test(module, input):
+            pass
+        raise ValueError("test")
+except ValueError:
+    pass
+assert rule.getLoadReport()['pending'] == 0
+assert rule.getLoadReport()['rules'] == report['rules']
+
+# Check incremental registration
+def buildRules(count, cron = "0 0 0 * * ?"):
+    with rule.batch(sync = True):
+        for i in range(count):
+            @rule(name = "TestRuleSync{}".format(i), triggers = [ GenericCronTrigger(cron) ])
+            def test(module, input):
+                pass
+
+buildRules(3)
+report = rule.getLoadReport()
+buildRules(3)
+assert rule.getLoadReport()['unchanged'] == report['unchanged'] + 3
+assert rule.getLoadReport()['added'] == report['added']
+buildRules(3, "0 0 1 * * ?")
+assert rule.getLoadReport()['updated'] == report['updated'] + 3
+buildRules(2, "0 0 1 * * ?")
+assert rule.getLoadReport()['removed'] == report['removed'] + 1
+
+# Check given trigger and condition ids
+@rule(uid = "TestRuleModuleIds", triggers = [ GenericCronTrigger("0 0 0 * * ?", trigger_name = "generated_test") ], conditions = [ ItemStateCondition("TestItem", "=", "ON", condition_name = "generated_test") ])
+def test(module, input):
+    pass
+
+rule.flush()
+base_rule_obj = _RuleRegistration._rules["TestRuleModuleIds"]
+assert [trigger.getId() for trigger in base_rule_obj.getTriggers()] == ["generated_test"]
+assert [condition.getId() for condition in base_rule_obj.getConditions()] == ["generated_test_2"]
+
+# Check duplicate uids
+@rule(name = "TestRuleDuplicate", triggers = [ GenericCronTrigger("0 0 0 * * ?") ])
+def test(module, input):
+    pass
+
+failed = False
+try:
+    @rule(name = "TestRuleDuplicate", triggers = [ GenericCronTrigger("0 0 0 * * ?") ])
+    def test(module, input):
+        pass
+except Exception:
+    failed = True
+assert failed
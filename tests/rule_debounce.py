@@ -0,0 +1,77 @@
+from openhab import rule
+
+from java.util import HashMap
+
+import time
+
+class Event:
+    def __init__(self, item_name, state):
+        self.item_name = item_name
+        self.state = state
+
+    def getType(self):
+        return "ItemStateChangedEvent"
+
+    def getItemName(self):
+        return self.item_name
+
+results = []
+def test(module, input):
+    results.append(input)
+
+def dispatch(proxy, item_name, state):
+    proxy._dispatch("TestRuleDebounce", test, True, {}, {'event': Event(item_name, state)})
+
+# Check coalesce mode 'last'
+proxy = rule(debounce = 0.2, runtime_measurement = False)
+proxy._rule_name = "TestRuleDebounce"
+for i in range(5):
+    dispatch(proxy, "Item1", i)
+dispatch(proxy, "Item2", 10)
+assert results == []
+time.sleep(0.5)
+assert len(results) == 2
+assert sorted(input['event'].state for input in results) == [4, 10]
+
+# Check coalesce mode 'all'
+results.clear()
+proxy = rule(debounce = 0.2, coalesce = "all", runtime_measurement = False)
+proxy._rule_name = "TestRuleDebounce"
+for i in range(5):
+    dispatch(proxy, "Item1", i)
+time.sleep(0.5)
+assert len(results) == 1
+assert results[0]['event'].state == 4
+assert [event.state for event in results[0]['events']] == [0, 1, 2, 3, 4]
+
+# Check a reused input map, like the one of the rule engine
+results.clear()
+proxy = rule(debounce = 0.2, coalesce = "all", runtime_measurement = False)
+proxy._rule_name = "TestRuleDebounce"
+input = HashMap()
+for item_name, state in [("Item1", 1), ("Item2", 2), ("Item1", 3)]:
+    input.clear()
+    input.put('event', Event(item_name, state))
+    proxy._dispatch("TestRuleDebounce", test, True, {}, input)
+input.clear()
+time.sleep(0.5)
+assert len(results) == 2
+results.sort(key = lambda input: input['event'].getItemName())
+assert results[0]['event'].state == 3
+assert [event.state for event in results[0]['events']] == [1, 3]
+assert results[1]['event'].state == 2
+assert [event.state for event in results[1]['events']] == [2]
+
+# Check cancelled windows
+results.clear()
+dispatch(proxy, "Item1", 1)
+proxy._cancelDebounceWindows()
+time.sleep(0.5)
+assert results == []
+
+# Invalid parameter
+try:
+    rule(coalesce = "first")
+    assert False
+except ValueError as e:
+    assert str(e) == "Unsupported coalesce mode 'first'"
@@ -0,0 +1,102 @@
+from openhab import RuleExecutor, rule
+
+from java.util import HashMap
+
+import threading
+import time
+
+class Event:
+    def __init__(self, item_name, state):
+        self.item_name = item_name
+        self.state = state
+
+    def getType(self):
+        return "ItemStateChangedEvent"
+
+    def getItemName(self):
+        return self.item_name
+
+executor = RuleExecutor(max_workers = 3, max_queue_size = 5)
+
+results = {}
+lock = threading.Lock()
+
+def task(key, value):
+    time.sleep(0.01)
+    with lock:
+        results.setdefault(key, []).append(value)
+
+for i in range(20):
+    executor.submit(i % 4, task, i % 4, i)
+
+time.sleep(1)
+
+# Check per key ordering
+for key, values in results.items():
+    assert values == sorted(values)
+assert sum(len(values) for values in results.values()) == 20
+
+# Check stats
+stats = executor.getStats()
+assert stats['submitted'] == 20
+assert stats['executed'] == 20
+assert stats['queue_size'] == 0
+assert stats['workers'] <= 3
+assert stats['max_queue_size_seen'] <= 5
+
+# Check shutdown
+executor.shutdown()
+try:
+    executor.submit(1, task, 1, 1)
+    assert False
+except RuntimeError as e:
+    assert str(e) == "Executor is already shut down"
+
+# Check shutdown while a task is running
+errors = []
+excepthook = threading.excepthook
+threading.excepthook = lambda args: errors.append(args.exc_value)
+
+executor = RuleExecutor(max_workers = 1)
+started = threading.Event()
+def slowTask():
+    started.set()
+    time.sleep(0.2)
+
+executor.submit("a", slowTask)
+executor.submit("a", slowTask)
+started.wait(1)
+executor.shutdown()
+time.sleep(0.3)
+threading.excepthook = excepthook
+assert errors == []
+stats = executor.getStats()
+assert stats['executed'] == 1
+assert stats['active_workers'] == 0
+assert not any(worker.is_alive() for worker in executor._workers)
+
+# Check a reused input map, like the one of the rule engine
+executor = RuleExecutor(max_workers = 1)
+received = []
+def test(module, input):
+    time.sleep(0.05)
+    received.append((input['event'].getItemName(), input['event'].state))
+
+proxy = rule(executor = executor, runtime_measurement = False)
+proxy._rule_name = "TestRuleExecutor"
+input = HashMap()
+for item_name, state in [("Item1", 1), ("Item2", 2), ("Item1", 3)]:
+    input.clear()
+    input.put('event', Event(item_name, state))
+    proxy._dispatch("TestRuleExecutor", test, True, {}, input)
+input.clear()
+time.sleep(0.5)
+executor.shutdown()
+assert sorted(received) == [("Item1", 1), ("Item1", 3), ("Item2", 2)]
+
+# Invalid parameter
+try:
+    RuleExecutor(max_workers = 0)
+    assert False
+except ValueError as e:
+    assert str(e) == "max_workers must be greater than 0"
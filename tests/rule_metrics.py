@@ -0,0 +1,38 @@
+from openhab import RuleMetrics
+
+RuleMetrics.reset()
+
+for i in range(100):
+    RuleMetrics.record("TestRule", ("Item", "TestItem{}".format(i % 2)), ( i + 1 ) / 1000, i % 10 == 0)
+
+stats = RuleMetrics.getStats("TestRule")["TestRule"]
+assert stats['count'] == 100
+assert stats['errors'] == 10
+assert stats['error_rate'] == 0.1
+assert round(stats['p50']) == 51
+assert round(stats['p95']) == 95
+assert round(stats['p99']) == 99
+assert round(stats['max']) == 100
+
+event_stats = RuleMetrics.getEventStats("TestRule")
+assert sorted(event_stats.keys()) == ["Item: TestItem0", "Item: TestItem1"]
+assert event_stats["Item: TestItem0"]['count'] == 50
+
+# Check limit of per event statistics
+for i in range(RuleMetrics.max_events + 10):
+    RuleMetrics.record("TestRuleGroup", ("Item", "TestItem{}".format(i)), 0.001)
+assert len(RuleMetrics.getEventStats("TestRuleGroup")) == RuleMetrics.max_events
+assert RuleMetrics.getStats("TestRuleGroup")["TestRuleGroup"]['count'] == RuleMetrics.max_events + 10
+
+# Check export restart and stop
+RuleMetrics.startExport(interval = 0.05, log = False)
+RuleMetrics.startExport(interval = 0.05, log = False)
+RuleMetrics.stopExport()
+assert RuleMetrics._export_timer is None
+
+# Unknown rule
+assert RuleMetrics.getStats("Unknown") == {}
+assert RuleMetrics.getEventStats("Unknown") == {}
+
+RuleMetrics.reset()
+assert RuleMetrics.getStats() == {}
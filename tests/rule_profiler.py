@@ -0,0 +1,61 @@
+from openhab import RuleProfiler
+
+import os
+import pstats
+import tempfile
+
+def work(module, input):
+    return sum(i * i for i in range(1000))
+
+for format in ["pstats", "collapsed"]:
+    output_dir = tempfile.mkdtemp()
+    profiler = RuleProfiler(sample_rate = 1, format = format, output_dir = output_dir)
+
+    # Check sampling
+    for i in range(3):
+        assert profiler.run("TestRule", work, {}, {}) == 332833500
+    assert profiler.getSamples() == {"TestRule": 3}
+
+    # Check report
+    report = profiler.getReport("TestRule")
+    assert "work" in report
+
+    # Check dump
+    files = profiler.dump()
+    assert files == [os.path.join(output_dir, "TestRule.{}".format(format))]
+    if format == "pstats":
+        assert pstats.Stats(files[0]).total_calls > 0
+    else:
+        with open(files[0]) as f:
+            lines = f.read().splitlines()
+        assert len(lines) > 0
+        for line in lines:
+            path, duration = line.rsplit(" ", 1)
+            assert int(duration) >= 0
+
+    profiler.reset()
+    assert profiler.getSamples() == {}
+
+# Check sample rate
+profiler = RuleProfiler(sample_rate = 0.01)
+for i in range(100):
+    profiler.run("TestRule", work, {}, {})
+assert profiler.getSamples().get("TestRule", 0) < 20
+
+# Check interval dump
+profiler = RuleProfiler(sample_rate = 1, output_dir = tempfile.mkdtemp(), interval = 60)
+profiler.stop()
+assert profiler._dump_timer is None
+
+# Invalid parameter
+try:
+    RuleProfiler(sample_rate = 0)
+    assert False
+except ValueError as e:
+    assert str(e) == "sample_rate must be between 0 and 1"
+
+try:
+    RuleProfiler(format = "svg")
+    assert False
+except ValueError as e:
+    assert str(e) == "Unsupported profiler format 'svg'"
@@ -0,0 +1,36 @@
+from openhab import RuleMetrics
+from openhab.triggers import PythonCondition
+
+class Event:
+    def __init__(self, value):
+        self.value = value
+
+# Check callable with event
+condition = PythonCondition(lambda event: event.value > 10)
+assert condition.check({'event': Event(20)}) == True
+assert condition.check({'event': Event(5)}) == False
+assert condition.getStats() == {"evaluated": 2, "rejected": 1}
+assert condition.raw_condition is None
+
+# Check callable with event and input
+condition = PythonCondition(lambda event, input: event is None and input['value'] == 1)
+assert condition.check({'value': 1}) == True
+
+# Check compiled expression
+condition = PythonCondition("event.value > 10 and input['event'] is event")
+assert condition.check({'event': Event(20)}) == True
+assert condition.check({'event': Event(5)}) == False
+
+# Check invalid parameter
+try:
+    PythonCondition(5)
+    assert False
+except ValueError:
+    pass
+
+# Check rejected counter
+RuleMetrics.reset()
+RuleMetrics.recordRejected("TestRule", ("Item", "TestItem"))
+assert RuleMetrics.getStats("TestRule")["TestRule"]['rejected'] == 1
+assert RuleMetrics.getEventStats("TestRule")["Item: TestItem"]['rejected'] == 1
+RuleMetrics.reset()
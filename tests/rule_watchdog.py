@@ -0,0 +1,99 @@
+import time
+
+from openhab import CircuitBreaker, RuleWatchdog, RuleExecutor
+
+from java.lang import Thread as Java_Thread
+
+# Check circuit breaker state machine
+breaker = CircuitBreaker(failures = 2, backoff = 0.2)
+assert breaker.allow("TestRule")
+breaker.record("TestRule", False)
+assert breaker.getState("TestRule")['state'] == 'closed'
+breaker.record("TestRule", False)
+assert breaker.getState("TestRule")['state'] == 'open'
+assert not breaker.allow("TestRule")
+assert breaker.getState("TestRule")['skipped'] == 1
+
+# Check half open trial and back-off doubling
+time.sleep(0.3)
+assert breaker.allow("TestRule")
+assert not breaker.allow("TestRule")
+breaker.record("TestRule", False)
+assert breaker.getState("TestRule")['state'] == 'open'
+assert breaker.getState("TestRule")['backoff'] == 0.4
+
+# Check a half open trial, which could not be started
+time.sleep(0.5)
+assert breaker.allow("TestRule")
+breaker.release("TestRule")
+assert breaker.allow("TestRule")
+assert breaker.getState("TestRule")['state'] == 'half_open'
+
+breaker.reset("TestRule")
+assert breaker.allow("TestRule")
+breaker.record("TestRule", True)
+assert breaker.getState("TestRule")['state'] == 'closed'
+
+# Check a hard budget violation during a half open trial
+breaker = CircuitBreaker(failures = 5, backoff = 0.2)
+assert breaker.allow("TestRule")
+breaker.trip("TestRule")
+breaker.record("TestRule", False)
+assert breaker.getState("TestRule")['opened'] == 1
+time.sleep(0.3)
+assert breaker.allow("TestRule")
+breaker.trip("TestRule")
+breaker.record("TestRule", False)
+state = breaker.getState("TestRule")
+assert state['state'] == 'open'
+assert state['opened'] == 2
+assert state['backoff'] == 0.4
+time.sleep(0.5)
+assert breaker.allow("TestRule")
+breaker.record("TestRule", True)
+assert breaker.getState("TestRule")['state'] == 'closed'
+
+# Check soft budget violation
+execution = RuleWatchdog._start("TestWatchdogRule", 0.1, None)
+time.sleep(0.3)
+assert RuleWatchdog._stop(execution)
+state = RuleWatchdog.getState("TestWatchdogRule")["TestWatchdogRule"]
+assert state['overruns'] == 1
+assert state['timeouts'] == 0
+assert state['running'] == []
+
+execution = RuleWatchdog._start("TestWatchdogRule", 1, None)
+assert not RuleWatchdog._stop(execution)
+
+RuleWatchdog.reset("TestWatchdogRule")
+assert RuleWatchdog.getState("TestWatchdogRule") == {}
+
+# Check hard budget violation on a thread, which is not owned by an executor
+breaker = CircuitBreaker(failures = 5, backoff = 1)
+RuleWatchdog._breakers["TestWatchdogRule"] = breaker
+execution = RuleWatchdog._start("TestWatchdogRule", None, 0.1)
+time.sleep(0.3)
+assert not execution.interrupted
+assert breaker.getState("TestWatchdogRule")['state'] == 'open'
+assert RuleWatchdog._stop(execution)
+assert RuleWatchdog.getState("TestWatchdogRule")["TestWatchdogRule"]['timeouts'] == 1
+
+# Check hard budget violation on an executor thread
+results = []
+def task():
+    execution = RuleWatchdog._start("TestWatchdogRule", None, 0.1)
+    try:
+        Java_Thread.sleep(1000)
+        results.append("finished")
+    except Exception:
+        results.append("interrupted")
+    results.append(RuleWatchdog._stop(execution))
+
+executor = RuleExecutor(max_workers = 1)
+executor.submit("TestWatchdogRule", task)
+time.sleep(0.5)
+executor.shutdown()
+assert results == ["interrupted", True]
+
+del RuleWatchdog._breakers["TestWatchdogRule"]
+RuleWatchdog.reset("TestWatchdogRule")
@@ -0,0 +1,50 @@
+from openhab.triggers import EventFilter, ItemEventTrigger
+
+from org.openhab.core.items.events import ItemEventFactory
+from org.openhab.core.thing.events import ThingEventFactory
+from org.openhab.core.thing import ThingUID, ThingStatusInfo, ThingStatus, ThingStatusDetail
+from org.openhab.core.library.types import DecimalType, StringType
+
+def changed(old_state, state):
+    return ItemEventFactory.createStateChangedEvent("TestItem", state, old_state)
+
+def updated(state):
+    return ItemEventFactory.createStateUpdatedEvent("TestItem", state)
+
+# Check delta
+predicate = EventFilter.delta(0.5)
+assert predicate(changed(DecimalType(1.0), DecimalType(1.2))) == False
+assert predicate(changed(DecimalType(1.0), DecimalType(1.6))) == True
+predicate = EventFilter.delta(0.5)
+assert predicate(updated(DecimalType(1.0))) == True
+assert predicate(updated(DecimalType(1.3))) == False
+assert predicate(updated(DecimalType(1.6))) == True
+
+# Check slow drift
+predicate = EventFilter.delta(0.5)
+accepted = [predicate(changed(DecimalType(i / 10), DecimalType((i + 1) / 10))) for i in range(50)]
+assert accepted.count(True) >= 8
+assert accepted[:5] == [False] * 5
+
+# Check state regex
+predicate = EventFilter.stateMatches(r"ERROR.*")
+assert predicate(updated(StringType("ERROR 12"))) == True
+assert predicate(updated(StringType("OK"))) == False
+
+# Check status transition
+online = ThingStatusInfo(ThingStatus.ONLINE, ThingStatusDetail.NONE, None)
+offline = ThingStatusInfo(ThingStatus.OFFLINE, ThingStatusDetail.COMMUNICATION_ERROR, None)
+event = ThingEventFactory.createStatusInfoChangedEvent(ThingUID("test:test:test"), offline, online)
+assert EventFilter.statusTransition(from_status = "online", to_status = "offline")(event) == True
+assert EventFilter.statusTransition(to_status = "OFFLINE", detail = "COMMUNICATION_ERROR")(event) == True
+assert EventFilter.statusTransition(to_status = "ONLINE")(event) == False
+
+# Check combined filters
+assert EventFilter.all(EventFilter.stateMatches(r"\d+"), lambda event: True)(updated(DecimalType(5))) == True
+assert EventFilter.any(EventFilter.stateMatches(r"x"), lambda event: False)(updated(DecimalType(5))) == False
+
+# Check trigger counters
+trigger = ItemEventTrigger("ItemStateChangedEvent", "TestItem", filter = EventFilter.delta(0.5))
+trigger.filter(changed(DecimalType(1.0), DecimalType(1.2)))
+trigger.filter(changed(DecimalType(1.0), DecimalType(2.0)))
+assert trigger.filter.getStats() == {"accepted": 1, "rejected": 1}
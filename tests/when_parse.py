@@ -0,0 +1,42 @@
+from openhab.triggers import when, onlyif, _ParseCache, ItemStateChangeTrigger, GenericCronTrigger, ItemStateCondition
+
+# Check results
+assert isinstance(when.parse("Item Test_Switch_1 changed from ON to OFF"), ItemStateChangeTrigger)
+assert isinstance(when.parse("Time is midnight"), GenericCronTrigger)
+assert isinstance(onlyif.parse("Item Test_Switch_1 equals ON"), ItemStateCondition)
+
+# Check unique trigger ids of cached specs
+triggers = when.compile(["Item Test_Switch_1 changed"] * 3)
+assert len(set(trigger.raw_trigger.getId() for trigger in triggers)) == 3
+
+# Check unknown strings
+try:
+    when.parse("Unknown trigger")
+    assert False
+except ValueError as e:
+    assert str(e) == "Could not parse Unknown trigger: 'Unknown trigger'"
+
+# Check cache hits
+targets = [
+    "Item Test_String_1 changed from 'old test string' to 'new test string'",
+    "Member of gTest_Contact_Sensors changed from ON to OFF",
+    "Item Test_Switch_2 received command OFF",
+    "Thing hue:device:default:lamp1 changed from ONLINE to OFFLINE",
+    "Time cron 55 55 5 * * ?",
+    "Item updated"
+]
+
+_ParseCache.clear()
+stats = _ParseCache.getStats()
+uncached = when.compile(targets)
+assert _ParseCache.getStats()['misses'] == stats['misses'] + len(targets)
+assert _ParseCache.getStats()['size'] == len(targets)
+cached = when.compile(targets)
+assert _ParseCache.getStats()['hits'] == stats['hits'] + len(targets)
+assert _ParseCache.getStats()['misses'] == stats['misses'] + len(targets)
+
+# Check cached results are the same
+for trigger, cached_trigger in zip(uncached, cached):
+    assert type(trigger) == type(cached_trigger)
+    assert trigger.raw_trigger.getTypeUID() == cached_trigger.raw_trigger.getTypeUID()
+    assert trigger.raw_trigger.getConfiguration().equals(cached_trigger.raw_trigger.getConfiguration())